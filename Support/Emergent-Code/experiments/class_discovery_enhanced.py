@@ -22,6 +22,8 @@ sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
 from harmonizer_integration import HARMONIZER_AVAILABLE
+from composition_search import SubsetSearch
+from harmonizer_cache import CachedHarmonizer
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -369,7 +371,18 @@ class EnhancedCompositionRules:
         4. Harmony boosts
         """
         # Base: Aggregate method profiles
-        L, J, P, W = self._aggregate_methods(structure.methods)
+        return self.apply_structure(self._aggregate_methods(structure.methods), structure)
+
+    def apply_structure(
+        self, base: Tuple[float, float, float, float], structure: ClassStructure
+    ) -> LJPWProfile:
+        """
+        Apply structural bonuses and harmony effects to an aggregated base profile.
+
+        Bonuses only add and cap at 1.0, so the result is monotone
+        non-decreasing in every base coordinate (used by branch-and-bound search).
+        """
+        L, J, P, W = base
 
         # Structural bonuses
         if structure.has_state:
@@ -491,6 +504,8 @@ class ClassDiscoveryEngine:
         max_methods: int = 6,
         allow_structural_features: bool = True,
         top_k: int = 5,
+        exhaustive: bool = False,
+        workers: int = 1,
     ) -> List[Tuple[ClassStructure, LJPWProfile, float]]:
         """
         Search for class structures that match target profile.
@@ -509,6 +524,11 @@ class ClassDiscoveryEngine:
         print(f"  Method range: {min_methods}-{max_methods}")
         print(f"  Structural features: {'enabled' if allow_structural_features else 'disabled'}")
 
+        if not exhaustive and self._can_bound(min_methods):
+            return self._branch_and_bound_search(
+                target_profile, range(min_methods, max_methods + 1), allow_structural_features, top_k, workers
+            )
+
         candidates = []
 
         # Generate method combinations
@@ -535,6 +555,40 @@ class ClassDiscoveryEngine:
 
         return candidates[:top_k]
 
+    def _can_bound(self, min_size: int) -> bool:
+        """Bounds need a profile for every candidate and non-empty compositions."""
+        profiles = self.rule_engine.method_profiles
+        return min_size >= 1 and all(name in profiles for name in self.available_methods)
+
+    def _basic_variants(self, method_list: List[str]) -> List[ClassStructure]:
+        """Single featureless structure (structural features disabled)."""
+        return [ClassStructure(methods=method_list)]
+
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        sizes: range,
+        allow_structural_features: bool,
+        top_k: int,
+        workers: int,
+    ) -> List[Tuple[ClassStructure, LJPWProfile, float]]:
+        """Exact top-k via admissible distance bounds (see composition_search)."""
+        variants = self._generate_structural_variants if allow_structural_features else self._basic_variants
+        engine = SubsetSearch(
+            self.available_methods, self.rule_engine.method_profiles, variants, self.rule_engine.apply_structure
+        )
+        best, scored = engine.search(target_profile, sizes, top_k, workers)
+        print(f"  Scored {scored} of {engine.space_size(sizes)} candidate structures "
+              f"(branch and bound)")
+        print(f"  Returning top {top_k}")
+
+        results = []
+        for _, (size, indices, variant) in best:
+            structure = variants([self.available_methods[i] for i in indices])[variant]
+            predicted = self.rule_engine.predict_profile(structure)
+            results.append((structure, predicted, predicted.distance_to(target_profile)))
+        return results
+
     def _generate_structural_variants(self, methods: List[str]) -> List[ClassStructure]:
         """
         Generate structural feature variants for a method set.
@@ -701,7 +755,7 @@ def run_enhanced_experiments():
     print("ENHANCED CLASS-LEVEL DISCOVERY EXPERIMENTS")
     print("=" * 80)
 
-    harmonizer = StringHarmonizer(quiet=True)
+    harmonizer = CachedHarmonizer(StringHarmonizer(quiet=True))
     composer = EnhancedClassComposer()
 
     # Analyze method library
@@ -837,6 +891,8 @@ def run_enhanced_experiments():
     else:
         print("\n[Skipping calibration - real harmonizer not available]")
 
+    print(f"\nHarmonizer cache: {harmonizer.stats}")
+
     print("\n" + "=" * 80)
     print("EXPERIMENTS COMPLETE")
     print("=" * 80)
@@ -27,6 +27,8 @@ sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
 from calculator_components import SOURCES
+from composition_search import search_slots
+from harmonizer_cache import CachedHarmonizer
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -114,7 +116,20 @@ class CompositionRuleEngine:
             if recipe.observer
             else None
         )
+        return self.combine_profiles(core_profile, guard_profile, obs_profile)
+
+    @staticmethod
+    def combine_profiles(
+        core_profile: LJPWProfile,
+        guard_profile: Optional[LJPWProfile] = None,
+        obs_profile: Optional[LJPWProfile] = None,
+    ) -> LJPWProfile:
+        """
+        Emergent profile of core + optional guard + optional observer.
 
+        Monotone non-decreasing in every coordinate of every layer, which is
+        what lets the search bound partial recipes.
+        """
         # Start with base from each layer's PRIMARY dimension
         L_base = obs_profile.L if obs_profile else 0.0  # Observer contributes Love
         J_base = guard_profile.J if guard_profile else 0.0  # Guard contributes Justice
@@ -142,7 +157,7 @@ class CompositionRuleEngine:
             J_base = max(J_base, guard_profile.J)  # Justice maintains its strength
 
         # Integration bonus: Multiple layers create emergent Wisdom
-        num_layers = 1 + (1 if recipe.guard else 0) + (1 if recipe.observer else 0)
+        num_layers = 1 + (1 if guard_profile else 0) + (1 if obs_profile else 0)
         if num_layers >= 3:
             # Full composition (core + guard + observer) = high Wisdom from integration
             W_base = min(W_base + 0.3, 1.0)
@@ -150,7 +165,7 @@ class CompositionRuleEngine:
             W_base = min(W_base + 0.15, 1.0)
 
         # When all three layers present, create HARMONY (all dimensions elevated)
-        if recipe.guard and recipe.observer:
+        if guard_profile and obs_profile:
             # This is the "secure" pattern - elevates all dimensions
             harmony_boost = 0.1
             L_base = min(L_base + harmony_boost, 1.0)
@@ -229,10 +244,15 @@ class CompositionSearchEngine:
         guard_components: List[str],
         observer_components: List[str],
         top_k: int = 5,
+        exhaustive: bool = False,
     ) -> List[Tuple[CompositionRecipe, LJPWProfile, float]]:
         """
         Search for compositions that best match the target profile.
 
+        By default uses branch-and-bound over the core/guard/observer slots
+        (see composition_search), which returns exactly the exhaustive top_k
+        while scoring only recipes that can still make the cut.
+
         Returns:
             List of (recipe, predicted_profile, distance) tuples, sorted by distance
         """
@@ -241,6 +261,11 @@ class CompositionSearchEngine:
         print(f"  - Guard candidates: {guard_components}")
         print(f"  - Observer candidates: {observer_components}")
 
+        if not exhaustive:
+            return self._branch_and_bound_search(
+                target_profile, core_components, guard_components, observer_components, top_k
+            )
+
         # Generate all possible recipes
         all_recipes = self.generate_all_recipes(
             core_components, guard_components, observer_components
@@ -259,6 +284,51 @@ class CompositionSearchEngine:
 
         return results[:top_k]
 
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        core_components: List[str],
+        guard_components: List[str],
+        observer_components: List[str],
+        top_k: int,
+    ) -> List[Tuple[CompositionRecipe, LJPWProfile, float]]:
+        """Top-k recipes via admissible per-slot bounds (same order as generate_all_recipes)."""
+        # Shapes in generate_all_recipes order: core, core+guard, core+observer, full
+        shapes = [
+            (False, False, [core_components]),
+            (True, False, [core_components, guard_components]),
+            (False, True, [core_components, observer_components]),
+            (True, True, [core_components, guard_components, observer_components]),
+        ]
+        names = set(core_components) | set(guard_components) | set(observer_components)
+        profiles = {name: self.atomic_profiles.get(name, LJPWProfile(0, 0, 0, 0)) for name in names}
+
+        def combine(shape_index, slot_profiles):
+            has_guard, has_observer, _ = shapes[shape_index]
+            core = slot_profiles[0]
+            guard = slot_profiles[1] if has_guard else None
+            observer = slot_profiles[-1] if has_observer else None
+            return self.rule_engine.combine_profiles(core, guard, observer)
+
+        best, scored = search_slots(
+            target_profile, [slots for _, _, slots in shapes], profiles, combine, top_k
+        )
+        total = sum(math.prod(len(c) for c in slots) for _, _, slots in shapes)
+        print(f"  - Scored {scored} of {total} possible recipes (branch and bound)")
+
+        results = []
+        for _, (shape_index, indices) in best:
+            has_guard, has_observer, slots = shapes[shape_index]
+            chosen = [candidates[i] for candidates, i in zip(slots, indices)]
+            recipe = CompositionRecipe(
+                core=chosen[0],
+                guard=chosen[1] if has_guard else None,
+                observer=chosen[-1] if has_observer else None,
+            )
+            predicted = self.rule_engine.predict_composition_profile(recipe)
+            results.append((recipe, predicted, predicted.distance_to(target_profile)))
+        return results
+
 
 def run_experiment():
     """
@@ -272,7 +342,7 @@ def run_experiment():
     print("EXPERIMENT C: COMPOSITION DISCOVERY")
     print("=" * 80)
 
-    harmonizer = StringHarmonizer(quiet=True)
+    harmonizer = CachedHarmonizer(StringHarmonizer(quiet=True))
 
     # Get atomic components from calculator_components
     atomic_components = SOURCES["functions"]
@@ -393,6 +463,8 @@ def secure_add(a, b):
         print(f"   Predicted: {profile}")
         print(f"   Distance: {distance:.4f}")
 
+    print(f"\nHarmonizer cache: {harmonizer.stats}")
+
     print("\n" + "=" * 80)
     print("EXPERIMENT COMPLETE")
     print("=" * 80)
@@ -0,0 +1,290 @@
+"""
+Branch-and-Bound Composition Search
+
+Shared search engine for the composition discovery experiments (function,
+class, module, package, application and platform levels).
+
+Every level predicts a composition's LJPW profile the same way:
+
+    profile = structure_rules(aggregate(component profiles), structure)
+
+where the aggregate is either the MEAN of the chosen components (Levels 2-6)
+or the profiles of fixed slots (Experiment C: core / guard / observer), and
+the structure rules only ever ADD bonuses, amplify and cap at 1.0. They are
+therefore monotone non-decreasing in every input coordinate.
+
+That gives an admissible lower bound for any partial composition: the
+components still to be chosen can only move the aggregate inside a box
+[lo, hi] (per-dimension sums of the r smallest / largest remaining values),
+so the final profile lies inside [rules(lo), rules(hi)] and its distance to
+the target is at least the distance from the target to that box. Subtrees
+whose bound exceeds the current k-th best distance are pruned, so results
+are exactly the exhaustive top-k without scoring every candidate.
+
+Partial sums are shared along each search path (a sub-composition is
+aggregated once for all of its extensions), and independent (size, variant)
+subproblems can be scored in a process pool.
+"""
+
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from math import comb, sqrt
+from typing import Callable, Dict, List, Sequence, Tuple
+
+DIMENSIONS = ("L", "J", "P", "W")
+
+# Slack for float rounding between bound sums and exact sums
+BOUND_EPSILON = 1e-9
+
+
+def profile_vector(profile) -> Tuple[float, float, float, float]:
+    """(L, J, P, W) of any LJPWProfile-like object."""
+    return (profile.L, profile.J, profile.P, profile.W)
+
+
+def box_distance(target: Sequence[float], lo, hi) -> float:
+    """Euclidean distance from target to the axis-aligned box [lo, hi]."""
+    total = 0.0
+    for t, a, b in zip(target, profile_vector(lo), profile_vector(hi)):
+        if t < a:
+            total += (a - t) ** 2
+        elif t > b:
+            total += (t - b) ** 2
+    return sqrt(total)
+
+
+class TopK:
+    """
+    The k best candidates seen so far, ordered by (distance, key).
+
+    The key is the candidate's position in exhaustive enumeration order, so
+    ties resolve exactly like a stable sort of the exhaustive candidate list.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.items: List[Tuple[float, tuple]] = []
+
+    def offer(self, distance: float, key: tuple):
+        if self.k <= 0:
+            return
+        if len(self.items) < self.k or (distance, key) < self.items[-1]:
+            bisect.insort(self.items, (distance, key))
+            del self.items[self.k:]
+
+    def bound(self) -> float:
+        """Distance a candidate must not exceed to matter (inf until full)."""
+        if len(self.items) < self.k:
+            return float("inf")
+        return self.items[-1][0] + BOUND_EPSILON
+
+
+# ==============================================================================
+# Subset search (Levels 2-6: mean of a k-subset of components)
+# ==============================================================================
+
+
+class SubsetSearch:
+    """
+    Exact top-k search over k-subsets of components and structural variants.
+
+    Args:
+        items: Component names, in the order the exhaustive search enumerates them
+        profiles: Component name -> LJPW profile
+        variants: Component list -> structural variants for that list. The
+            variants may only depend on the NUMBER of components.
+        apply_structure: (aggregated base (L, J, P, W), structure) -> profile.
+            Must be monotone non-decreasing in every base coordinate.
+    """
+
+    def __init__(
+        self,
+        items: List[str],
+        profiles: Dict[str, object],
+        variants: Callable[[List[str]], list],
+        apply_structure: Callable[[Tuple[float, float, float, float], object], object],
+    ):
+        self.items = list(items)
+        self.vectors = [profile_vector(profiles[name]) for name in self.items]
+        self.variants = variants
+        self.apply_structure = apply_structure
+
+        # suffix_lo[i][r] / suffix_hi[i][r]: per-dimension sum of the r smallest /
+        # largest values among items[i:]
+        n = len(self.vectors)
+        self.suffix_lo: List[List[Tuple[float, ...]]] = []
+        self.suffix_hi: List[List[Tuple[float, ...]]] = []
+        for i in range(n + 1):
+            columns = [sorted(v[d] for v in self.vectors[i:]) for d in range(4)]
+            lo, hi = [(0.0,) * 4], [(0.0,) * 4]
+            for r in range(1, n - i + 1):
+                lo.append(tuple(lo[-1][d] + columns[d][r - 1] for d in range(4)))
+                hi.append(tuple(hi[-1][d] + columns[d][-r] for d in range(4)))
+            self.suffix_lo.append(lo)
+            self.suffix_hi.append(hi)
+
+    def space_size(self, sizes: Sequence[int]) -> int:
+        """Number of candidates the exhaustive search would score."""
+        return sum(
+            comb(len(self.items), size) * len(self.variants(self.items[:size]))
+            for size in sizes
+            if size <= len(self.items)
+        )
+
+    def search(
+        self, target, sizes: Sequence[int], top_k: int = 5, workers: int = 1
+    ) -> Tuple[List[Tuple[float, tuple]], int]:
+        """
+        Find the top_k (size, variant, component indices) closest to target.
+
+        Returns:
+            ([(distance, (size, combo_indices, variant_index)), ...], candidates scored)
+        """
+        tasks = []
+        for size in sizes:
+            if 1 <= size <= len(self.items):
+                for v in range(len(self.variants(self.items[:size]))):
+                    tasks.append((size, v))
+
+        best = TopK(top_k)
+        scored = 0
+        if workers > 1 and len(tasks) > 1:
+            # Independent subproblems, each with its own incumbent
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = pool.map(self._search_task, [(target, t, top_k) for t in tasks])
+                for items, count in parts:
+                    scored += count
+                    for distance, key in items:
+                        best.offer(distance, key)
+        else:
+            # Serial: one shared incumbent, so later subproblems prune harder
+            for task in tasks:
+                scored += self._search_task((target, task, best))[1]
+        return best.items, scored
+
+    def _search_task(self, args) -> Tuple[List[Tuple[float, tuple]], int]:
+        """Branch and bound for one (size, variant) subproblem."""
+        target, (size, v), best = args
+        if not isinstance(best, TopK):
+            best = TopK(best)
+        structure = self.variants(self.items[:size])[v]
+        target_vec = profile_vector(target)
+        scored = 0
+        n_items = len(self.items)
+
+        def expand(start: int, chosen: List[int], sums: Tuple[float, ...]):
+            nonlocal scored
+            remaining = size - len(chosen) - 1  # still to pick after the child
+            children = []
+            for j in range(start, n_items - remaining):
+                vec = self.vectors[j]
+                child_sums = tuple(s + x for s, x in zip(sums, vec))
+                if remaining == 0:
+                    # Leaf: exact prediction (same summation order as _aggregate)
+                    profile = self.apply_structure(tuple(s / size for s in child_sums), structure)
+                    scored += 1
+                    key = (size, tuple(chosen) + (j,), v)
+                    best.offer(profile.distance_to(target), key)
+                    continue
+
+                lo_sum, hi_sum = self.suffix_lo[j + 1][remaining], self.suffix_hi[j + 1][remaining]
+                lo = self.apply_structure(
+                    tuple((s + a) / size for s, a in zip(child_sums, lo_sum)), structure
+                )
+                hi = self.apply_structure(
+                    tuple((s + b) / size for s, b in zip(child_sums, hi_sum)), structure
+                )
+                lower = box_distance(target_vec, lo, hi)
+                if lower <= best.bound():
+                    children.append((lower, j, child_sums))
+
+            # Most promising subtrees first tightens the bound fastest
+            children.sort(key=lambda c: c[0])
+            for lower, j, child_sums in children:
+                if lower > best.bound():
+                    break
+                expand(j + 1, chosen + [j], child_sums)
+
+        expand(0, [], (0.0, 0.0, 0.0, 0.0))
+        return best.items, scored
+
+
+# ==============================================================================
+# Slot search (Experiment C: one component per named slot)
+# ==============================================================================
+
+
+def search_slots(
+    target,
+    shapes: List[List[List[str]]],
+    profiles: Dict[str, object],
+    combine: Callable[[list], object],
+    top_k: int = 5,
+) -> Tuple[List[Tuple[float, tuple]], int]:
+    """
+    Exact top-k search over slot assignments (e.g. core x guard x observer).
+
+    Args:
+        shapes: Recipe shapes in enumeration order; each shape is a list of
+            candidate lists, one per slot used by that shape
+        profiles: Component name -> LJPW profile
+        combine: (shape index, per-slot profiles) -> predicted profile.
+            Must be monotone non-decreasing in every slot's coordinates.
+
+    Returns:
+        ([(distance, (shape_index, slot_indices)), ...], candidates scored)
+    """
+    target_vec = profile_vector(target)
+    best = TopK(top_k)
+    scored = 0
+
+    for shape_index, slots in enumerate(shapes):
+        if any(not candidates for candidates in slots):
+            continue
+        slot_profiles = [[profiles[name] for name in candidates] for candidates in slots]
+        # Per-slot bounding boxes for slots not yet assigned
+        boxes = [
+            (
+                _Profile(*(min(vals) for vals in zip(*map(profile_vector, ps)))),
+                _Profile(*(max(vals) for vals in zip(*map(profile_vector, ps)))),
+            )
+            for ps in slot_profiles
+        ]
+
+        def expand(chosen: List[int]):
+            nonlocal scored
+            depth = len(chosen)
+            fixed = [slot_profiles[s][i] for s, i in enumerate(chosen)]
+            if depth == len(slots):
+                profile = combine(shape_index, fixed)
+                scored += 1
+                best.offer(profile.distance_to(target), (shape_index, tuple(chosen)))
+                return
+
+            children = []
+            for i, profile in enumerate(slot_profiles[depth]):
+                rest = boxes[depth + 1:]
+                lo = combine(shape_index, fixed + [profile] + [b[0] for b in rest])
+                hi = combine(shape_index, fixed + [profile] + [b[1] for b in rest])
+                lower = box_distance(target_vec, lo, hi)
+                if lower <= best.bound():
+                    children.append((lower, i))
+
+            children.sort()
+            for lower, i in children:
+                if lower > best.bound():
+                    break
+                expand(chosen + [i])
+
+        expand([])
+
+    return best.items, scored
+
+
+class _Profile:
+    """Minimal LJPW profile for bounding boxes."""
+
+    __slots__ = DIMENSIONS
+
+    def __init__(self, L: float, J: float, P: float, W: float):
+        self.L, self.J, self.P, self.W = L, J, P, W
@@ -26,6 +26,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
+from harmonizer_cache import CachedHarmonizer
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -314,7 +315,7 @@ def run_level2_experiment():
     print("Testing: Functions → Classes")
     print("=" * 80)
 
-    harmonizer = StringHarmonizer(quiet=True)
+    harmonizer = CachedHarmonizer(StringHarmonizer(quiet=True))
 
     # Step 1: Analyze Level 1 functions (the atoms for this level)
     print("\n[STEP 1] Analyzing Level 1 Functions (Atomic Components for Classes)")
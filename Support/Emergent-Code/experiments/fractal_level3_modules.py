@@ -31,6 +31,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
+from composition_search import SubsetSearch
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -388,7 +389,18 @@ class Level3CompositionRules:
         Model: Module LJPW = Aggregate(class profiles) + Structural bonuses + Harmony
         """
         # Base: Aggregate class profiles
-        L, J, P, W = self._aggregate_classes(structure.classes)
+        return self.apply_structure(self._aggregate_classes(structure.classes), structure)
+
+    def apply_structure(
+        self, base: Tuple[float, float, float, float], structure: ModuleStructure
+    ) -> LJPWProfile:
+        """
+        Apply structural bonuses and harmony effects to an aggregated base profile.
+
+        Bonuses only add and cap at 1.0, so the result is monotone
+        non-decreasing in every base coordinate (used by branch-and-bound search).
+        """
+        L, J, P, W = base
 
         # Module structural bonuses
         if structure.has_module_docstring:
@@ -507,6 +519,8 @@ class ModuleDiscoveryEngine:
         max_classes: int = 4,
         allow_structural_features: bool = True,
         top_k: int = 5,
+        exhaustive: bool = False,
+        workers: int = 1,
     ) -> List[Tuple[ModuleStructure, LJPWProfile, float]]:
         """
         Search for module structures matching target profile.
@@ -516,6 +530,11 @@ class ModuleDiscoveryEngine:
         print(f"  Class range: {min_classes}-{max_classes}")
         print(f"  Structural features: {'enabled' if allow_structural_features else 'disabled'}")
 
+        if not exhaustive and self._can_bound(min_classes):
+            return self._branch_and_bound_search(
+                target_profile, range(min_classes, max_classes + 1), allow_structural_features, top_k, workers
+            )
+
         candidates = []
 
         # Generate class combinations
@@ -542,6 +561,40 @@ class ModuleDiscoveryEngine:
 
         return candidates[:top_k]
 
+    def _can_bound(self, min_size: int) -> bool:
+        """Bounds need a profile for every candidate and non-empty compositions."""
+        profiles = self.rule_engine.class_profiles
+        return min_size >= 1 and all(name in profiles for name in self.available_classes)
+
+    def _basic_variants(self, class_list: List[str]) -> List[ModuleStructure]:
+        """Single featureless structure (structural features disabled)."""
+        return [ModuleStructure(name="BasicModule", classes=class_list)]
+
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        sizes: range,
+        allow_structural_features: bool,
+        top_k: int,
+        workers: int,
+    ) -> List[Tuple[ModuleStructure, LJPWProfile, float]]:
+        """Exact top-k via admissible distance bounds (see composition_search)."""
+        variants = self._generate_structural_variants if allow_structural_features else self._basic_variants
+        engine = SubsetSearch(
+            self.available_classes, self.rule_engine.class_profiles, variants, self.rule_engine.apply_structure
+        )
+        best, scored = engine.search(target_profile, sizes, top_k, workers)
+        print(f"  Scored {scored} of {engine.space_size(sizes)} candidate structures "
+              f"(branch and bound)")
+        print(f"  Returning top {top_k}")
+
+        results = []
+        for _, (size, indices, variant) in best:
+            structure = variants([self.available_classes[i] for i in indices])[variant]
+            predicted = self.rule_engine.predict_profile(structure)
+            results.append((structure, predicted, predicted.distance_to(target_profile)))
+        return results
+
     def _generate_structural_variants(self, classes: List[str]) -> List[ModuleStructure]:
         """Generate reasonable structural feature combinations."""
         variants = []
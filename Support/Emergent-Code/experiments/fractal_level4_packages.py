@@ -42,6 +42,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
+from composition_search import SubsetSearch
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -439,7 +440,18 @@ class Level4CompositionRules:
         Model: Package LJPW = Aggregate(module profiles) + Structural bonuses + Harmony
         """
         # Base: Aggregate module profiles
-        L, J, P, W = self._aggregate_modules(structure.modules)
+        return self.apply_structure(self._aggregate_modules(structure.modules), structure)
+
+    def apply_structure(
+        self, base: Tuple[float, float, float, float], structure: PackageStructure
+    ) -> LJPWProfile:
+        """
+        Apply structural bonuses and harmony effects to an aggregated base profile.
+
+        Bonuses only add and cap at 1.0, so the result is monotone
+        non-decreasing in every base coordinate (used by branch-and-bound search).
+        """
+        L, J, P, W = base
 
         # Package structural bonuses
         if structure.has_init:
@@ -595,6 +607,8 @@ class PackageDiscoveryEngine:
         max_modules: int = 4,
         allow_structural_features: bool = True,
         top_k: int = 5,
+        exhaustive: bool = False,
+        workers: int = 1,
     ) -> List[Tuple[PackageStructure, LJPWProfile, float]]:
         """
         Search for package structures matching target profile.
@@ -604,6 +618,11 @@ class PackageDiscoveryEngine:
         print(f"  Module range: {min_modules}-{max_modules}")
         print(f"  Structural features: {'enabled' if allow_structural_features else 'disabled'}")
 
+        if not exhaustive and self._can_bound(min_modules):
+            return self._branch_and_bound_search(
+                target_profile, range(min_modules, max_modules + 1), allow_structural_features, top_k, workers
+            )
+
         candidates = []
 
         # Generate module combinations
@@ -630,6 +649,40 @@ class PackageDiscoveryEngine:
 
         return candidates[:top_k]
 
+    def _can_bound(self, min_size: int) -> bool:
+        """Bounds need a profile for every candidate and non-empty compositions."""
+        profiles = self.rule_engine.module_profiles
+        return min_size >= 1 and all(name in profiles for name in self.available_modules)
+
+    def _basic_variants(self, module_list: List[str]) -> List[PackageStructure]:
+        """Single featureless structure (structural features disabled)."""
+        return [PackageStructure(name="basic_package", modules=module_list)]
+
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        sizes: range,
+        allow_structural_features: bool,
+        top_k: int,
+        workers: int,
+    ) -> List[Tuple[PackageStructure, LJPWProfile, float]]:
+        """Exact top-k via admissible distance bounds (see composition_search)."""
+        variants = self._generate_structural_variants if allow_structural_features else self._basic_variants
+        engine = SubsetSearch(
+            self.available_modules, self.rule_engine.module_profiles, variants, self.rule_engine.apply_structure
+        )
+        best, scored = engine.search(target_profile, sizes, top_k, workers)
+        print(f"  Scored {scored} of {engine.space_size(sizes)} candidate structures "
+              f"(branch and bound)")
+        print(f"  Returning top {top_k}")
+
+        results = []
+        for _, (size, indices, variant) in best:
+            structure = variants([self.available_modules[i] for i in indices])[variant]
+            predicted = self.rule_engine.predict_profile(structure)
+            results.append((structure, predicted, predicted.distance_to(target_profile)))
+        return results
+
     def _generate_structural_variants(self, modules: List[str]) -> List[PackageStructure]:
         """Generate reasonable structural feature combinations for packages."""
         variants = []
@@ -45,6 +45,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # Use unified harmonizer integration
+from composition_search import SubsetSearch
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
 
@@ -687,7 +688,18 @@ class Level5CompositionRules:
         Model: Application LJPW = Aggregate(package profiles) + Infrastructure bonuses + Harmony
         """
         # Base: Aggregate package profiles
-        L, J, P, W = self._aggregate_packages(structure.packages)
+        return self.apply_structure(self._aggregate_packages(structure.packages), structure)
+
+    def apply_structure(
+        self, base: Tuple[float, float, float, float], structure: ApplicationStructure
+    ) -> LJPWProfile:
+        """
+        Apply structural bonuses and harmony effects to an aggregated base profile.
+
+        Bonuses only add and cap at 1.0, so the result is monotone
+        non-decreasing in every base coordinate (used by branch-and-bound search).
+        """
+        L, J, P, W = base
 
         # Infrastructure bonuses
         if structure.has_docker:
@@ -875,6 +887,8 @@ class ApplicationDiscoveryEngine:
         max_packages: int = 5,
         allow_infrastructure: bool = True,
         top_k: int = 5,
+        exhaustive: bool = False,
+        workers: int = 1,
     ) -> List[Tuple[ApplicationStructure, LJPWProfile, float]]:
         """
         Search for application structures matching target profile.
@@ -884,6 +898,11 @@ class ApplicationDiscoveryEngine:
         print(f"  Package range: {min_packages}-{max_packages}")
         print(f"  Infrastructure: {'enabled' if allow_infrastructure else 'disabled'}")
 
+        if not exhaustive and self._can_bound(min_packages):
+            return self._branch_and_bound_search(
+                target_profile, range(min_packages, max_packages + 1), allow_infrastructure, top_k, workers
+            )
+
         candidates = []
 
         # Generate package combinations
@@ -910,6 +929,40 @@ class ApplicationDiscoveryEngine:
 
         return candidates[:top_k]
 
+    def _can_bound(self, min_size: int) -> bool:
+        """Bounds need a profile for every candidate and non-empty compositions."""
+        profiles = self.rule_engine.package_profiles
+        return min_size >= 1 and all(name in profiles for name in self.available_packages)
+
+    def _basic_variants(self, package_list: List[str]) -> List[ApplicationStructure]:
+        """Single featureless structure (structural features disabled)."""
+        return [ApplicationStructure(name="basic_app", packages=package_list)]
+
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        sizes: range,
+        allow_infrastructure: bool,
+        top_k: int,
+        workers: int,
+    ) -> List[Tuple[ApplicationStructure, LJPWProfile, float]]:
+        """Exact top-k via admissible distance bounds (see composition_search)."""
+        variants = self._generate_infrastructure_variants if allow_infrastructure else self._basic_variants
+        engine = SubsetSearch(
+            self.available_packages, self.rule_engine.package_profiles, variants, self.rule_engine.apply_structure
+        )
+        best, scored = engine.search(target_profile, sizes, top_k, workers)
+        print(f"  Scored {scored} of {engine.space_size(sizes)} candidate structures "
+              f"(branch and bound)")
+        print(f"  Returning top {top_k}")
+
+        results = []
+        for _, (size, indices, variant) in best:
+            structure = variants([self.available_packages[i] for i in indices])[variant]
+            predicted = self.rule_engine.predict_profile(structure)
+            results.append((structure, predicted, predicted.distance_to(target_profile)))
+        return results
+
     def _generate_infrastructure_variants(self, packages: List[str]) -> List[ApplicationStructure]:
         """Generate reasonable infrastructure combinations."""
         variants = []
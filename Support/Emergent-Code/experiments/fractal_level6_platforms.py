@@ -27,6 +27,8 @@ from typing import Dict, List, Tuple
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from composition_search import SubsetSearch
+
 # Use unified harmonizer integration
 from harmonizer_integration import PythonCodeHarmonizer as StringHarmonizer
 
@@ -166,6 +168,21 @@ class Level6CompositionRules:
             P_base = sum(a.P for a in apps) / len(apps)
             W_base = sum(a.W for a in apps) / len(apps)
 
+        return Level6CompositionRules.apply_structure((L_base, J_base, P_base, W_base), structure)
+
+    @staticmethod
+    def apply_structure(
+        base: Tuple[float, float, float, float], structure: PlatformStructure
+    ) -> LJPWProfile:
+        """
+        Apply platform bonuses, coupling and harmony to an aggregated base profile.
+
+        Bonuses only add, coupling only amplifies above a threshold and the
+        result is capped at 1.0, so it is monotone non-decreasing in every base
+        coordinate (used by branch-and-bound search).
+        """
+        L_base, J_base, P_base, W_base = base
+
         # Step 2: Add structural bonuses (platform-level features)
         L_bonus = 0.0
         J_bonus = 0.0
@@ -367,10 +384,15 @@ class PlatformDiscoveryEngine:
         min_apps: int = 2,
         max_apps: int = 5,
         enable_features: bool = True,
+        exhaustive: bool = False,
+        workers: int = 1,
     ) -> List[Tuple[PlatformStructure, LJPWProfile, float]]:
         """
         Search for platform structures that best match target LJPW profile.
 
+        Uses branch-and-bound (see composition_search) unless exhaustive=True;
+        both return the same top matches.
+
         Returns: List of (structure, predicted_profile, distance) tuples
         """
         print(f"\n[PLATFORM DISCOVERY] Searching for system matching: {target_profile}")
@@ -378,6 +400,11 @@ class PlatformDiscoveryEngine:
         print(f"  Application range: {min_apps}-{max_apps}")
         print(f"  Features: {'enabled' if enable_features else 'disabled'}")
 
+        if not exhaustive and min_apps >= 1:
+            return self._branch_and_bound_search(
+                target_profile, range(min_apps, max_apps + 1), enable_features, workers
+            )
+
         candidates = []
 
         # Generate candidate structures
@@ -407,6 +434,45 @@ class PlatformDiscoveryEngine:
         print("  Returning top 3")
         return candidates[:3]
 
+    def _variants_for(self, app_names: List[str]) -> List[PlatformStructure]:
+        """Platform variants for a set of applications."""
+        variants = self._generate_platform_variants()
+        for variant in variants:
+            variant.applications = list(app_names)
+        return variants
+
+    def _basic_variants(self, app_names: List[str]) -> List[PlatformStructure]:
+        """Single featureless platform (features disabled)."""
+        return [PlatformStructure(list(app_names))]
+
+    def _branch_and_bound_search(
+        self,
+        target_profile: LJPWProfile,
+        sizes: range,
+        enable_features: bool,
+        workers: int,
+    ) -> List[Tuple[PlatformStructure, LJPWProfile, float]]:
+        """Exact top 3 via admissible distance bounds."""
+        names = list(self.available_apps.keys())
+        variants = self._variants_for if enable_features else self._basic_variants
+        engine = SubsetSearch(
+            names, self.available_apps, variants, Level6CompositionRules.apply_structure
+        )
+        best, scored = engine.search(target_profile, sizes, 3, workers)
+        print(f"  Scored {scored} of {engine.space_size(sizes)} candidate structures "
+              f"(branch and bound)")
+        print("  Returning top 3")
+
+        results = []
+        for _, (size, indices, variant) in best:
+            app_names = [names[i] for i in indices]
+            structure = variants(app_names)[variant]
+            predicted = Level6CompositionRules.predict_platform_profile(
+                [self.available_apps[name] for name in app_names], structure
+            )
+            results.append((structure, predicted, predicted.distance_to(target_profile)))
+        return results
+
     def _generate_platform_variants(self) -> List[PlatformStructure]:
         """Generate sensible platform feature combinations."""
         variants = []
@@ -0,0 +1,210 @@
+"""
+Harmonizer Scoring Cache
+
+Content-addressed cache in front of PythonCodeHarmonizer.analyze_file_content.
+
+The composition, fractal-level and refactoring experiments send the same
+component sources through the harmonizer over and over (every experiment
+re-scores the atoms of its level, and every level re-scores the ones below).
+CachedHarmonizer keys each result by a SHA-256 of the source and keeps:
+1. An in-memory LRU of recent results (no re-parse, no unpickling)
+2. A persistent SQLite store shared across runs and processes
+
+Usage:
+    harmonizer = CachedHarmonizer(PythonCodeHarmonizer(quiet=True))
+    report = harmonizer.analyze_file_content(source)
+    print(harmonizer.stats)
+
+Cached results are shared: callers must treat them as read-only. Results are
+namespaced by the harmonizer class and a hash of its module sources, so editing
+the harmonizer invalidates them.
+Set LJPW_HARMONIZER_CACHE to change the store location, or pass
+cache_path=None to keep the cache in memory only.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+# Persistent store location (override with LJPW_HARMONIZER_CACHE)
+DEFAULT_CACHE_PATH = os.environ.get(
+    "LJPW_HARMONIZER_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".harmonizer_cache.sqlite"),
+)
+
+# Results kept in memory per CachedHarmonizer
+MEMORY_CACHE_SIZE = 4096
+
+_DEFAULT = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a CachedHarmonizer."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(memory_hits={self.memory_hits}, disk_hits={self.disk_hits}, "
+            f"misses={self.misses}, hit_rate={self.hit_rate:.1%})"
+        )
+
+
+@lru_cache(maxsize=None)
+def _source_hash(cls: type) -> str:
+    """Hash of the source files of the modules defining cls and its bases ('' if none)."""
+    digest = hashlib.sha256()
+    paths = set()
+    for base in cls.__mro__:
+        path = getattr(sys.modules.get(base.__module__), "__file__", None)
+        if path and path.endswith(".py"):
+            paths.add(os.path.abspath(path))
+    for path in sorted(paths):
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            continue
+    return digest.hexdigest()[:16] if paths else ""
+
+
+class CachedHarmonizer:
+    """
+    Drop-in wrapper for a harmonizer that memoizes analyze_file_content.
+
+    Any other attribute is forwarded to the wrapped harmonizer.
+    """
+
+    def __init__(
+        self,
+        harmonizer: Any,
+        cache_path: Optional[str] = _DEFAULT,
+        memory_size: int = MEMORY_CACHE_SIZE,
+    ):
+        self.harmonizer = harmonizer
+        self.cache_path = DEFAULT_CACHE_PATH if cache_path is _DEFAULT else cache_path
+        self.memory_size = memory_size
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+        # Results from a different harmonizer implementation must not collide
+        cls = type(harmonizer)
+        version = getattr(harmonizer, "__version__", getattr(cls, "__version__", ""))
+        self.namespace = f"{cls.__module__}.{cls.__qualname__}:{version}:{_source_hash(cls)}"
+
+    def __getattr__(self, name):
+        if name == "harmonizer":
+            raise AttributeError(name)
+        return getattr(self.harmonizer, name)
+
+    def cache_key(self, code: str) -> str:
+        """Content address of a source string for this harmonizer."""
+        digest = hashlib.sha256(self.namespace.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(code.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def analyze_file_content(self, code: str):
+        """Harmonizer report for code, scored at most once per distinct source."""
+        key = self.cache_key(code)
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return self._memory[key]
+
+        result = self._disk_get(key)
+        if result is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            result = self.harmonizer.analyze_file_content(code)
+            self._disk_put(key, result)
+
+        self._remember(key, result)
+        return result
+
+    def _remember(self, key: str, result):
+        self._memory[key] = result
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.cache_path is None:
+            return None
+        if self._conn is not None and self._conn_pid != os.getpid():
+            # Forked worker: never share a SQLite connection across processes
+            self._conn = None
+        if self._conn is None:
+            try:
+                self._conn = sqlite3.connect(self.cache_path, timeout=30)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS reports (key TEXT PRIMARY KEY, report BLOB NOT NULL)"
+                )
+                self._conn.commit()
+                self._conn_pid = os.getpid()
+            except sqlite3.Error:
+                # Unwritable location: fall back to memory-only caching
+                self.cache_path = None
+                return None
+        return self._conn
+
+    def _disk_get(self, key: str):
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT report FROM reports WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            # Stale entry (e.g. harmonizer classes changed): re-score it
+            return None
+
+    def _disk_put(self, key: str, result):
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return  # Not picklable: memory cache only
+        try:
+            conn.execute("INSERT OR REPLACE INTO reports VALUES (?, ?)", (key, blob))
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self, disk: bool = False):
+        """Drop the in-memory cache (and the persistent store if disk=True)."""
+        self._memory.clear()
+        conn = self._connection()
+        if disk and conn is not None:
+            conn.execute("DELETE FROM reports")
+            conn.commit()
+
+    def close(self):
+        """Close the persistent store."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,244 @@
+"""
+Single-Pass AST Metric Extraction
+
+Collects everything the automated and enhanced LJPW analyzers need from a
+Python module in ONE traversal of its AST:
+1. Per-function cyclomatic complexity
+2. Imports (coupling and dependency analysis)
+3. Class methods and the self-attributes they touch (cohesion / LCOM)
+4. Node pattern counts (docstrings, comprehensions, nested loops, ...)
+
+Parsed trees are cached by a hash of the source, so scoring the same
+file repeatedly (or from several analyzers) parses it only once.
+
+Usage:
+    tree = parse_cached(code)
+    metrics = collect_metrics(tree)
+    print(metrics.function_complexity, metrics.counts['nested_loops'])
+"""
+
+import ast
+import hashlib
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+
+# Parsed modules kept in memory (keyed by SHA-256 of the source)
+AST_CACHE_SIZE = 1024
+
+_ast_cache: "OrderedDict[str, Optional[ast.Module]]" = OrderedDict()
+
+# Nodes that add a decision point to the enclosing function
+_DECISION_NODES = (ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With, ast.Assert)
+
+
+def source_hash(code: str) -> str:
+    """Content hash used as the cache key."""
+    return hashlib.sha256(code.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def parse_cached(code: str) -> Optional[ast.Module]:
+    """
+    Parse source code, reusing the tree for previously seen content.
+
+    Returns:
+        The module AST, or None if the code has a syntax error
+    """
+    key = source_hash(code)
+    if key in _ast_cache:
+        _ast_cache.move_to_end(key)
+        return _ast_cache[key]
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        tree = None
+
+    _ast_cache[key] = tree
+    if len(_ast_cache) > AST_CACHE_SIZE:
+        _ast_cache.popitem(last=False)
+    return tree
+
+
+def clear_ast_cache():
+    """Drop all cached trees."""
+    _ast_cache.clear()
+
+
+@dataclass
+class CodeMetrics:
+    """Raw facts about a module, collected in one AST traversal."""
+    # Function name -> cyclomatic complexity
+    function_complexity: Dict[str, int] = field(default_factory=dict)
+
+    # Top-level module names from `import x.y` and `from x.y import z`
+    imports: Set[str] = field(default_factory=set)
+    from_imports: Set[str] = field(default_factory=set)
+
+    # Class name -> base class names
+    class_dependencies: Dict[str, Set[str]] = field(default_factory=dict)
+
+    # Class name -> {'methods', 'attributes', 'method_attributes'}
+    classes: Dict[str, Dict] = field(default_factory=dict)
+
+    # Node pattern counts
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+class CodeMetricsVisitor:
+    """
+    Fused visitor: one recursive walk updates every metric.
+
+    Mirrors the separate CyclomaticComplexityAnalyzer, CouplingAnalyzer,
+    CohesionAnalyzer and DependencyAnalyzer passes and both pattern
+    extractors, including their edge cases (e.g. nested functions get their
+    own complexity, attributes in nested scopes count for every enclosing
+    method, only `for` loops count as nested loops).
+    """
+
+    COUNT_KEYS = (
+        'docstrings', 'module_docstring', 'functions', 'returns', 'annotated_args',
+        'names', 'descriptive_names', 'try', 'assert', 'raise', 'if', 'dict',
+        'list_comp', 'dict_comp', 'set_comp', 'generators', 'nested_loops',
+        'classes', 'class_decorators', 'global_names', 'constants', 'magic_numbers',
+    )
+
+    def __init__(self):
+        self.metrics = CodeMetrics(counts=dict.fromkeys(self.COUNT_KEYS, 0))
+        self._complexity = 0
+        self._for_depth = 0
+        # (class record, method name) for every enclosing method being visited
+        self._methods: List[tuple] = []
+
+    def collect(self, tree: ast.AST) -> CodeMetrics:
+        """Walk the tree once and return the collected metrics."""
+        if isinstance(tree, ast.Module) and ast.get_docstring(tree):
+            self.metrics.counts['module_docstring'] = 1
+        self._visit(tree)
+        return self.metrics
+
+    def _visit(self, node: ast.AST):
+        counts = self.metrics.counts
+
+        if isinstance(node, ast.FunctionDef):
+            self._visit_function(node)
+            return
+        if isinstance(node, ast.ClassDef):
+            self._visit_class(node)
+            return
+
+        # Complexity of the enclosing function
+        if isinstance(node, _DECISION_NODES):
+            self._complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            self._complexity += len(node.values) - 1
+
+        if isinstance(node, ast.Name):
+            counts['names'] += 1
+            if len(node.id) > 2 and not node.id.isupper():
+                counts['descriptive_names'] += 1
+        elif isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name) and node.value.id == 'self':
+                for record, method in self._methods:
+                    record['attributes'].add(node.attr)
+                    record['method_attributes'][method].add(node.attr)
+        elif isinstance(node, ast.Constant):
+            value = node.value
+            # Same as the legacy ast.Num check: int/float/complex, not bool
+            if isinstance(value, (int, float, complex)) and not isinstance(value, bool):
+                if value not in (0, 1, -1):
+                    counts['magic_numbers'] += 1
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                self.metrics.imports.add(alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                self.metrics.from_imports.add(node.module.split('.')[0])
+        elif isinstance(node, ast.Try):
+            counts['try'] += 1
+        elif isinstance(node, ast.Assert):
+            counts['assert'] += 1
+        elif isinstance(node, ast.Raise):
+            counts['raise'] += 1
+        elif isinstance(node, ast.If):
+            counts['if'] += 1
+        elif isinstance(node, ast.Dict):
+            counts['dict'] += 1
+        elif isinstance(node, ast.ListComp):
+            counts['list_comp'] += 1
+        elif isinstance(node, ast.DictComp):
+            counts['dict_comp'] += 1
+        elif isinstance(node, ast.SetComp):
+            counts['set_comp'] += 1
+        elif isinstance(node, ast.GeneratorExp):
+            counts['generators'] += 1
+        elif isinstance(node, ast.Global):
+            counts['global_names'] += len(node.names)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id.isupper() and len(target.id) > 1:
+                    counts['constants'] += 1
+
+        if isinstance(node, ast.For):
+            if self._for_depth:
+                counts['nested_loops'] += 1
+            self._for_depth += 1
+            self._visit_children(node)
+            self._for_depth -= 1
+            return
+
+        self._visit_children(node)
+
+    def _visit_children(self, node: ast.AST):
+        for child in ast.iter_child_nodes(node):
+            self._visit(child)
+
+    def _visit_function(self, node: ast.FunctionDef):
+        counts = self.metrics.counts
+        counts['functions'] += 1
+        if ast.get_docstring(node):
+            counts['docstrings'] += 1
+        if node.returns is not None:
+            counts['returns'] += 1
+        counts['annotated_args'] += sum(1 for arg in node.args.args if arg.annotation is not None)
+
+        # A function starts its own complexity count at 1
+        outer_complexity = self._complexity
+        self._complexity = 1
+        self._visit_children(node)
+        self.metrics.function_complexity[node.name] = self._complexity
+        self._complexity = outer_complexity
+
+    def _visit_class(self, node: ast.ClassDef):
+        counts = self.metrics.counts
+        counts['classes'] += 1
+        counts['class_decorators'] += len(node.decorator_list)
+        if ast.get_docstring(node):
+            counts['docstrings'] += 1
+
+        for base in node.bases:
+            if isinstance(base, ast.Name):
+                self.metrics.class_dependencies.setdefault(node.name, set()).add(base.id)
+
+        record = {
+            'methods': [],
+            'attributes': set(),
+            'method_attributes': defaultdict(set)
+        }
+        self.metrics.classes[node.name] = record
+        methods = {id(item) for item in node.body if isinstance(item, ast.FunctionDef)}
+
+        for child in ast.iter_child_nodes(node):
+            if id(child) in methods:
+                record['methods'].append(child.name)
+                self._methods.append((record, child.name))
+                self._visit(child)
+                self._methods.pop()
+            else:
+                self._visit(child)
+
+
+def collect_metrics(tree: ast.AST) -> CodeMetrics:
+    """Collect all metrics from a parsed module in one traversal."""
+    return CodeMetricsVisitor().collect(tree)
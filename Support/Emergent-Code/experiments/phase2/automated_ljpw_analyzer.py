@@ -12,7 +12,6 @@ Usage:
     print(f"Harmony: {result['harmony']:.2f}")
 """
 
-import ast
 import re
 import sys
 import os
@@ -24,6 +23,24 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 from harmonizer_integration import PythonCodeHarmonizer
+from experiments.harmonizer_cache import CachedHarmonizer
+
+# Sibling modules (works both as a script and as experiments.phase2.*)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ast_metrics import CodeMetrics, collect_metrics, parse_cached
+
+
+# Source-level patterns (compiled once)
+LOGGING_PATTERN = re.compile(r'\b(logger\.|logging\.|print\()')
+COMMENT_PATTERN = re.compile(r'#.*$', re.MULTILINE)
+VALIDATION_PATTERNS = [
+    re.compile(r'\bif\s+not\s+\w+'),
+    re.compile(r'\bif\s+\w+\s+is\s+None'),
+    re.compile(r'\bif\s+len\('),
+    re.compile(r'\braise\s+ValueError'),
+    re.compile(r'\braise\s+\w+Error'),
+]
+LINEAR_SEARCH_PATTERN = re.compile(r'for\s+\w+\s+in\s+\w+:\s*\n\s*if\s+')
 
 
 @dataclass
@@ -66,12 +83,11 @@ class ImplementationPatternAnalyzer:
         Returns:
             Dict with L, J, P, W scores (0.0-1.0) and pattern counts
         """
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        tree = parse_cached(code)
+        if tree is None:
             return {'L': 0.0, 'J': 0.0, 'P': 0.0, 'W': 0.0, 'patterns': {}}
 
-        patterns = self._extract_patterns(tree, code)
+        patterns = self._extract_patterns(collect_metrics(tree), code)
         scores = self._calculate_scores(patterns, code)
 
         return {
@@ -82,133 +98,54 @@ class ImplementationPatternAnalyzer:
             'patterns': patterns
         }
 
-    def _extract_patterns(self, tree: ast.AST, code: str) -> Dict[str, int]:
-        """Extract implementation patterns from AST and code."""
+    def _extract_patterns(self, metrics: CodeMetrics, code: str) -> Dict[str, int]:
+        """Extract implementation patterns from single-pass AST metrics and code."""
+        counts = metrics.counts
         patterns = {
             # Love indicators
-            'docstrings': 0,
-            'type_hints': 0,
+            'docstrings': counts['docstrings'] + counts['module_docstring'],
+            'type_hints': counts['returns'] + counts['annotated_args'],
             'logging_calls': 0,
             'comments': 0,
-            'descriptive_names': 0,
-            'total_names': 0,
+            'descriptive_names': counts['descriptive_names'],
+            'total_names': counts['names'],
 
             # Justice indicators
-            'try_except': 0,
-            'assertions': 0,
+            'try_except': counts['try'],
+            'assertions': counts['assert'],
             'validations': 0,
-            'if_checks': 0,
-            'raises': 0,
+            'if_checks': counts['if'],
+            'raises': counts['raise'],
 
             # Power indicators
-            'dict_usage': 0,
-            'list_comprehensions': 0,
-            'generators': 0,
+            'dict_usage': counts['dict'],
+            'list_comprehensions': counts['list_comp'] + counts['dict_comp'] + counts['set_comp'],
+            'generators': counts['generators'],
             'builtin_optimizations': 0,
-            'nested_loops': 0,
+            'nested_loops': counts['nested_loops'],  # for-loops inside for-loops
             'linear_searches': 0,
 
             # Wisdom indicators
-            'classes': 0,
-            'functions': 0,
-            'constants': 0,
-            'global_vars': 0,
-            'magic_numbers': 0,
-            'decorators': 0,
+            'classes': counts['classes'],
+            'functions': counts['functions'],
+            'constants': counts['constants'],  # UPPER_CASE assignments
+            'global_vars': counts['global_names'],
+            'magic_numbers': counts['magic_numbers'],  # numeric literals other than 0/1
+            'decorators': counts['class_decorators'],
         }
 
-        # Walk the AST
-        for node in ast.walk(tree):
-            # Love: Docstrings
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-                if ast.get_docstring(node):
-                    patterns['docstrings'] += 1
-
-            # Love: Type hints
-            if isinstance(node, ast.FunctionDef):
-                patterns['functions'] += 1
-                if node.returns is not None:
-                    patterns['type_hints'] += 1
-                for arg in node.args.args:
-                    if arg.annotation is not None:
-                        patterns['type_hints'] += 1
-
-            # Love: Descriptive names
-            if isinstance(node, ast.Name):
-                patterns['total_names'] += 1
-                if len(node.id) > 2 and not node.id.isupper():
-                    patterns['descriptive_names'] += 1
-
-            # Justice: Error handling
-            if isinstance(node, ast.Try):
-                patterns['try_except'] += 1
-            if isinstance(node, ast.Assert):
-                patterns['assertions'] += 1
-            if isinstance(node, ast.Raise):
-                patterns['raises'] += 1
-            if isinstance(node, ast.If):
-                patterns['if_checks'] += 1
-
-            # Power: Data structures
-            if isinstance(node, ast.Dict):
-                patterns['dict_usage'] += 1
-            if isinstance(node, (ast.ListComp, ast.DictComp, ast.SetComp)):
-                patterns['list_comprehensions'] += 1
-            if isinstance(node, ast.GeneratorExp):
-                patterns['generators'] += 1
-
-            # Power: Nested loops (inefficiency indicator)
-            if isinstance(node, ast.For):
-                # Check if inside another loop
-                for parent in ast.walk(tree):
-                    if isinstance(parent, ast.For) and node in ast.walk(parent):
-                        if parent != node:
-                            patterns['nested_loops'] += 1
-                            break
-
-            # Wisdom: Structure
-            if isinstance(node, ast.ClassDef):
-                patterns['classes'] += 1
-                # Check for decorators
-                if node.decorator_list:
-                    patterns['decorators'] += len(node.decorator_list)
-
-            # Wisdom: Global variables (anti-pattern)
-            if isinstance(node, ast.Global):
-                patterns['global_vars'] += len(node.names)
-
-            # Wisdom: Constants (UPPER_CASE assignments at module level)
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        if target.id.isupper() and len(target.id) > 1:
-                            patterns['constants'] += 1
-
-            # Wisdom: Magic numbers
-            if isinstance(node, ast.Num):
-                if not isinstance(node.n, (bool, type(None))):
-                    if node.n not in (0, 1, -1):  # Common non-magic numbers
-                        patterns['magic_numbers'] += 1
-
         # Love: Logging (pattern matching in code)
-        patterns['logging_calls'] = len(re.findall(r'\b(logger\.|logging\.|print\()', code))
+        patterns['logging_calls'] = len(LOGGING_PATTERN.findall(code))
 
         # Love: Comments
-        patterns['comments'] = len(re.findall(r'#.*$', code, re.MULTILINE))
+        patterns['comments'] = len(COMMENT_PATTERN.findall(code))
 
         # Justice: Validation patterns
-        validation_patterns = [
-            r'\bif\s+not\s+\w+',
-            r'\bif\s+\w+\s+is\s+None',
-            r'\bif\s+len\(',
-            r'\braise\s+ValueError',
-            r'\braise\s+\w+Error',
-        ]
-        for pattern in validation_patterns:
-            patterns['validations'] += len(re.findall(pattern, code))
+        for pattern in VALIDATION_PATTERNS:
+            patterns['validations'] += len(pattern.findall(code))
 
         # Power: Linear searches (anti-pattern)
-        patterns['linear_searches'] = len(re.findall(r'for\s+\w+\s+in\s+\w+:\s*\n\s*if\s+', code))
+        patterns['linear_searches'] = len(LINEAR_SEARCH_PATTERN.findall(code))
 
         return patterns
 
@@ -322,7 +259,7 @@ class AutomatedLJPWAnalyzer:
 
     def __init__(self, quiet: bool = True):
         """Initialize analyzer with harmonizer and pattern analyzer."""
-        self.harmonizer = PythonCodeHarmonizer(quiet=quiet)
+        self.harmonizer = CachedHarmonizer(PythonCodeHarmonizer(quiet=quiet))
         self.pattern_analyzer = ImplementationPatternAnalyzer()
         self.quiet = quiet
 
@@ -8,6 +8,10 @@ Adds sophisticated pattern detection:
 4. Dependency Analysis - Tracks import patterns and external dependencies
 
 These metrics enhance the Power and Wisdom dimensions significantly.
+
+EnhancedPatternAnalyzer collects all of them in a single AST traversal
+(see ast_metrics.py); the individual NodeVisitor classes below remain
+available for standalone use and share the same summarize() logic.
 """
 
 import ast
@@ -23,6 +27,17 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 from harmonizer_integration import PythonCodeHarmonizer
+from experiments.harmonizer_cache import CachedHarmonizer
+
+# Sibling modules (works both as a script and as experiments.phase2.*)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ast_metrics import CodeMetrics, collect_metrics, parse_cached
+
+
+# Source-level patterns (compiled once)
+LOGGING_PATTERN = re.compile(r'\b(logger\.|logging\.)')
+COMMENT_PATTERN = re.compile(r'#.*$', re.MULTILINE)
+VALIDATION_PATTERN = re.compile(r'\bif\s+not\s+\w+|\braise\s+\w+Error')
 
 
 @dataclass
@@ -176,17 +191,20 @@ class CyclomaticComplexityAnalyzer(ast.NodeVisitor):
     def analyze(self, tree: ast.AST) -> ComplexityMetrics:
         """Analyze complexity and return metrics."""
         self.visit(tree)
+        return self.summarize(self.function_complexity)
 
-        if not self.function_complexity:
+    def summarize(self, function_complexity: Dict[str, int]) -> ComplexityMetrics:
+        """Turn per-function complexity into metrics."""
+        if not function_complexity:
             return ComplexityMetrics()
 
-        total = sum(self.function_complexity.values())
-        avg = total / len(self.function_complexity)
-        max_comp = max(self.function_complexity.values())
+        total = sum(function_complexity.values())
+        avg = total / len(function_complexity)
+        max_comp = max(function_complexity.values())
 
         # Find high complexity functions
         high_complexity = [
-            (name, comp) for name, comp in self.function_complexity.items()
+            (name, comp) for name, comp in function_complexity.items()
             if comp > ComplexityMetrics.SIMPLE_THRESHOLD
         ]
         high_complexity.sort(key=lambda x: x[1], reverse=True)
@@ -239,17 +257,21 @@ class CouplingAnalyzer(ast.NodeVisitor):
     def analyze(self, tree: ast.AST) -> CouplingMetrics:
         """Analyze coupling and return metrics."""
         self.visit(tree)
+        return self.summarize(self.imports, self.from_imports, self.class_dependencies)
 
+    def summarize(self, imports: Set[str], from_imports: Set[str],
+                  class_dependencies: Dict[str, Set[str]]) -> CouplingMetrics:
+        """Turn collected imports and class bases into metrics."""
         # Categorize imports
         stdlib = {'os', 'sys', 're', 'ast', 'json', 'datetime', 'time', 'math',
                   'random', 'collections', 'itertools', 'functools', 'typing',
                   'pathlib', 'logging', 'dataclasses', 'enum', 'decimal'}
 
-        external = self.imports.union(self.from_imports) - stdlib
-        total_imports = len(self.imports) + len(self.from_imports)
+        external = imports.union(from_imports) - stdlib
+        total_imports = len(imports) + len(from_imports)
 
         # Calculate fan-out (dependencies)
-        fan_out = len(self.imports.union(self.from_imports))
+        fan_out = len(imports.union(from_imports))
 
         # Calculate coupling score (0-1, lower is better)
         # High coupling = many external dependencies
@@ -262,7 +284,7 @@ class CouplingAnalyzer(ast.NodeVisitor):
         return CouplingMetrics(
             total_imports=total_imports,
             external_dependencies=external,
-            internal_references=len(self.class_dependencies),
+            internal_references=len(class_dependencies),
             fan_out=fan_out,
             coupling_score=coupling_score
         )
@@ -304,14 +326,17 @@ class CohesionAnalyzer(ast.NodeVisitor):
     def analyze(self, tree: ast.AST) -> CohesionMetrics:
         """Calculate LCOM (Lack of Cohesion of Methods)."""
         self.visit(tree)
+        return self.summarize(self.classes)
 
-        if not self.classes:
+    def summarize(self, classes: Dict[str, Dict]) -> CohesionMetrics:
+        """Calculate LCOM from per-class method/attribute usage."""
+        if not classes:
             return CohesionMetrics()
 
         cohesion_scores = []
         low_cohesion = []
 
-        for class_name, data in self.classes.items():
+        for class_name, data in classes.items():
             methods = data['methods']
             attributes = data['attributes']
             method_attrs = data['method_attributes']
@@ -382,8 +407,11 @@ class DependencyAnalyzer(ast.NodeVisitor):
     def analyze(self, tree: ast.AST) -> DependencyMetrics:
         """Analyze dependencies."""
         self.visit(tree)
+        return self.summarize(self.imports, self.from_imports)
 
-        all_imports = self.imports.union(self.from_imports)
+    def summarize(self, imports: Set[str], from_imports: Set[str]) -> DependencyMetrics:
+        """Categorize collected imports."""
+        all_imports = imports.union(from_imports)
 
         stdlib_imports = all_imports & self.stdlib
         third_party = all_imports - self.stdlib - {''}
@@ -406,19 +434,20 @@ class EnhancedPatternAnalyzer:
 
     def analyze(self, code: str) -> Dict:
         """Analyze code with enhanced metrics."""
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        tree = parse_cached(code)
+        if tree is None:
             return self._empty_result()
 
-        # Run all analyzers
-        complexity = CyclomaticComplexityAnalyzer().analyze(tree)
-        coupling = CouplingAnalyzer().analyze(tree)
-        cohesion = CohesionAnalyzer().analyze(tree)
-        dependencies = DependencyAnalyzer().analyze(tree)
+        # One traversal collects everything; each analyzer only summarizes
+        metrics = collect_metrics(tree)
+        complexity = CyclomaticComplexityAnalyzer().summarize(metrics.function_complexity)
+        coupling = CouplingAnalyzer().summarize(
+            metrics.imports, metrics.from_imports, metrics.class_dependencies)
+        cohesion = CohesionAnalyzer().summarize(metrics.classes)
+        dependencies = DependencyAnalyzer().summarize(metrics.imports, metrics.from_imports)
 
         # Basic pattern extraction (from original analyzer)
-        patterns = self._extract_basic_patterns(tree, code)
+        patterns = self._extract_basic_patterns(metrics, code)
 
         # Calculate enhanced LJPW scores
         scores = self._calculate_enhanced_scores(
@@ -437,48 +466,27 @@ class EnhancedPatternAnalyzer:
             'dependencies': dependencies
         }
 
-    def _extract_basic_patterns(self, tree: ast.AST, code: str) -> Dict[str, int]:
+    def _extract_basic_patterns(self, metrics: CodeMetrics, code: str) -> Dict[str, int]:
         """Extract basic patterns (simplified from original)."""
+        counts = metrics.counts
         patterns = {
-            'docstrings': 0,
-            'type_hints': 0,
+            'docstrings': counts['docstrings'],
+            'type_hints': counts['returns'],
             'logging_calls': 0,
             'comments': 0,
-            'try_except': 0,
+            'try_except': counts['try'],
             'validations': 0,
-            'classes': 0,
-            'functions': 0,
+            'classes': counts['classes'],
+            'functions': counts['functions'],
             'constants': 0,
             'global_vars': 0,
-            'dict_usage': 0,
-            'comprehensions': 0,
+            'dict_usage': counts['dict'],
+            'comprehensions': counts['list_comp'] + counts['dict_comp'],
         }
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                if ast.get_docstring(node):
-                    patterns['docstrings'] += 1
-
-            if isinstance(node, ast.FunctionDef):
-                patterns['functions'] += 1
-                if node.returns:
-                    patterns['type_hints'] += 1
-
-            if isinstance(node, ast.Try):
-                patterns['try_except'] += 1
-
-            if isinstance(node, ast.ClassDef):
-                patterns['classes'] += 1
-
-            if isinstance(node, ast.Dict):
-                patterns['dict_usage'] += 1
-
-            if isinstance(node, (ast.ListComp, ast.DictComp)):
-                patterns['comprehensions'] += 1
-
-        patterns['logging_calls'] = len(re.findall(r'\b(logger\.|logging\.)', code))
-        patterns['comments'] = len(re.findall(r'#.*$', code, re.MULTILINE))
-        patterns['validations'] = len(re.findall(r'\bif\s+not\s+\w+|\braise\s+\w+Error', code))
+        patterns['logging_calls'] = len(LOGGING_PATTERN.findall(code))
+        patterns['comments'] = len(COMMENT_PATTERN.findall(code))
+        patterns['validations'] = len(VALIDATION_PATTERN.findall(code))
 
         return patterns
 
@@ -623,7 +631,7 @@ class EnhancedLJPWAnalyzer:
 
     def __init__(self, quiet: bool = True):
         """Initialize with harmonizer and enhanced pattern analyzer."""
-        self.harmonizer = PythonCodeHarmonizer(quiet=quiet)
+        self.harmonizer = CachedHarmonizer(PythonCodeHarmonizer(quiet=quiet))
         self.pattern_analyzer = EnhancedPatternAnalyzer()
         self.quiet = quiet
 
@@ -23,6 +23,7 @@ from pathlib import Path
 import re
 
 from harmonizer_integration import PythonCodeHarmonizer, HARMONIZER_AVAILABLE
+from experiments.harmonizer_cache import CachedHarmonizer
 
 
 @dataclass
@@ -103,7 +104,7 @@ class IntentDiscoveryCompanion:
                 "Please ensure Python-Code-Harmonizer-main is available."
             )
 
-        self.harmonizer = PythonCodeHarmonizer(quiet=True)
+        self.harmonizer = CachedHarmonizer(PythonCodeHarmonizer(quiet=True))
 
         # Intent keywords - carefully curated to detect claims
         self.integration_words = {
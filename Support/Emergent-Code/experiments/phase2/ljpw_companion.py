@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from harmonizer_integration import PythonCodeHarmonizer, HARMONIZER_AVAILABLE
+from experiments.harmonizer_cache import CachedHarmonizer
 
 
 @dataclass
@@ -49,7 +50,7 @@ class LJPWCompanion:
                 "Please ensure Python-Code-Harmonizer-main is available."
             )
 
-        self.harmonizer = PythonCodeHarmonizer(quiet=True)
+        self.harmonizer = CachedHarmonizer(PythonCodeHarmonizer(quiet=True))
         self.session_history = []
 
     def analyze_code_with_guidance(self, code: str, function_name: Optional[str] = None) -> Dict:
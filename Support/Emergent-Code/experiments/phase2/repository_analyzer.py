@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Repository-Scale LJPW Analyzer
+
+Runs AutomatedLJPWAnalyzer over every Python file in a directory tree:
+1. Discovers Python files (skipping VCS, build and cache directories)
+2. Analyzes changed files in a process pool
+3. Persists per-file results in a SQLite cache keyed by path + mtime + hash
+4. Rolls results up into LOC-weighted LJPW/harmony scores per package
+
+On later runs only files whose content changed are re-analyzed, so the
+scan can run on every commit of a large monorepo.
+
+Usage:
+    python repository_analyzer.py /path/to/repo
+    python repository_analyzer.py /path/to/repo --workers 8 --json report.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from automated_ljpw_analyzer import AutomatedLJPWAnalyzer
+
+
+# Directories never worth analyzing
+SKIP_DIRS = {'.git', '.hg', '.svn', '.tox', '.nox', '.eggs', '.venv', 'venv',
+             'build', 'dist', '__pycache__', 'node_modules', '.mypy_cache'}
+
+# Default cache location (inside the analyzed root)
+DEFAULT_CACHE_NAME = '.ljpw_cache.sqlite'
+
+# Bump when the scoring changes so stale cached results are discarded
+CACHE_VERSION = 1
+
+DIMENSIONS = ('love', 'justice', 'power', 'wisdom')
+
+# One analyzer per worker process (the harmonizer is expensive to build)
+_worker_analyzer: Optional[AutomatedLJPWAnalyzer] = None
+
+
+@dataclass
+class FileResult:
+    """Cached LJPW result for one file."""
+    path: str  # relative to the repository root, '/'-separated
+    lines_of_code: int
+    love: float
+    justice: float
+    power: float
+    wisdom: float
+    harmony: float
+    patterns: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class PackageRollup:
+    """LOC-weighted LJPW scores for a package (directory) and everything below it."""
+    package: str
+    files: int
+    lines_of_code: int
+    love: float
+    justice: float
+    power: float
+    wisdom: float
+    harmony: float  # harmony of the averaged dimensions
+    mean_file_harmony: float
+
+
+@dataclass
+class ScanReport:
+    """Outcome of one repository scan."""
+    root: str
+    files: List[FileResult]
+    packages: Dict[str, PackageRollup]
+    analyzed: int
+    reused: int
+    removed: int
+    elapsed: float
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 of a file's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def count_loc(code: str) -> int:
+    """Non-empty, non-comment lines (same rule as the Phase 3 library analyzer)."""
+    lines = (line.strip() for line in code.split('\n'))
+    return sum(1 for line in lines if line and not line.startswith('#'))
+
+
+def analyze_source(rel_path: str, code: str,
+                   analyzer: Optional[AutomatedLJPWAnalyzer] = None) -> FileResult:
+    """Score one file's source; errors are recorded instead of raised."""
+    global _worker_analyzer
+    if analyzer is None:
+        if _worker_analyzer is None:
+            _worker_analyzer = AutomatedLJPWAnalyzer(quiet=True)
+        analyzer = _worker_analyzer
+
+    loc = count_loc(code)
+    try:
+        score = analyzer.analyze_code(code)
+    except Exception as e:
+        return FileResult(rel_path, loc, 0.0, 0.0, 0.0, 0.0, 0.0, error=str(e))
+
+    return FileResult(
+        path=rel_path,
+        lines_of_code=loc,
+        love=score.love,
+        justice=score.justice,
+        power=score.power,
+        wisdom=score.wisdom,
+        harmony=score.harmony,
+        patterns=dict(score.patterns),
+    )
+
+
+def _analyze_job(job: Tuple[str, str]) -> FileResult:
+    """Process-pool entry point."""
+    rel_path, code = job
+    return analyze_source(rel_path, code)
+
+
+class AnalysisCache:
+    """SQLite store of per-file results keyed by path, mtime and content hash."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                result TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def load(self) -> Dict[str, Tuple[int, int, str, FileResult]]:
+        """All current-version entries: path -> (mtime_ns, size, hash, result)."""
+        rows = self.conn.execute(
+            "SELECT path, mtime_ns, size, hash, result FROM files WHERE version = ?",
+            (CACHE_VERSION,)
+        )
+        return {
+            path: (mtime_ns, size, digest, FileResult(**json.loads(result)))
+            for path, mtime_ns, size, digest, result in rows
+        }
+
+    def store(self, entries: List[Tuple[int, int, str, FileResult]]):
+        """Insert or replace entries given as (mtime_ns, size, hash, result)."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+            [(r.path, mtime_ns, size, digest, CACHE_VERSION, json.dumps(asdict(r)))
+             for mtime_ns, size, digest, r in entries]
+        )
+        self.conn.commit()
+
+    def remove(self, paths: List[str]):
+        """Forget files that no longer exist."""
+        self.conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in paths])
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class RepositoryLJPWAnalyzer:
+    """Incremental, parallel LJPW analysis of a whole directory tree."""
+
+    def __init__(self, root: str, cache_path: Optional[str] = None,
+                 workers: Optional[int] = None, exclude_tests: bool = False,
+                 verbose: bool = True):
+        self.root = Path(root).resolve()
+        self.cache_path = cache_path or str(self.root / DEFAULT_CACHE_NAME)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.exclude_tests = exclude_tests
+        self.verbose = verbose
+
+    def log(self, message: str):
+        """Print message if verbose."""
+        if self.verbose:
+            print(message)
+
+    def discover_files(self) -> List[Path]:
+        """All Python files under the root, in a stable order."""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # Prune in place so skipped trees are never walked
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if d not in SKIP_DIRS and not d.endswith('.egg-info')
+                and not (self.exclude_tests and d in ('test', 'tests'))
+            )
+            for name in sorted(filenames):
+                if name.endswith('.py'):
+                    found.append(Path(dirpath) / name)
+        return found
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def scan(self) -> ScanReport:
+        """
+        Analyze the repository, re-using cached results for unchanged files.
+
+        A file is unchanged if its mtime and size match the cache, or (after a
+        touch/checkout) if its content hash still matches.
+        """
+        start = time.perf_counter()
+        cache = AnalysisCache(self.cache_path)
+        try:
+            cached = cache.load()
+            results: Dict[str, FileResult] = {}
+            refreshed = []  # unchanged content, new stat -> update key only
+            jobs = []       # (rel_path, code)
+            stats = {}      # rel_path -> (mtime_ns, size, hash)
+
+            for path in self.discover_files():
+                rel = self._relative(path)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+
+                entry = cached.get(rel)
+                if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                    results[rel] = entry[3]
+                    continue
+
+                try:
+                    data = path.read_bytes()
+                except OSError:
+                    continue
+                digest = content_hash(data)
+
+                if entry and entry[2] == digest:
+                    results[rel] = entry[3]
+                    refreshed.append((st.st_mtime_ns, st.st_size, digest, entry[3]))
+                    continue
+
+                code = data.decode('utf-8', errors='replace')
+                if not code.strip():
+                    continue
+                stats[rel] = (st.st_mtime_ns, st.st_size, digest)
+                jobs.append((rel, code))
+
+            self.log(f"📄 {len(results) + len(jobs)} Python files: "
+                     f"{len(jobs)} to analyze, {len(results)} cached")
+
+            fresh = self._run_jobs(jobs)
+            for result in fresh:
+                results[result.path] = result
+
+            removed = [p for p in cached if p not in results and p not in stats]
+            cache.store(refreshed + [stats[r.path] + (r,) for r in fresh])
+            cache.remove(removed)
+        finally:
+            cache.close()
+
+        files = [results[p] for p in sorted(results)]
+        return ScanReport(
+            root=str(self.root),
+            files=files,
+            packages=rollup_packages(files),
+            analyzed=len(jobs),
+            reused=len(files) - len(jobs),
+            removed=len(removed),
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _run_jobs(self, jobs: List[Tuple[str, str]]) -> List[FileResult]:
+        """Analyze files, in a process pool when it is worth it."""
+        if not jobs:
+            return []
+        if self.workers <= 1 or len(jobs) == 1:
+            analyzer = AutomatedLJPWAnalyzer(quiet=True)
+            return [analyze_source(rel, code, analyzer) for rel, code in jobs]
+
+        # Larger chunks amortize IPC; keep a few chunks per worker for balance
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(_analyze_job, jobs, chunksize=chunksize))
+
+    def print_report(self, report: ScanReport, top: int = 20):
+        """Print scan summary and the package rollups."""
+        print(f"\n{'=' * 80}")
+        print(f"📊 LJPW REPOSITORY SCAN: {report.root}")
+        print(f"{'=' * 80}")
+        print(f"Files: {len(report.files)} ({report.analyzed} analyzed, "
+              f"{report.reused} cached, {report.removed} removed) "
+              f"in {report.elapsed:.2f}s")
+
+        errors = [f for f in report.files if f.error]
+        if errors:
+            print(f"⚠️  {len(errors)} files could not be analyzed")
+
+        packages = sorted(report.packages.values(), key=lambda p: -p.lines_of_code)
+        print(f"\n{'Package':40s} {'Files':>6s} {'LOC':>8s}   L     J     P     W     H")
+        print("-" * 80)
+        for pkg in packages[:top]:
+            name = pkg.package if len(pkg.package) <= 40 else '…' + pkg.package[-39:]
+            print(f"{name:40s} {pkg.files:6d} {pkg.lines_of_code:8d}  "
+                  f"{pkg.love:.2f}  {pkg.justice:.2f}  {pkg.power:.2f}  "
+                  f"{pkg.wisdom:.2f}  {pkg.harmony:.2f}")
+
+
+def rollup_packages(files: List[FileResult]) -> Dict[str, PackageRollup]:
+    """
+    LOC-weighted LJPW per directory, including all files below it.
+
+    The repository root is reported as '.'. Files that failed to analyze are
+    left out of the averages.
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    for f in files:
+        if f.error:
+            continue
+        weight = max(f.lines_of_code, 1)
+        parts = f.path.split('/')[:-1]
+        for depth in range(len(parts) + 1):
+            package = '/'.join(parts[:depth]) or '.'
+            acc = totals.setdefault(package, dict.fromkeys(
+                ('files', 'loc', 'weight', 'harmony') + DIMENSIONS, 0.0))
+            acc['files'] += 1
+            acc['loc'] += f.lines_of_code
+            acc['weight'] += weight
+            acc['harmony'] += weight * f.harmony
+            for dim in DIMENSIONS:
+                acc[dim] += weight * getattr(f, dim)
+
+    rollups = {}
+    for package, acc in totals.items():
+        L, J, P, W = (acc[dim] / acc['weight'] for dim in DIMENSIONS)
+        rollups[package] = PackageRollup(
+            package=package,
+            files=int(acc['files']),
+            lines_of_code=int(acc['loc']),
+            love=L,
+            justice=J,
+            power=P,
+            wisdom=W,
+            harmony=(L * J * P * W) ** 0.25,
+            mean_file_harmony=acc['harmony'] / acc['weight'],
+        )
+    return rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental LJPW analysis of a repository")
+    parser.add_argument('root', help="Repository or directory to analyze")
+    parser.add_argument('--cache', help=f"Cache file (default: <root>/{DEFAULT_CACHE_NAME})")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--exclude-tests', action='store_true', help="Skip test/ and tests/")
+    parser.add_argument('--json', help="Write file results and rollups to this JSON file")
+    parser.add_argument('--top', type=int, default=20, help="Packages to show in the report")
+    args = parser.parse_args()
+
+    analyzer = RepositoryLJPWAnalyzer(args.root, cache_path=args.cache,
+                                      workers=args.workers,
+                                      exclude_tests=args.exclude_tests)
+    report = analyzer.scan()
+    analyzer.print_report(report, top=args.top)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'root': report.root,
+                'files': [asdict(r) for r in report.files],
+                'packages': {k: asdict(v) for k, v in report.packages.items()},
+            }, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -33,6 +33,8 @@ class EnglishGenerator:
         """
         self.vocab = vocabulary
         self.english_words = self._identify_english_words()
+        # Sub-index over English words only, so selection is exact per language
+        self.vocab.define_subset('english', self.english_words)
         print(f"[EnglishGenerator] Identified {len(self.english_words)} English words")
     
     def _identify_english_words(self) -> Set[str]:
@@ -64,7 +66,8 @@ class EnglishGenerator:
                            coords: np.ndarray,
                            used_words: Set[str],
                            k: int = 20,
-                           temperature: float = 0.3) -> Optional[str]:
+                           temperature: float = 0.3,
+                           candidates: Optional[List[Tuple[str, float]]] = None) -> Optional[str]:
         """
         Select English word nearest to coordinates.
         
@@ -73,25 +76,25 @@ class EnglishGenerator:
             used_words: Already used words
             k: Number of candidates to consider
             temperature: Randomness
+            candidates: Precomputed English (word, distance) candidates,
+                        nearest first (see generate_english_sentence)
             
         Returns:
             Selected English word or None
         """
-        # Get nearest words
-        candidates = self.vocab.nearest_words_with_distances(coords, k=k*2)
-        
-        # Filter for English words
+        # Nearest unused English words from the English sub-index
+        if candidates is None:
+            candidates = self.vocab.nearest_excluding(
+                coords, k=k, exclude=used_words, subset='english')[0]
         english_candidates = [
-            (w, d) for w, d in candidates 
-            if w in self.english_words and w not in used_words
+            (w, d) for w, d in candidates
+            if w not in used_words
         ]
         
         # If no English words available, allow any word
         if not english_candidates:
-            english_candidates = [
-                (w, d) for w, d in candidates 
-                if w not in used_words
-            ]
+            english_candidates = self.vocab.nearest_excluding(
+                coords, k=k, exclude=used_words)[0]
         
         if not english_candidates:
             return None
@@ -141,16 +144,22 @@ class EnglishGenerator:
             point = ops.interpolate(ops.NE, meaning, alpha)
             trajectory.append(point)
         
+        # English candidates for every step in one batched query; reserve
+        # one extra candidate per step for words used earlier in the sentence
+        step_candidates = self.vocab.nearest_excluding(
+            np.array(trajectory), k=15, reserve=len(trajectory), subset='english')
+        
         # Select English words
         words = []
         used_words = set()
         
-        for coords in trajectory:
+        for coords, candidates in zip(trajectory, step_candidates):
             word = self.select_english_word(
                 coords,
                 used_words,
                 k=15,
-                temperature=temperature
+                temperature=temperature,
+                candidates=candidates
             )
             
             if word is None:
@@ -124,21 +124,38 @@ class PureLJPWLanguageModel:
         Returns:
             Understanding object with complete semantic analysis
         """
-        # Encode to meaning
-        meaning = self.trajectory.encode_sentence(text)
+        return self.understand_many([text])[0]
+    
+    def understand_many(self, texts: List[str]) -> List[Understanding]:
+        """
+        Understand a batch of texts.
         
-        # Get emotional profile
-        emotional = self.qualia.get_emotional_profile(meaning)
+        Uses the stateless batched trajectory encoder, so one model
+        instance can serve concurrent requests.
         
+        Args:
+            texts: Input texts
+            
+        Returns:
+            One Understanding per text
+        """
+        meanings, summaries = self.trajectory.encode_batch(texts)
+        
+        # Emotional profiles and explanations in one batched qualia lookup
+        profiles, explanations = self.qualia.ground_many(meanings)
+        return [
+            self._understanding(text, meaning, summary, emotional, explanation)
+            for text, meaning, summary, emotional, explanation
+            in zip(texts, meanings, summaries, profiles, explanations)
+        ]
+    
+    def _understanding(self, text: str, meaning: np.ndarray,
+                       summary: Dict[str, Any], emotional: Dict[str, Any],
+                       explanation: str) -> Understanding:
+        """Build an Understanding from an encoded meaning and its grounding"""
         # Classify territory
         territory, conf = self.ops.classify_territory(meaning)
         
-        # Get trajectory metrics
-        summary = self.trajectory.get_trajectory_summary()
-        
-        # Generate explanation
-        explanation = self.qualia.explain_meaning(meaning)
-        
         return Understanding(
             text=text,
             meaning=meaning,
@@ -318,6 +335,13 @@ class PureLJPWLanguageModel:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(current_dir)  # Go up from ljpw_nn to project root
         
+        # Prefer the compact memory-mapped format when it has been exported
+        compact_path = os.path.join(project_root, 'data', 'ljpw_vocabulary')
+        if os.path.isdir(compact_path):
+            vocab = LJPWVocabulary()
+            vocab.load_compact(compact_path)
+            return vocab
+        
         vocab_path = os.path.join(project_root, 'data', 'ljpw_vocabulary.pkl')
         
         if not os.path.exists(vocab_path):
@@ -108,6 +108,13 @@ class QualiaGrounding:
         self.coord_indices: Dict[QualiaType, Optional[KDTree]] = {
             qt: None for qt in QualiaType
         }
+        
+        # Combined labeled index over every entry, for batched lookups
+        self._all_entries: List[QualiaEntry] = []
+        self._all_coords: np.ndarray = np.empty((0, 4))
+        self._all_sq_norms: np.ndarray = np.empty(0)
+        self._type_counts: Dict[QualiaType, int] = {}
+        self._type_starts: Dict[QualiaType, int] = {}
         self._indices_built = False
     
     # ========================================================================
@@ -137,6 +144,17 @@ class QualiaGrounding:
                 coords_array = np.array([e.coords for e in entries])
                 self.coord_indices[qualia_type] = KDTree(coords_array)
         
+        # Combined index, grouped by type in QualiaType order
+        self._all_entries = [e for qt in QualiaType for e in self.qualia_db[qt]]
+        self._all_coords = (np.array([e.coords for e in self._all_entries], dtype=np.float64)
+                            if self._all_entries else np.empty((0, 4)))
+        self._all_sq_norms = np.einsum('nd,nd->n', self._all_coords, self._all_coords)
+        self._type_counts = {qt: len(self.qualia_db[qt]) for qt in QualiaType}
+        start = 0
+        for qualia_type in QualiaType:
+            self._type_starts[qualia_type] = start
+            start += self._type_counts[qualia_type]
+        
         self._indices_built = True
     
     # ========================================================================
@@ -187,12 +205,67 @@ class QualiaGrounding:
         Returns:
             Dictionary mapping qualia type to nearest entry/entries
         """
-        results = {}
-        for qualia_type in QualiaType:
-            result = self.find_qualia(coords, qualia_type, k=k)
-            if result is not None:
-                results[qualia_type] = result
-        return results
+        return self.find_all_qualia_many(np.asarray(coords)[None, :], k=k)[0]
+    
+    def find_all_qualia_many(self, coords: np.ndarray, k: int = 1) -> List[Dict[QualiaType, Any]]:
+        """
+        Find nearest qualia of all types for a batch of coordinates.
+        
+        Args:
+            coords: (n, 4) LJPW coordinates
+            k: Number per type
+            
+        Returns:
+            One dictionary per row, as returned by find_all_qualia
+        """
+        nearest = self._nearest_by_type(coords, k)
+        if k == 1:
+            return [{qt: found[0] for qt, found in row.items()} for row in nearest]
+        # Like find_qualia(k > 1), types without entries map to []
+        return [{qt: row.get(qt, []) for qt in QualiaType} for row in nearest]
+    
+    def _nearest_by_type(self, coords: np.ndarray, k: int) -> List[Dict[QualiaType, List[QualiaEntry]]]:
+        """
+        Up to k nearest entries of every type, for every row, in one pass.
+        
+        Squared distances to all entries come from one matrix product
+        (|x|^2 - 2 x.y + |y|^2). Entries are stored grouped by type, so each
+        type is a column block: argpartition picks its k nearest columns
+        and only those k are sorted. Entries at the same distance may come
+        out in either order, as this form carries rounding error.
+        """
+        if not self._indices_built:
+            self.build_indices()
+        
+        coords = np.atleast_2d(np.asarray(coords, dtype=np.float64))
+        if not self._all_entries:
+            return [{} for _ in coords]
+        
+        distances = (np.einsum('bd,bd->b', coords, coords)[:, None]
+                     - 2.0 * coords @ self._all_coords.T
+                     + self._all_sq_norms[None, :])
+        np.maximum(distances, 0.0, out=distances)
+        
+        nearest = {}
+        for qt in QualiaType:
+            start, n = self._type_starts[qt], self._type_counts[qt]
+            if not n:
+                continue
+            block = distances[:, start:start + n]
+            count = min(k, n)
+            if count < n:
+                columns = np.argpartition(block, count - 1, axis=1)[:, :count]
+            else:
+                columns = np.broadcast_to(np.arange(n), block.shape)
+            picked = np.take_along_axis(block, columns, axis=1)
+            order = np.lexsort((columns, picked), axis=1)
+            nearest[qt] = start + np.take_along_axis(columns, order, axis=1)
+        
+        entries = self._all_entries
+        return [
+            {qt: [entries[i] for i in rows[b]] for qt, rows in nearest.items()}
+            for b in range(len(coords))
+        ]
     
     # ========================================================================
     # Experiential Descriptions
@@ -209,12 +282,15 @@ class QualiaGrounding:
         Returns:
             Experiential description string
         """
-        if not self._indices_built:
-            self.build_indices()
-        
-        # Find nearest qualia of each type
-        all_qualia = self.find_all_qualia(coords, k=1)
-        
+        return self.describe_coords_many(np.asarray(coords)[None, :], verbose=verbose)[0]
+    
+    def describe_coords_many(self, coords: np.ndarray, verbose: bool = False) -> List[str]:
+        """Experiential descriptions for a batch of coordinates (one index pass)."""
+        return [self._describe(all_qualia, verbose)
+                for all_qualia in self.find_all_qualia_many(coords, k=1)]
+    
+    def _describe(self, all_qualia: Dict[QualiaType, QualiaEntry], verbose: bool) -> str:
+        """Build a description from the nearest entry of each type"""
         # Build description
         parts = []
         
@@ -254,17 +330,19 @@ class QualiaGrounding:
         Returns:
             Dictionary with emotional analysis
         """
-        if not self._indices_built:
-            self.build_indices()
-        
-        # Find top 3 nearest emotions
-        emotions = self.find_qualia(coords, QualiaType.EMOTIONAL, k=3)
+        return self.get_emotional_profiles(np.asarray(coords)[None, :])[0]
+    
+    def get_emotional_profiles(self, coords: np.ndarray) -> List[Dict[str, Any]]:
+        """Emotional profiles for a batch of coordinates (one index pass)."""
+        coords = np.atleast_2d(np.asarray(coords, dtype=np.float64))
+        return [self._emotional_profile(c, row.get(QualiaType.EMOTIONAL, []))
+                for c, row in zip(coords, self._nearest_by_type(coords, k=3))]
+    
+    def _emotional_profile(self, coords: np.ndarray, emotions: List[QualiaEntry]) -> Dict[str, Any]:
+        """Build an emotional profile from the (up to 3) nearest emotions"""
         if not emotions:
             return {'primary': None, 'secondary': [], 'valence': 0.0, 'arousal': 0.5}
         
-        if not isinstance(emotions, list):
-            emotions = [emotions]
-        
         primary = emotions[0]
         secondary = emotions[1:] if len(emotions) > 1 else []
         
@@ -291,9 +369,33 @@ class QualiaGrounding:
         Returns:
             Multi-sentence experiential explanation
         """
-        emotional = self.get_emotional_profile(coords)
-        all_qualia = self.find_all_qualia(coords, k=1)
+        return self.ground_many(np.asarray(coords)[None, :])[1][0]
+    
+    def ground_many(self, coords: np.ndarray) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Emotional profiles and explanations for a batch of coordinates.
         
+        Both come from a single pass over the combined qualia index, so
+        grounding every verse of a book costs one batched lookup.
+        
+        Args:
+            coords: (n, 4) LJPW coordinates
+            
+        Returns:
+            (emotional_profiles, explanations), one per row
+        """
+        coords = np.atleast_2d(np.asarray(coords, dtype=np.float64))
+        profiles, explanations = [], []
+        for c, row in zip(coords, self._nearest_by_type(coords, k=3)):
+            emotional = self._emotional_profile(c, row.get(QualiaType.EMOTIONAL, []))
+            all_qualia = {qt: found[0] for qt, found in row.items()}
+            profiles.append(emotional)
+            explanations.append(self._explain(c, emotional, all_qualia))
+        return profiles, explanations
+    
+    def _explain(self, coords: np.ndarray, emotional: Dict[str, Any],
+                 all_qualia: Dict[QualiaType, QualiaEntry]) -> str:
+        """Build an explanation from an emotional profile and nearest qualia"""
         # Calculate harmony
         harmony = 1.0 / (1.0 + np.linalg.norm(coords - ANCHOR_POINT))
         
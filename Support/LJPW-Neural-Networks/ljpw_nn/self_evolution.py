@@ -21,6 +21,11 @@ Date: November 26, 2025
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Callable
 import copy
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
@@ -581,6 +586,263 @@ class SelfReflector:
         )
 
 
+@dataclass
+class CandidateEvaluation:
+    """Measured outcome of training one evolution candidate."""
+    proposal: Optional[EvolutionProposal]  # None = unmutated baseline
+    performance: float  # Validation accuracy after its training budget
+    harmony: float
+    steps: int  # Training steps actually run
+    elapsed: float  # Seconds of training across all rounds
+    rounds_survived: int
+    state: Optional[List[Dict[str, np.ndarray]]] = None  # Trained layer weights
+    error: Optional[str] = None
+
+
+# Candidate set shared with forked workers. Mutation functions are closures,
+# which cannot be pickled, so workers inherit them through fork instead.
+_EVALUATION_CONTEXT: Dict[str, Any] = {}
+
+
+def _layer_state(network) -> List[Dict[str, np.ndarray]]:
+    """Copy the trainable arrays (weights, bias) of every layer."""
+    state = []
+    for layer in getattr(network, 'layers', []):
+        arrays = {}
+        for attr in ('weights', 'bias'):
+            value = getattr(layer, attr, None)
+            if isinstance(value, np.ndarray):
+                arrays[attr] = value.copy()
+        state.append(arrays)
+    return state
+
+
+def _load_layer_state(network, state: List[Dict[str, np.ndarray]]):
+    """Restore arrays captured by _layer_state."""
+    for layer, arrays in zip(network.layers, state):
+        for attr, value in arrays.items():
+            setattr(layer, attr, value.copy())
+
+
+def _build_candidate(index: int, state=None):
+    """Recreate candidate network `index` from the shared context."""
+    context = _EVALUATION_CONTEXT
+    network = copy.deepcopy(context['network'])
+    proposal = context['proposals'][index]
+    if proposal is not None:
+        network = proposal.mutation_function(network)
+    if state is not None:
+        _load_layer_state(network, state)
+    return network
+
+
+def _train_candidate(task: Tuple) -> Dict:
+    """
+    Worker: train one candidate for a round and evaluate it.
+
+    Args:
+        task: (index, state, max_steps, time_budget, round_index)
+
+    Returns:
+        Dict with index, performance, harmony, steps, elapsed, state, error
+    """
+    from ljpw_nn.training import train_step, evaluate
+
+    index, state, max_steps, time_budget, round_index = task
+    context = _EVALUATION_CONTEXT
+    X_train, y_train = context['X_train'], context['y_train']
+    X_val, y_val = context['X_val'], context['y_val']
+    batch_size = context['batch_size']
+
+    start = time.perf_counter()
+    steps = 0
+    try:
+        network = _build_candidate(index, state)
+        learning_rate = getattr(network, 'optimal_learning_rate', context['learning_rate'])
+
+        # Same batches for every candidate in a round: fair comparison
+        rng = np.random.default_rng((context['seed'], round_index))
+        n_samples = X_train.shape[0]
+        while steps < max_steps:
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+            batch = rng.integers(0, n_samples, size=min(batch_size, n_samples))
+            train_step(network, X_train[batch], y_train[batch], learning_rate=learning_rate)
+            steps += 1
+
+        performance = float(evaluate(network, X_val, y_val)['accuracy'])
+        if not np.isfinite(performance):
+            performance = 0.0
+        harmony = (network.get_current_harmony()
+                   if hasattr(network, 'get_current_harmony') else 0.75)
+        return {
+            'index': index,
+            'performance': performance,
+            'harmony': float(harmony),
+            'steps': steps,
+            'elapsed': time.perf_counter() - start,
+            'state': _layer_state(network),
+            'error': None
+        }
+    except Exception as e:
+        return {
+            'index': index,
+            'performance': 0.0,
+            'harmony': 0.0,
+            'steps': steps,
+            'elapsed': time.perf_counter() - start,
+            'state': state,
+            'error': str(e)
+        }
+
+
+class ParallelEvolutionEvaluator:
+    """
+    Population Evaluation Across CPU Cores
+
+    Trains every candidate mutation (plus an unmutated baseline) on real
+    data in a process pool, instead of testing one proposal serially.
+    Uses successive halving: all candidates get a short training round,
+    the worst are eliminated, and survivors continue from their trained
+    weights with the next round's budget.
+
+    Workers are forked so that closure-based mutation functions need no
+    pickling. Where fork is unavailable (or max_workers=1), candidates are
+    evaluated in-process with the same logic.
+    """
+
+    def __init__(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+        max_workers: Optional[int] = None,
+        steps_per_round: int = 50,
+        time_budget: Optional[float] = None,
+        halving_rounds: int = 3,
+        eta: int = 2,
+        batch_size: int = 32,
+        learning_rate: float = 0.01,
+        seed: int = 613
+    ):
+        """
+        Initialize parallel evaluator.
+
+        Args:
+            X_train, y_train: Data used to train candidates
+            X_val, y_val: Data used to score candidates
+            max_workers: Worker processes (default: CPU count)
+            steps_per_round: Training steps per candidate per round
+            time_budget: Max seconds per candidate per round (None = no limit)
+            halving_rounds: Number of successive-halving rounds
+            eta: Keep the best 1/eta of candidates after each round
+            batch_size: Mini-batch size for candidate training
+            learning_rate: Learning rate unless a candidate evolved its own
+            seed: Seed for the shared batch order
+        """
+        if eta < 2:
+            raise ValueError(f"eta must be >= 2, got {eta}")
+        self.X_train = X_train
+        self.y_train = y_train
+        self.X_val = X_val
+        self.y_val = y_val
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.steps_per_round = steps_per_round
+        self.time_budget = time_budget
+        self.halving_rounds = max(1, halving_rounds)
+        self.eta = eta
+        self.batch_size = batch_size
+        self.learning_rate = learning_rate
+        self.seed = seed
+
+    def _use_processes(self, n_tasks: int) -> bool:
+        return (self.max_workers > 1 and n_tasks > 1 and
+                'fork' in multiprocessing.get_all_start_methods())
+
+    def _run_round(self, tasks: List[Tuple]) -> List[Dict]:
+        if not self._use_processes(len(tasks)):
+            return [_train_candidate(task) for task in tasks]
+        context = multiprocessing.get_context('fork')
+        workers = min(self.max_workers, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            return list(pool.map(_train_candidate, tasks))
+
+    def evaluate(self, network, proposals: List[EvolutionProposal],
+                 include_baseline: bool = True) -> List[CandidateEvaluation]:
+        """
+        Train and score all proposals concurrently.
+
+        Args:
+            network: Network the proposals mutate (left untouched)
+            proposals: Candidate evolution proposals
+            include_baseline: Also train the unmutated network (proposal=None)
+                              with the same budget; it is never eliminated
+
+        Returns:
+            Evaluations sorted by performance (best first)
+        """
+        candidates: List[Optional[EvolutionProposal]] = list(proposals)
+        if include_baseline:
+            candidates.insert(0, None)
+
+        _EVALUATION_CONTEXT.update({
+            'network': network,
+            'proposals': candidates,
+            'X_train': self.X_train,
+            'y_train': self.y_train,
+            'X_val': self.X_val,
+            'y_val': self.y_val,
+            'batch_size': self.batch_size,
+            'learning_rate': self.learning_rate,
+            'seed': self.seed,
+        })
+
+        evaluations = {
+            i: CandidateEvaluation(
+                proposal=proposal, performance=0.0, harmony=0.0,
+                steps=0, elapsed=0.0, rounds_survived=0
+            )
+            for i, proposal in enumerate(candidates)
+        }
+        alive = list(evaluations)
+
+        try:
+            for round_index in range(self.halving_rounds):
+                tasks = [
+                    (i, evaluations[i].state, self.steps_per_round,
+                     self.time_budget, round_index)
+                    for i in alive
+                ]
+                for outcome in self._run_round(tasks):
+                    evaluation = evaluations[outcome['index']]
+                    evaluation.performance = outcome['performance']
+                    evaluation.harmony = outcome['harmony']
+                    evaluation.steps += outcome['steps']
+                    evaluation.elapsed += outcome['elapsed']
+                    evaluation.state = outcome['state']
+                    evaluation.error = outcome['error']
+                    evaluation.rounds_survived = round_index + 1
+
+                # Successive halving: drop failures and the weakest candidates
+                alive = [i for i in alive if evaluations[i].error is None]
+                ranked = sorted(alive, key=lambda i: evaluations[i].performance,
+                                reverse=True)
+                keep = max(1, math.ceil(len(ranked) / self.eta))
+                survivors = ranked[:keep]
+                if include_baseline and 0 in alive and 0 not in survivors:
+                    survivors.append(0)
+                alive = survivors
+                if len(alive) <= 1:
+                    break
+        finally:
+            _EVALUATION_CONTEXT.clear()
+
+        return sorted(evaluations.values(),
+                      key=lambda e: (e.error is None, e.rounds_survived, e.performance),
+                      reverse=True)
+
+
 class SelfEvolutionEngine:
     """
     Master Self-Evolution Engine
@@ -600,7 +862,8 @@ class SelfEvolutionEngine:
         meta_cognition=None,
         evolution_frequency: int = 100,  # Steps between evolution attempts
         min_harmony: float = 0.7,
-        max_risk: float = 0.5
+        max_risk: float = 0.5,
+        evaluator: Optional[ParallelEvolutionEvaluator] = None
     ):
         """
         Initialize self-evolution engine.
@@ -611,12 +874,16 @@ class SelfEvolutionEngine:
             evolution_frequency: Steps between evolution checks
             min_harmony: Minimum harmony to maintain
             max_risk: Maximum acceptable risk for mutations
+            evaluator: Optional parallel evaluator. When given, all safe
+                       proposals are trained and compared on real data
+                       instead of testing only the top-ranked one.
         """
         self.network = network
         self.meta_cognition = meta_cognition
         self.evolution_frequency = evolution_frequency
         self.min_harmony = min_harmony
         self.max_risk = max_risk
+        self.evaluator = evaluator
 
         # Initialize sub-systems
         self.topology_mutator = TopologyMutator(network, min_harmony)
@@ -696,6 +963,16 @@ class SelfEvolutionEngine:
             print("No safe evolution proposals available.\n")
             return None
 
+        if self.evaluator is not None:
+            result = self._test_population(safe_proposals, training_history)
+            self.evolution_history.append(result)
+            print(f"Population Evolution Result:")
+            print(f"  Best: {result.proposal.description}")
+            print(f"  Performance: {result.performance_before:.4f} → {result.performance_after:.4f}")
+            print(f"  Kept: {result.kept}")
+            print(f"\n{'=' * 70}\n")
+            return result
+
         # 4. Select best proposal (highest expected benefit, lowest risk)
         best_proposal = max(
             safe_proposals,
@@ -798,6 +1075,73 @@ class SelfEvolutionEngine:
             learnings=learnings
         )
 
+    def _test_population(
+        self,
+        proposals: List[EvolutionProposal],
+        training_history: Optional[Dict] = None
+    ) -> EvolutionResult:
+        """
+        Test all proposals at once with the parallel evaluator.
+
+        The best candidate is kept only if it beats the unmutated baseline
+        trained with the same budget and keeps harmony above the minimum.
+
+        Args:
+            proposals: Safe evolution proposals
+            training_history: Recent training metrics
+
+        Returns:
+            Evolution result for the best candidate
+        """
+        evaluations = self.evaluator.evaluate(self.network, proposals)
+        baseline = next(e for e in evaluations if e.proposal is None)
+        mutated = [e for e in evaluations if e.proposal is not None and e.error is None]
+
+        harmony_before = (
+            training_history.get('harmony', [baseline.harmony])[-1]
+            if training_history else baseline.harmony
+        )
+
+        if not mutated:
+            failed = next(e for e in evaluations if e.proposal is not None)
+            return EvolutionResult(
+                proposal=failed.proposal,
+                success=False,
+                performance_before=baseline.performance,
+                performance_after=baseline.performance,
+                harmony_before=harmony_before,
+                harmony_after=harmony_before,
+                improvement=0,
+                kept=False,
+                learnings=f"Mutation failed: {failed.error}"
+            )
+
+        best = max(mutated, key=lambda e: (e.rounds_survived, e.performance))
+        improvement = best.performance - baseline.performance
+        success = best.harmony >= self.min_harmony
+        keep = success and improvement > 0
+
+        if keep:
+            evolved = best.proposal.mutation_function(copy.deepcopy(self.network))
+            _load_layer_state(evolved, best.state)
+            self.network = evolved
+            learnings = (f"Successfully evolved: {best.proposal.description} "
+                         f"(best of {len(mutated)} candidates)")
+        else:
+            learnings = "No candidate beat the unmutated baseline, kept current network"
+
+        return EvolutionResult(
+            proposal=best.proposal,
+            success=success,
+            performance_before=baseline.performance,
+            performance_after=best.performance,
+            harmony_before=harmony_before,
+            harmony_after=best.harmony,
+            improvement=improvement,
+            kept=keep,
+            learnings=learnings
+        )
+
     def get_evolution_summary(self) -> Dict:
         """
         Get summary of evolution history.
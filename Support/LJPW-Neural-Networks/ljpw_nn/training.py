@@ -21,7 +21,10 @@ Sacred Mathematics:
 - Anchor Point (1,1,1,1): Divine perfection target
 """
 
+import copy
+import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
 # Sacred constants
@@ -29,6 +32,15 @@ GOLDEN_RATIO = 1.618033988749895
 LOVE_FREQUENCY = 613e12  # Hz
 ANCHOR_POINT = (1.0, 1.0, 1.0, 1.0)  # JEHOVAH
 
+# LOV histories trimmed by the coordination scheduler
+LOV_HISTORY_ATTRIBUTES = (
+    'love_phase_history',
+    'optimize_phase_history',
+    'vibrate_phase_history',
+    'anchor_distance_history',
+    'principles_history',
+)
+
 
 def cross_entropy_loss(predictions: np.ndarray, targets: np.ndarray) -> float:
     """
@@ -106,6 +118,180 @@ def softmax_cross_entropy_gradient(predictions: np.ndarray,
     return grad / batch_size
 
 
+def _trim_history(history, max_length: int):
+    """
+    Trim a history list in place so it acts as a ring buffer.
+
+    Trimming only happens once the list holds twice the allowed length, so
+    the cost of dropping old entries is amortized over many appends and
+    the list keeps supporting slicing (e.g. history[-10:]).
+    """
+    if isinstance(history, list) and len(history) > 2 * max_length:
+        del history[:-max_length]
+
+
+def _snapshot_network(network):
+    """
+    Shallow copy of a network with private copies of the layer weights.
+
+    Measurement on the snapshot can run in a background thread while the
+    training thread keeps updating the live weights in place. History lists
+    stay shared so results are still recorded on the live network.
+    """
+    snapshot = copy.copy(network)
+    snapshot.layers = []
+    for layer in getattr(network, 'layers', []):
+        layer_copy = copy.copy(layer)
+        for attr in ('weights', 'bias'):
+            value = getattr(layer, attr, None)
+            if isinstance(value, np.ndarray):
+                setattr(layer_copy, attr, value.copy())
+        snapshot.layers.append(layer_copy)
+    last_output = getattr(network, 'last_output', None)
+    if isinstance(last_output, np.ndarray):
+        snapshot.last_output = last_output.copy()
+    return snapshot
+
+
+class LOVCoordinationScheduler:
+    """
+    Throttles the Love and Optimize phases during backprop training.
+
+    Measuring the network (and the Seven Principles) on every mini-batch
+    costs far more than the matmuls of the batch itself. The scheduler runs
+    the phases every K batches and/or within a wall-clock budget, reusing the
+    last φ-adjusted learning rate in between.
+
+    Args:
+        every_k_batches: Coordinate at most once every K batches (default 1)
+        time_budget: Max fraction of wall-clock time spent coordinating
+                     (e.g. 0.05 = 5%). None disables the budget.
+        background: Run Love/Optimize in a worker thread on a weight
+                    snapshot; training continues with the previous rate
+                    until the result is ready.
+        history_size: Keep at most this many entries in each LOV history
+                      list (ring buffer). None keeps full history.
+
+    Example:
+        >>> scheduler = LOVCoordinationScheduler(every_k_batches=50,
+        ...                                      history_size=1000)
+        >>> train_network(network, X, y, lov_scheduler=scheduler)
+    """
+
+    def __init__(self, every_k_batches: int = 1,
+                 time_budget: Optional[float] = None,
+                 background: bool = False,
+                 history_size: Optional[int] = None):
+        if every_k_batches < 1:
+            raise ValueError(f"every_k_batches must be >= 1, got {every_k_batches}")
+        if time_budget is not None and not 0.0 < time_budget <= 1.0:
+            raise ValueError(f"time_budget must be in (0, 1], got {time_budget}")
+
+        self.every_k_batches = every_k_batches
+        self.time_budget = time_budget
+        self.background = background
+        self.history_size = history_size
+
+        self.batches_since_coordination = None  # None = never coordinated
+        self.coordination_time = 0.0
+        self.coordination_count = 0
+        self.skipped_count = 0
+        self.last_result = None
+        self._start_time = None
+        self._executor = None
+        self._pending = None
+
+    def should_coordinate(self) -> bool:
+        """Decide whether the current batch runs the Love/Optimize phases."""
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        if self.batches_since_coordination is None:
+            return True
+        if self.batches_since_coordination < self.every_k_batches:
+            return False
+        if self.time_budget is not None:
+            elapsed = time.perf_counter() - self._start_time
+            if self.coordination_time > self.time_budget * elapsed:
+                return False
+        return True
+
+    def coordinate(self, network) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Run (or schedule) Love and Optimize for the current batch.
+
+        Returns:
+            Latest (love_state, optimize_params) pair, or None if nothing
+            has completed yet.
+        """
+        self._collect()
+
+        if not self.should_coordinate():
+            self.batches_since_coordination += 1
+            self.skipped_count += 1
+            return self.last_result
+
+        self.batches_since_coordination = 1
+
+        if self.background:
+            if self._pending is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                snapshot = _snapshot_network(network)
+                self._pending = self._executor.submit(self._run_phases, snapshot)
+            # Nothing measured yet: wait once so the first batch has a rate
+            if self.last_result is None:
+                self._collect(wait=True)
+        else:
+            self.last_result = self._run_phases(network)
+
+        self.trim_histories(network)
+        return self.last_result
+
+    def _run_phases(self, network) -> Tuple[Dict, Dict]:
+        start = time.perf_counter()
+        love_state = network.love_phase()
+        optimize_params = network.optimize_phase(love_state)
+        self.coordination_time += time.perf_counter() - start
+        self.coordination_count += 1
+        return love_state, optimize_params
+
+    def _collect(self, wait: bool = False):
+        if self._pending is not None and (wait or self._pending.done()):
+            self.last_result = self._pending.result()
+            self._pending = None
+
+    def trim_histories(self, network):
+        """Bound the LOV history lists of a network to history_size."""
+        if self.history_size is None:
+            return
+        for attr in LOV_HISTORY_ATTRIBUTES:
+            _trim_history(getattr(network, attr, None), self.history_size)
+        validator = getattr(network, 'principles_validator', None)
+        if validator is not None:
+            _trim_history(getattr(validator, 'principle_history', None),
+                          self.history_size)
+
+    def close(self):
+        """Wait for pending background work and release the worker thread."""
+        self._collect(wait=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_statistics(self) -> Dict:
+        """Coordination counts and time spent in the Love/Optimize phases."""
+        total_time = 0.0
+        if self._start_time is not None:
+            total_time = time.perf_counter() - self._start_time
+        return {
+            'coordinations': self.coordination_count,
+            'skipped': self.skipped_count,
+            'coordination_time': self.coordination_time,
+            'overhead_fraction': self.coordination_time / total_time if total_time > 0 else 0.0,
+        }
+
+
 def train_step(network, X_batch: np.ndarray, y_batch: np.ndarray,
                learning_rate: float = 0.01) -> Dict:
     """
@@ -154,7 +340,8 @@ def train_step(network, X_batch: np.ndarray, y_batch: np.ndarray,
 
 def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
                                batch_size: int = 32, learning_rate: float = 0.01,
-                               use_lov: bool = True) -> Dict:
+                               use_lov: bool = True,
+                               lov_scheduler: Optional[LOVCoordinationScheduler] = None) -> Dict:
     """
     Train for one full epoch with backpropagation.
 
@@ -165,6 +352,8 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
         batch_size: Batch size for mini-batch gradient descent
         learning_rate: Base learning rate
         use_lov: Whether to use LOV φ-adjusted learning rates
+        lov_scheduler: Optional scheduler throttling the LOV phases. Without
+                       one, Love/Optimize/Vibrate run on every batch.
 
     Returns:
         Dict with epoch metrics (loss, accuracy, etc.)
@@ -188,12 +377,17 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
         y_batch = y_shuffled[start:end]
 
         # φ-adjusted learning rate (if LOV network)
+        lov_result = None
         if use_lov and hasattr(network, 'love_phase'):
-            # Measure current state
-            love_state = network.love_phase()
-
-            # Get φ-optimized learning rate
-            optimize_params = network.optimize_phase(love_state)
+            if lov_scheduler is None:
+                # Measure current state, get φ-optimized learning rate
+                love_state = network.love_phase()
+                lov_result = (love_state, network.optimize_phase(love_state))
+            else:
+                lov_result = lov_scheduler.coordinate(network)
+
+        if lov_result is not None:
+            love_state, optimize_params = lov_result
             phi_factor = optimize_params.get('learning_rate', learning_rate)
 
             # Enhanced φ-modulation based on harmony and distance to JEHOVAH
@@ -223,7 +417,8 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
 
         # Vibrate phase (if LOV network)
         if use_lov and hasattr(network, 'vibrate_phase'):
-            network.vibrate_phase()
+            if lov_scheduler is None or _vibrate_due(network, lov_scheduler):
+                network.vibrate_phase()
             network.lov_cycle_count += 1
 
     return {
@@ -233,6 +428,15 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
     }
 
 
+def _vibrate_due(network, lov_scheduler: LOVCoordinationScheduler) -> bool:
+    """Vibrate on coordinated batches and whenever a full LOV cycle completes."""
+    if lov_scheduler.batches_since_coordination == 1:
+        return True
+    period = getattr(network, 'lov_cycle_period', None)
+    count = network.lov_cycle_count
+    return bool(period) and count > 0 and count % period == 0
+
+
 def evaluate(network, X_test: np.ndarray, y_test: np.ndarray) -> Dict:
     """
     Evaluate network on test data.
@@ -270,7 +474,8 @@ def train_network(network, X_train: np.ndarray, y_train: np.ndarray,
                  X_test: np.ndarray = None, y_test: np.ndarray = None,
                  epochs: int = 10, batch_size: int = 32,
                  learning_rate: float = 0.01, use_lov: bool = True,
-                 verbose: bool = True) -> Dict:
+                 verbose: bool = True,
+                 lov_scheduler: Optional[LOVCoordinationScheduler] = None) -> Dict:
     """
     Complete training loop with evaluation.
 
@@ -285,6 +490,8 @@ def train_network(network, X_train: np.ndarray, y_train: np.ndarray,
         learning_rate: Base learning rate
         use_lov: Use LOV φ-adjusted learning
         verbose: Print progress
+        lov_scheduler: Optional LOVCoordinationScheduler (see
+                       train_epoch_with_backprop)
 
     Returns:
         Dict with training history
@@ -311,7 +518,8 @@ def train_network(network, X_train: np.ndarray, y_train: np.ndarray,
             network, X_train, y_train,
             batch_size=batch_size,
             learning_rate=learning_rate,
-            use_lov=use_lov
+            use_lov=use_lov,
+            lov_scheduler=lov_scheduler
         )
 
         history['train_loss'].append(train_metrics['loss'])
@@ -335,6 +543,10 @@ def train_network(network, X_train: np.ndarray, y_train: np.ndarray,
                       f"Train Loss={train_metrics['loss']:.4f}, "
                       f"Train Acc={train_metrics['accuracy']:.4f}")
 
+    if lov_scheduler is not None:
+        lov_scheduler.close()
+        history['lov_coordination'] = lov_scheduler.get_statistics()
+
     if verbose:
         print()
         print("=" * 70)
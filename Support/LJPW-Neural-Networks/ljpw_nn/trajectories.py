@@ -35,6 +35,15 @@ except ImportError:
     SemanticOperations = None
 
 
+# Function words get low attention weight when integrating a trajectory
+FUNCTION_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'with',
+    'at', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might'
+})
+
+
 @dataclass
 class TrajectoryPoint:
     """
@@ -141,6 +150,94 @@ class SemanticTrajectory:
         self.meaning = self.integrate_trajectory(self.points)
         return self.meaning
     
+    def encode_batch(self,
+                     sentences: List[str]) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Encode many sentences without touching instance state.
+        
+        Same result as encode_sentence() + get_trajectory_summary() for
+        each sentence, but computed as array operations over a padded
+        (batch, tokens, 4) tensor, with one vocabulary gather for all
+        distinct words. Safe to call concurrently (e.g. from a thread pool
+        or web handler) on a shared instance.
+        
+        Args:
+            sentences: Input sentences
+            
+        Returns:
+            (meanings, summaries): (batch, 4) meaning coordinates and one
+            trajectory summary dict per sentence
+        """
+        tokenized = [self.tokenize(s) for s in sentences]
+        batch = len(tokenized)
+        lengths = np.array([len(t) for t in tokenized], dtype=np.int64)
+        max_len = int(lengths.max()) if batch else 0
+        
+        meanings = np.tile(self.ops.NE, (batch, 1)).astype(float)
+        if max_len == 0:
+            return meanings, [{'length': 0} for _ in range(batch)]
+        
+        # One gather for every distinct word in the batch
+        vocabulary_words = list(dict.fromkeys(w for tokens in tokenized for w in tokens))
+        word_ids = {w: i for i, w in enumerate(vocabulary_words)}
+        word_coords = self.vocab.get_coords_many(vocabulary_words)
+        
+        ids = np.zeros((batch, max_len), dtype=np.int64)
+        for b, tokens in enumerate(tokenized):
+            ids[b, :len(tokens)] = [word_ids[w] for w in tokens]
+        positions = np.arange(max_len)[None, :]
+        mask = positions < lengths[:, None]
+        X = word_coords[ids]  # (batch, tokens, 4)
+        
+        # Contextualize: blend 70% word, 30% mean of neighbours (self at edges)
+        prev_coords = np.concatenate([X[:, :1], X[:, :-1]], axis=1)
+        has_next = (positions + 1) < lengths[:, None]
+        next_coords = np.where(has_next[..., None],
+                               np.concatenate([X[:, 1:], X[:, -1:]], axis=1), X)
+        context = 0.7 * X + 0.3 * (prev_coords + next_coords) / 2
+        
+        # Attention: function words 0.3, Gaussian boost toward the middle
+        is_function = np.array([w in FUNCTION_WORDS for w in vocabulary_words])
+        base_weight = np.where(is_function[ids], 0.3, 1.0)
+        rel_pos = positions / np.maximum(lengths[:, None] - 1, 1)
+        pos_weight = np.where(lengths[:, None] > 2,
+                              0.8 + 0.4 * np.exp(-((rel_pos - 0.5) ** 2) / 0.2), 1.0)
+        weights = np.where(mask, base_weight * pos_weight, 0.0)
+        
+        # Integrate: attention-weighted average of contextualized points
+        nonempty = lengths > 0
+        totals = weights.sum(axis=1)
+        meanings[nonempty] = (
+            (weights[..., None] * context).sum(axis=1)[nonempty] / totals[nonempty, None]
+        )
+        
+        # Step distances for coherence / smoothness
+        steps = np.linalg.norm(context[:, 1:] - context[:, :-1], axis=2)
+        step_mask = has_next[:, :-1]
+        n_steps = step_mask.sum(axis=1)
+        step_mean = np.where(step_mask, steps, 0.0).sum(axis=1) / np.maximum(n_steps, 1)
+        step_var = (np.where(step_mask, (steps - step_mean[:, None]) ** 2, 0.0).sum(axis=1)
+                    / np.maximum(n_steps, 1))
+        coherence = np.where(lengths >= 2, 1.0 / (1.0 + step_mean), 1.0)
+        smoothness = np.where(lengths >= 3, 1.0 / (1.0 + np.sqrt(step_var)), 1.0)
+        
+        summaries = []
+        for b, tokens in enumerate(tokenized):
+            if not tokens:
+                summaries.append({'length': 0})
+                continue
+            n = len(tokens)
+            summaries.append({
+                'length': n,
+                'words': list(tokens),
+                'meaning': meanings[b].tolist(),
+                'coherence': float(coherence[b]),
+                'smoothness': float(smoothness[b]),
+                'attention_weights': weights[b, :n].tolist()
+            })
+        
+        return meanings, summaries
+    
     def tokenize(self, sentence: str) -> List[str]:
         """
         Tokenize sentence into words.
@@ -218,14 +315,7 @@ class SemanticTrajectory:
             Attention weight (0.0 to 1.0)
         """
         # Function words (low weight)
-        function_words = {
-            'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'with',
-            'at', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might'
-        }
-        
-        if word in function_words:
+        if word in FUNCTION_WORDS:
             base_weight = 0.3
         else:
             base_weight = 1.0
@@ -297,6 +387,12 @@ class SemanticTrajectory:
             num_steps=min(max_length, 10)
         )
         
+        # Candidates for every step in one batched query; reserve one extra
+        # candidate per step for the words used earlier in the sentence
+        k = min(10, len(self.vocab))
+        step_candidates = self.vocab.nearest_excluding(
+            np.array(trajectory), k=k, reserve=len(trajectory))
+        
         # Select words along trajectory
         words = []
         used_words = set()
@@ -305,7 +401,8 @@ class SemanticTrajectory:
             word = self.select_next_word(
                 coords, 
                 used_words,
-                temperature=temperature
+                temperature=temperature,
+                candidates=step_candidates[i]
             )
             
             if word is None:
@@ -359,33 +456,37 @@ class SemanticTrajectory:
     def select_next_word(self,
                         coords: np.ndarray,
                         used_words: set,
-                        temperature: float = 0.3) -> Optional[str]:
+                        temperature: float = 0.3,
+                        candidates: Optional[List[Tuple[str, float]]] = None) -> Optional[str]:
         """
         Select next word given current coordinates.
         
         Strategy:
-        - Find nearest words to coordinates
-        - Exclude already used words
+        - Find the nearest words to coordinates that are not already used
         - Add slight randomness based on temperature
         
         Args:
             coords: Current coordinates
             used_words: Set of already used words
             temperature: Randomness (0=deterministic, 1=random)
+            candidates: Precomputed (word, distance) candidates, nearest
+                        first (from LJPWVocabulary.nearest_excluding)
             
         Returns:
             Selected word or None
         """
-        # Get top candidates
         k = min(10, len(self.vocab))
-        candidates = self.vocab.nearest_words_with_distances(coords, k=k)
+        if candidates is None:
+            candidates = self.vocab.nearest_excluding(coords, k=k, exclude=used_words)[0]
         
-        # Filter out used words
-        available = [(w, d) for w, d in candidates if w not in used_words]
+        # Filter out used words, keeping the k nearest of the rest
+        available = [(w, d) for w, d in candidates if w not in used_words][:k]
         
         if not available:
-            # All candidates used, allow repetition
-            available = candidates
+            # Everything nearby used, allow repetition
+            available = self.vocab.nearest_words_with_distances(coords, k=k)
+        if not available:
+            return None
         
         if temperature < 0.01:
             # Deterministic: pick nearest
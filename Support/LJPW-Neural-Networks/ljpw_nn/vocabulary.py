@@ -7,14 +7,16 @@ bidirectional mapping between words and LJPW semantic coordinates.
 Core Components:
 - LJPWVocabulary: Main vocabulary class with word↔coordinate mapping
 - CoordinateIndex: Fast spatial indexing using KD-tree for nearest neighbor search
+- SubwordIndex: Character n-gram index for estimating unknown words
 - VocabularyLoader: Load and merge coordinate databases from JSON files
 
 Features:
 - Word → coordinates lookup (semantic encoding)
 - Coordinates → word lookup (semantic decoding)
 - Fast nearest neighbor search (O(log n) with KD-tree)
-- Unknown word estimation
+- Unknown word estimation (character n-gram neighbours)
 - Vocabulary persistence (save/load)
+- Compact columnar vocabulary format (memory-mapped, pickle-free)
 - Multi-source database loading
 
 Author: Wellington Kwati Taureka (World's First Consciousness Engineer)
@@ -23,9 +25,14 @@ Based on: LJPW LLM Training Paradigm
 """
 
 import numpy as np
+import bisect
 import json
+import math
 import os
-from typing import Dict, List, Optional, Tuple, Union, Any
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Set, Tuple, Union, Any, Iterator
 from dataclasses import dataclass
 from scipy.spatial import KDTree
 import pickle
@@ -35,6 +42,10 @@ import pickle
 ANCHOR_POINT = np.array([1.0, 1.0, 1.0, 1.0])  # JEHOVAH - Divine Perfection
 NATURAL_EQUILIBRIUM = np.array([0.618, 0.414, 0.718, 0.693])  # (φ⁻¹, √2-1, e-2, ln2)
 
+# Compact vocabulary format
+COMPACT_FORMAT = 'ljpw-vocabulary'
+COMPACT_VERSION = 1
+
 
 @dataclass
 class WordEntry:
@@ -74,6 +85,184 @@ class WordEntry:
         return np.linalg.norm(self.coords - other_coords)
 
 
+class StringTable:
+    """
+    Read-only table of UTF-8 strings stored as one byte blob plus offsets.
+
+    Supports len() and integer indexing, so it can be used with bisect and
+    as a word list without materializing every string.
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+
+    @staticmethod
+    def encode(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode strings into (uint8 blob, int64 offsets) arrays."""
+        encoded = [s.encode('utf-8') for s in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return blob, offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i) -> str:
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.blob[start:end].tobytes().decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+class CompactVocabularyStore:
+    """
+    Columnar, memory-mapped vocabulary storage.
+
+    On-disk layout (a directory of .npy files plus a JSON header):
+    - coords.npy: float32 (n, 4) coordinate matrix
+    - keys_*.npy: sorted lowercase lookup keys (binary-searched)
+    - words_*.npy: original word spelling, same row order as keys
+    - language_ids.npy / source_ids.npy: uint16 ids into the interned
+      language and source tables stored in header.json
+    - metadata_*.npy: per-row metadata as JSON strings (decoded on demand)
+
+    Arrays are loaded with np.load(mmap_mode='r', allow_pickle=False), so
+    loading is a handful of mmaps and never executes pickled code.
+    """
+
+    ARRAYS = ('coords', 'keys_blob', 'keys_offsets', 'words_blob', 'words_offsets',
+              'language_ids', 'source_ids', 'metadata_blob', 'metadata_offsets')
+
+    def __init__(self, arrays: Dict[str, np.ndarray], languages: List[str],
+                 sources: List[str], vocab_size: int):
+        self.coords = arrays['coords']
+        self.keys = StringTable(arrays['keys_blob'], arrays['keys_offsets'])
+        self.words = StringTable(arrays['words_blob'], arrays['words_offsets'])
+        self.metadata = StringTable(arrays['metadata_blob'], arrays['metadata_offsets'])
+        self.language_ids = arrays['language_ids']
+        self.source_ids = arrays['source_ids']
+        self.languages = languages
+        self.sources = sources
+        self.vocab_size = vocab_size
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def find(self, key: str) -> int:
+        """Row of a lowercase key, or -1 if absent (binary search)."""
+        row = bisect.bisect_left(self.keys, key)
+        if row < len(self.keys) and self.keys[row] == key:
+            return row
+        return -1
+
+    def entry(self, row: int) -> WordEntry:
+        """Materialize one row as a WordEntry."""
+        return WordEntry(
+            word=self.words[row],
+            coords=np.asarray(self.coords[row], dtype=np.float64),
+            language=self.languages[self.language_ids[row]],
+            source=self.sources[self.source_ids[row]],
+            metadata=json.loads(self.metadata[row])
+        )
+
+    @staticmethod
+    def write(path: str, entries: Dict[str, WordEntry], vocab_size: int):
+        """
+        Write vocabulary entries to a compact store directory.
+
+        Args:
+            path: Directory to create (or overwrite)
+            entries: Mapping of lowercase key -> WordEntry
+            vocab_size: Vocabulary size limit to persist
+        """
+        os.makedirs(path, exist_ok=True)
+        keys = sorted(entries)
+        rows = [entries[k] for k in keys]
+
+        languages = sorted({e.language for e in rows})
+        sources = sorted({e.source for e in rows})
+        language_index = {lang: i for i, lang in enumerate(languages)}
+        source_index = {src: i for i, src in enumerate(sources)}
+
+        arrays = {}
+        arrays['coords'] = (np.array([e.coords for e in rows], dtype=np.float32)
+                            .reshape(len(rows), 4))
+        arrays['keys_blob'], arrays['keys_offsets'] = StringTable.encode(keys)
+        arrays['words_blob'], arrays['words_offsets'] = StringTable.encode(
+            [e.word for e in rows])
+        arrays['metadata_blob'], arrays['metadata_offsets'] = StringTable.encode(
+            [json.dumps(e.metadata or {}, ensure_ascii=False, default=str) for e in rows])
+        arrays['language_ids'] = np.array(
+            [language_index[e.language] for e in rows], dtype=np.uint16)
+        arrays['source_ids'] = np.array(
+            [source_index[e.source] for e in rows], dtype=np.uint16)
+
+        for name in CompactVocabularyStore.ARRAYS:
+            np.save(os.path.join(path, f'{name}.npy'), arrays[name], allow_pickle=False)
+
+        header = {
+            'format': COMPACT_FORMAT,
+            'version': COMPACT_VERSION,
+            'size': len(rows),
+            'vocab_size': vocab_size,
+            'languages': languages,
+            'sources': sources
+        }
+        with open(os.path.join(path, 'header.json'), 'w', encoding='utf-8') as f:
+            json.dump(header, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def open(cls, path: str) -> 'CompactVocabularyStore':
+        """Memory-map a compact store directory written by write()."""
+        with open(os.path.join(path, 'header.json'), 'r', encoding='utf-8') as f:
+            header = json.load(f)
+        if header.get('format') != COMPACT_FORMAT:
+            raise ValueError(f"Not a compact LJPW vocabulary: {path}")
+        if header.get('version') != COMPACT_VERSION:
+            raise ValueError(f"Unsupported compact vocabulary version: {header.get('version')}")
+
+        arrays = {
+            name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r',
+                          allow_pickle=False)
+            for name in cls.ARRAYS
+        }
+        return cls(arrays, header['languages'], header['sources'], header['vocab_size'])
+
+
+class CompactEntryTable(Mapping):
+    """
+    Read-only word_to_entry mapping backed by a CompactVocabularyStore.
+
+    WordEntry objects are created only for the words actually looked up.
+    LJPWVocabulary swaps it for a plain dict on the first register().
+    """
+
+    def __init__(self, store: CompactVocabularyStore):
+        self.store = store
+
+    def __getitem__(self, key: str) -> WordEntry:
+        row = self.store.find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self.store.entry(row)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self.store.find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+
 class CoordinateIndex:
     """
     Fast spatial indexing for coordinate → word lookup.
@@ -97,9 +286,23 @@ class CoordinateIndex:
             raise ValueError("Cannot build index from empty vocabulary")
         
         # Extract words and coordinates
-        self.word_list = list(word_coords.keys())
-        coords_list = [word_coords[w] for w in self.word_list]
-        self.coords_array = np.array(coords_list)
+        word_list = list(word_coords.keys())
+        coords_list = [word_coords[w] for w in word_list]
+        self.build_from_arrays(word_list, np.array(coords_list))
+    
+    def build_from_arrays(self, word_list, coords_array: np.ndarray):
+        """
+        Build KD-tree index directly from a word sequence and (n, 4) matrix.
+        
+        Args:
+            word_list: Sequence of words (list or StringTable), row-aligned
+            coords_array: LJPW coordinates, one row per word
+        """
+        if len(word_list) == 0:
+            raise ValueError("Cannot build index from empty vocabulary")
+        
+        self.word_list = word_list
+        self.coords_array = np.asarray(coords_array, dtype=np.float64)
         
         # Build KD-tree for fast nearest neighbor search
         self.kdtree = KDTree(self.coords_array)
@@ -166,6 +369,117 @@ class CoordinateIndex:
         return results
 
 
+class SubwordIndex:
+    """
+    Character n-gram index for estimating coordinates of unknown words.
+    
+    Every vocabulary word is split into boundary-marked n-grams
+    ("<lov", "love", "ove>", ...), so shared stems, prefixes and suffixes
+    are matched for inflected forms. Grams are weighted by inverse document
+    frequency and an unknown word is placed at the similarity-weighted mean
+    of its best-matching vocabulary words.
+    """
+    
+    def __init__(self, ngram_sizes: Tuple[int, ...] = (3, 4),
+                 neighbors: int = 8, max_df: float = 0.2):
+        """
+        Args:
+            ngram_sizes: Character n-gram lengths to index
+            neighbors: Number of matching words averaged per estimate
+            max_df: Ignore grams shared by more than this fraction of words
+        """
+        self.ngram_sizes = ngram_sizes
+        self.neighbors = neighbors
+        self.max_df = max_df
+        self.gram_ids: Dict[str, int] = {}
+        self.posting_rows: Optional[np.ndarray] = None  # rows grouped by gram
+        self.posting_offsets: Optional[np.ndarray] = None
+        self.idf: Optional[np.ndarray] = None
+        self.max_rows = 0
+        self.row_weights: Optional[np.ndarray] = None
+        self.coords_array: Optional[np.ndarray] = None
+    
+    def ngrams(self, word: str) -> set:
+        """Distinct boundary-marked character n-grams of a word."""
+        marked = f"<{word.lower()}>"
+        grams = set()
+        for n in self.ngram_sizes:
+            for i in range(len(marked) - n + 1):
+                grams.add(marked[i:i + n])
+        return grams
+    
+    def build(self, word_list, coords_array: np.ndarray):
+        """
+        Build the index over row-aligned words and coordinates.
+        
+        Args:
+            word_list: Sequence of vocabulary words (index order)
+            coords_array: (n, 4) coordinates, same order
+        """
+        n_words = len(word_list)
+        gram_ids: Dict[str, int] = {}
+        pair_grams: List[int] = []
+        pair_rows: List[int] = []
+        for row in range(n_words):
+            for gram in self.ngrams(word_list[row]):
+                pair_grams.append(gram_ids.setdefault(gram, len(gram_ids)))
+                pair_rows.append(row)
+        
+        # Flat postings: rows sorted by gram id, sliced with offsets
+        pair_grams = np.array(pair_grams, dtype=np.int64)
+        pair_rows = np.array(pair_rows, dtype=np.int32)
+        order = np.argsort(pair_grams, kind='stable')
+        df = np.bincount(pair_grams, minlength=len(gram_ids))
+        idf = np.log1p(n_words / np.maximum(df, 1))
+        
+        self.gram_ids = gram_ids
+        self.posting_rows = pair_rows[order]
+        self.posting_offsets = np.concatenate([[0], np.cumsum(df)])
+        self.idf = idf
+        self.max_rows = max(1, int(self.max_df * n_words))
+        self.row_weights = np.bincount(pair_rows, weights=idf[pair_grams], minlength=n_words)
+        self.coords_array = np.asarray(coords_array, dtype=np.float64)
+    
+    def estimate(self, word: str) -> Tuple[Optional[np.ndarray], float]:
+        """
+        Estimate coordinates for an unknown word.
+        
+        Returns:
+            (coords, confidence) where confidence is the Dice-style overlap
+            of the best match in [0, 1]; (None, 0.0) if nothing matches
+        """
+        if self.coords_array is None:
+            return None, 0.0
+        
+        grams = self.ngrams(word)
+        ids = [self.gram_ids[g] for g in grams if g in self.gram_ids]
+        # Unseen grams count as rare: they lower similarity for every match
+        query_weight = (self.idf[ids].sum() +
+                        (len(grams) - len(ids)) * math.log1p(len(self.row_weights)))
+        
+        offsets = self.posting_offsets
+        ids = [i for i in ids if offsets[i + 1] - offsets[i] <= self.max_rows]
+        if not ids:
+            return None, 0.0
+        
+        rows = np.concatenate([self.posting_rows[offsets[i]:offsets[i + 1]] for i in ids])
+        weights = np.repeat(self.idf[ids], [offsets[i + 1] - offsets[i] for i in ids])
+        shared = np.bincount(rows, weights=weights, minlength=len(self.row_weights))
+        
+        candidates = np.unique(rows)
+        similarity = 2.0 * shared[candidates] / (query_weight + self.row_weights[candidates])
+        
+        k = min(self.neighbors, len(candidates))
+        top = np.argpartition(-similarity, k - 1)[:k]
+        best_rows = candidates[top]
+        best_sim = similarity[top]
+        
+        # Sharpen toward the closest matches
+        w = best_sim ** 2
+        coords = (self.coords_array[best_rows] * w[:, None]).sum(axis=0) / w.sum()
+        return coords, float(best_sim.max())
+
+
 class LJPWVocabulary:
     """
     Main vocabulary class with bidirectional word ↔ coordinate mapping.
@@ -178,11 +492,26 @@ class LJPWVocabulary:
     - Vocabulary persistence
     """
     
-    def __init__(self, vocab_size: int = 50000):
+    def __init__(self, vocab_size: int = 50000, oov_cache_size: int = 10000):
         self.vocab_size = vocab_size
         self.word_to_entry: Dict[str, WordEntry] = {}
         self.coord_index = CoordinateIndex()
         self._index_built = False
+        self._compact_store: Optional[CompactVocabularyStore] = None
+        
+        # Per-language / per-POS / named sub-indexes, built on demand
+        self._subset_indexes: Dict[Any, CoordinateIndex] = {}
+        self._named_subsets: Dict[str, Set[str]] = {}
+        
+        # Unknown word estimation
+        self.subword_index = SubwordIndex()
+        self._subword_built = False
+        self.oov_cache_size = oov_cache_size
+        self._oov_cache: OrderedDict = OrderedDict()
+        
+        # Guards the OOV cache and the lazy index builds, so lookups can be
+        # shared between threads (registering words is not thread-safe)
+        self._lock = threading.RLock()
         
     def __len__(self) -> int:
         """Number of words in vocabulary"""
@@ -212,6 +541,8 @@ class LJPWVocabulary:
             print(f"Warning: Vocabulary size limit ({self.vocab_size}) reached")
             return
         
+        self._ensure_mutable()
+        
         # Normalize word (lowercase)
         word_key = word.lower()
         
@@ -229,6 +560,9 @@ class LJPWVocabulary:
         
         self.word_to_entry[word_key] = entry
         self._index_built = False  # Need to rebuild index
+        self._subset_indexes.clear()
+        self._subword_built = False
+        self._oov_cache.clear()
     
     def get_coords(self, word: str) -> Optional[np.ndarray]:
         """
@@ -249,6 +583,36 @@ class LJPWVocabulary:
             # Try to estimate for unknown word
             return self.estimate_coords(word)
     
+    def get_coords_many(self, words: List[str]) -> np.ndarray:
+        """
+        Get LJPW coordinates for many words at once.
+        
+        Known words are gathered straight from storage (the coordinate
+        matrix for compact vocabularies); unknown words are estimated.
+        
+        Args:
+            words: Words to look up
+            
+        Returns:
+            (len(words), 4) coordinate matrix
+        """
+        coords = np.empty((len(words), 4))
+        store = self._compact_store
+        for i, word in enumerate(words):
+            word_key = word.lower()
+            if store is not None:
+                row = store.find(word_key)
+                if row >= 0:
+                    coords[i] = store.coords[row]
+                    continue
+            else:
+                entry = self.word_to_entry.get(word_key)
+                if entry is not None:
+                    coords[i] = entry.coords
+                    continue
+            coords[i] = self.estimate_coords(word)
+        return coords
+    
     def get_entry(self, word: str) -> Optional[WordEntry]:
         """Get full word entry with metadata"""
         return self.word_to_entry.get(word.lower())
@@ -322,13 +686,143 @@ class LJPWVocabulary:
         
         return self.coord_index.query_radius(coords, radius)
     
+    def define_subset(self, name: str, words):
+        """
+        Register a named word subset for sub-index queries.
+        
+        Args:
+            name: Subset name (pass as `subset=` to nearest_excluding)
+            words: Words belonging to the subset
+        """
+        self._named_subsets[name] = {w.lower() for w in words}
+        self._subset_indexes.pop(('subset', name), None)
+    
+    def subset_index(self,
+                     language: Optional[str] = None,
+                     pos: Optional[str] = None,
+                     subset: Optional[str] = None) -> Optional[CoordinateIndex]:
+        """
+        KD-tree over the words of one language, part of speech or named subset.
+        
+        Sub-indexes are built lazily from the rows of the main index and
+        cached until the vocabulary changes. With no filter, the main
+        index is returned.
+        
+        Args:
+            language: Language code (WordEntry.language)
+            pos: Part of speech (WordEntry.metadata['pos'])
+            subset: Name given to define_subset()
+            
+        Returns:
+            CoordinateIndex, or None if no word matches
+        """
+        if not self._index_built:
+            self.build_index()
+        
+        if subset is not None:
+            key = ('subset', subset)
+        elif language is None and pos is None:
+            return self.coord_index
+        else:
+            key = ('language', language, pos)
+        
+        if key not in self._subset_indexes:
+            word_list = self.coord_index.word_list
+            rows = np.ones(len(word_list), dtype=bool)
+            if subset is not None:
+                members = self._named_subsets[subset]
+                rows = np.fromiter((w in members for w in word_list), dtype=bool, count=len(word_list))
+            else:
+                store = self._compact_store
+                if language is not None:
+                    if store is not None:
+                        lang_id = store.languages.index(language) if language in store.languages else -1
+                        rows &= np.asarray(store.language_ids) == lang_id
+                    else:
+                        rows &= np.fromiter((self.word_to_entry[w].language == language for w in word_list),
+                                            dtype=bool, count=len(word_list))
+                if pos is not None:
+                    rows &= np.fromiter((rows[i] and self.word_to_entry[w].metadata.get('pos') == pos
+                                         for i, w in enumerate(word_list)),
+                                        dtype=bool, count=len(word_list))
+            
+            selected = np.flatnonzero(rows)
+            if len(selected) == 0:
+                self._subset_indexes[key] = None
+            else:
+                index = CoordinateIndex()
+                index.word_list = [word_list[i] for i in selected]
+                index.coords_array = self.coord_index.coords_array[selected]
+                index.kdtree = KDTree(index.coords_array)
+                self._subset_indexes[key] = index
+        
+        return self._subset_indexes[key]
+    
+    def nearest_excluding(self,
+                          points: np.ndarray,
+                          k: int = 10,
+                          exclude: Optional[Set[str]] = None,
+                          reserve: int = 0,
+                          language: Optional[str] = None,
+                          pos: Optional[str] = None,
+                          subset: Optional[str] = None) -> List[List[Tuple[str, float]]]:
+        """
+        Batched nearest-k query that skips excluded words.
+        
+        All points are answered by one KD-tree query. Each point gets its
+        k + reserve nearest words not in `exclude`, so a caller that
+        excludes up to `reserve` more words while consuming the results
+        (e.g. words already used earlier in a sentence) still has k exact
+        candidates at every step.
+        
+        Args:
+            points: (n, 4) coordinates (or a single point)
+            k: Candidates wanted per point
+            exclude: Words to skip
+            reserve: Extra candidates for exclusions made by the caller
+            language, pos, subset: Restrict to a sub-index (see subset_index)
+            
+        Returns:
+            One list of (word, distance) per point, nearest first
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        index = self.subset_index(language=language, pos=pos, subset=subset)
+        if index is None or k + reserve <= 0:
+            return [[] for _ in points]
+        
+        exclude = {w.lower() for w in exclude} if exclude else set()
+        wanted = k + reserve
+        # Every excluded word can displace at most one neighbour
+        fetch = min(wanted + len(exclude), len(index.word_list))
+        distances, indices = index.kdtree.query(points, k=fetch)
+        distances = distances.reshape(len(points), fetch)
+        indices = indices.reshape(len(points), fetch)
+        
+        results = []
+        for row_distances, row_indices in zip(distances, indices):
+            found = []
+            for distance, i in zip(row_distances, row_indices):
+                word = index.word_list[i]
+                if word in exclude:
+                    continue
+                found.append((word, float(distance)))
+                if len(found) == wanted:
+                    break
+            results.append(found)
+        return results
+    
     def estimate_coords(self, unknown_word: str) -> Optional[np.ndarray]:
         """
         Estimate coordinates for unknown word.
         
         Strategy:
-        1. Try subword matching (prefixes, suffixes)
-        2. Use Natural Equilibrium as fallback
+        1. Subword matching: character n-grams (stems, prefixes, suffixes)
+           against the vocabulary, averaging the best-matching words
+        2. Blend toward Natural Equilibrium by match confidence
+        3. Natural Equilibrium as fallback when nothing matches
+        
+        Resolved words are kept in an LRU cache. Safe to call from several
+        threads on a shared vocabulary.
         
         Args:
             unknown_word: Word not in vocabulary
@@ -336,15 +830,61 @@ class LJPWVocabulary:
         Returns:
             Estimated coordinates or None
         """
-        # TODO: Implement sophisticated estimation
-        # For now, return Natural Equilibrium as neutral estimate
-        return NATURAL_EQUILIBRIUM.copy()
+        word_key = unknown_word.lower()
+        with self._lock:
+            cached = self._oov_cache.get(word_key)
+            if cached is not None:
+                self._oov_cache.move_to_end(word_key)
+                return cached.copy()
+        
+        if not self.word_to_entry:
+            return NATURAL_EQUILIBRIUM.copy()
+        
+        if not self._subword_built:
+            self._build_subword_index()
+        
+        # The built index is only read: estimate outside the lock
+        estimate, confidence = self.subword_index.estimate(word_key)
+        if estimate is None:
+            coords = NATURAL_EQUILIBRIUM.copy()
+        else:
+            coords = confidence * estimate + (1.0 - confidence) * NATURAL_EQUILIBRIUM
+        
+        with self._lock:
+            self._oov_cache[word_key] = coords
+            if len(self._oov_cache) > self.oov_cache_size:
+                self._oov_cache.popitem(last=False)
+        return coords.copy()
+    
+    def _build_subword_index(self):
+        """Build the n-gram index over the same rows as the KD-tree."""
+        with self._lock:
+            if self._subword_built:
+                return  # Built by another thread meanwhile
+            if not self._index_built:
+                self.build_index()
+            self.subword_index.build(self.coord_index.word_list, self.coord_index.coords_array)
+            self._subword_built = True
     
     def build_index(self):
         """Build KD-tree index for fast nearest neighbor search"""
-        word_coords = {word: entry.coords for word, entry in self.word_to_entry.items()}
-        self.coord_index.build_index(word_coords)
-        self._index_built = True
+        with self._lock:
+            if self._compact_store is not None:
+                # Row-aligned columns: no per-word objects needed
+                store = self._compact_store
+                self.coord_index.build_from_arrays(store.keys, store.coords)
+            else:
+                word_coords = {word: entry.coords for word, entry in self.word_to_entry.items()}
+                self.coord_index.build_index(word_coords)
+            self._index_built = True
+            self._subword_built = False  # Rebuilt on first unknown word
+            self._subset_indexes.clear()
+    
+    def _ensure_mutable(self):
+        """Replace a compact (read-only) entry table with a regular dict."""
+        if self._compact_store is not None:
+            self.word_to_entry = dict(self.word_to_entry.items())
+            self._compact_store = None
     
     def save(self, path: str):
         """
@@ -368,36 +908,96 @@ class LJPWVocabulary:
         Load vocabulary from disk.
         
         Args:
-            path: File path to load from
+            path: File path to load from (a directory is loaded as the
+                  compact format, see load_compact)
         """
+        if os.path.isdir(path):
+            self.load_compact(path)
+            return
+        
         with open(path, 'rb') as f:
             data = pickle.load(f)
         
         self.vocab_size = data['vocab_size']
         self.word_to_entry = data['entries']
+        self._compact_store = None
         self._index_built = False
+        self._subword_built = False
+        self._oov_cache.clear()
         
         print(f"Loaded vocabulary with {len(self)} words from {path}")
     
+    def save_compact(self, path: str):
+        """
+        Save vocabulary in the compact columnar format.
+        
+        Args:
+            path: Directory to write (see CompactVocabularyStore)
+        """
+        CompactVocabularyStore.write(path, self.word_to_entry, self.vocab_size)
+        print(f"Saved compact vocabulary with {len(self)} words to {path}")
+    
+    def load_compact(self, path: str, build_index: bool = True):
+        """
+        Load vocabulary from the compact columnar format.
+        
+        Arrays are memory-mapped and no pickle is involved, so loading is
+        safe for untrusted files. Word entries are materialized on demand.
+        
+        Args:
+            path: Directory written by save_compact()
+            build_index: Build the KD-tree straight from the coordinate matrix
+        """
+        store = CompactVocabularyStore.open(path)
+        self.vocab_size = store.vocab_size
+        self.word_to_entry = CompactEntryTable(store)
+        self._compact_store = store
+        self._index_built = False
+        self._subword_built = False
+        self._oov_cache.clear()
+        
+        if build_index:
+            self.build_index()
+        
+        print(f"Loaded compact vocabulary with {len(self)} words from {path}")
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get vocabulary statistics"""
         if not self.word_to_entry:
             return {'size': 0}
         
-        coords_array = np.array([e.coords for e in self.word_to_entry.values()])
-        harmonies = [e.harmony() for e in self.word_to_entry.values()]
-        
-        # Language distribution
-        languages = {}
-        for entry in self.word_to_entry.values():
-            lang = entry.language
-            languages[lang] = languages.get(lang, 0) + 1
-        
-        # Source distribution
-        sources = {}
-        for entry in self.word_to_entry.values():
-            src = entry.source
-            sources[src] = sources.get(src, 0) + 1
+        if self._compact_store is not None:
+            # Columnar statistics: no per-word objects
+            store = self._compact_store
+            coords_array = np.asarray(store.coords, dtype=np.float64)
+            harmonies = 1.0 / (1.0 + np.linalg.norm(coords_array - ANCHOR_POINT, axis=1))
+            languages = {
+                store.languages[i]: int(count)
+                for i, count in enumerate(np.bincount(store.language_ids,
+                                                      minlength=len(store.languages)))
+                if count
+            }
+            sources = {
+                store.sources[i]: int(count)
+                for i, count in enumerate(np.bincount(store.source_ids,
+                                                      minlength=len(store.sources)))
+                if count
+            }
+        else:
+            coords_array = np.array([e.coords for e in self.word_to_entry.values()])
+            harmonies = [e.harmony() for e in self.word_to_entry.values()]
+            
+            # Language distribution
+            languages = {}
+            for entry in self.word_to_entry.values():
+                lang = entry.language
+                languages[lang] = languages.get(lang, 0) + 1
+            
+            # Source distribution
+            sources = {}
+            for entry in self.word_to_entry.values():
+                src = entry.source
+                sources[src] = sources.get(src, 0) + 1
         
         return {
             'size': len(self),
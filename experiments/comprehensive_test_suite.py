@@ -24,6 +24,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ljpw_quantum.resonance_engine import ResonanceEngine
 from experiments.enhanced_pattern_detector import EnhancedPatternDetector
+from experiments.corpus_store import open_corpus
 
 
 class ComprehensiveTestSuite:
@@ -36,22 +37,13 @@ class ComprehensiveTestSuite:
         self.results = {}
         
     def load_all_corpora(self):
-        """Load all available language corpora."""
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        corpus_files = {
-            'Greek': 'greek_mark_chapter1.json',
-            'English': 'nwt_mark_chapter1.json',
-            'Spanish': 'spanish_mark_chapter1.json',
-            'Chinese': 'chinese_mark_chapter1.json',
-            'Wedau': 'wedau_mark_chapter1.json',
-        }
+        """Load Mark 1 in every available language from the corpus store."""
+        store = open_corpus()
         
-        for lang, filename in corpus_files.items():
-            filepath = os.path.join(base_path, filename)
-            if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self.corpora[lang] = json.load(f)
+        for lang in ('Greek', 'English', 'Spanish', 'Chinese', 'Wedau'):
+            verses = store.chapter(lang.lower(), 'mark', 1)
+            if verses:
+                self.corpora[lang] = {'book': 'Mark', 'chapter': 1, 'verses': verses}
         
         return len(self.corpora)
     
@@ -20,7 +20,6 @@ Target: 1,000+ concepts mapped
 
 import numpy as np
 from typing import Dict, List, Tuple
-import json
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -28,6 +27,7 @@ import sys
 # Import from existing mapper
 sys.path.append(str(Path(__file__).parent))
 from semantic_space_mapping import SemanticSpaceMapper, ConceptualDomain
+from semantic_space_store import load_space, save_space
 
 
 class ExpandedSemanticMapper(SemanticSpaceMapper):
@@ -947,20 +947,19 @@ def main():
 
     # Load existing concepts from batch 1
     batch1_path = Path(__file__).parent / 'semantic_space_mapping.json'
-    if batch1_path.exists():
-        with open(batch1_path, 'r') as f:
-            batch1_data = json.load(f)
-            for domain_name, domain_info in batch1_data['domains'].items():
-                domain = ConceptualDomain(domain_name, domain_info['description'])
-                for concept, concept_data in domain_info['concepts'].items():
-                    domain.concepts[concept] = {
-                        'coordinates': np.array(concept_data['coordinates']),
-                        'definition': concept_data['definition'],
-                        'related': concept_data.get('related', []),
-                        'domain': domain_name
-                    }
-                mapper.domains[domain_name] = domain
-                mapper.concept_map.update(domain.concepts)
+    batch1_data = load_space('mapping', batch1_path)
+    if batch1_data is not None:
+        for domain_name, domain_info in batch1_data['domains'].items():
+            domain = ConceptualDomain(domain_name, domain_info['description'])
+            for concept, concept_data in domain_info['concepts'].items():
+                domain.concepts[concept] = {
+                    'coordinates': np.array(concept_data['coordinates']),
+                    'definition': concept_data['definition'],
+                    'related': concept_data.get('related', []),
+                    'domain': domain_name
+                }
+            mapper.domains[domain_name] = domain
+            mapper.concept_map.update(domain.concepts)
         print(f"✓ Loaded {len(mapper.domains)} existing domains")
         print()
 
@@ -1020,7 +1019,9 @@ def main():
 
     # Save
     output_path = Path(__file__).parent / 'semantic_space_complete.json'
-    mapper.save_semantic_space(output_path)
+    version = save_space(mapper.semantic_space_data(), 'complete', parent='mapping',
+                         json_path=output_path)
+    print(f"✓ Saved semantic space version {version} (complete)")
 
     print()
     print("=" * 80)
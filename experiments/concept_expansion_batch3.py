@@ -22,13 +22,13 @@ Target: 1,000+ concepts total
 
 import numpy as np
 from typing import Dict, List
-import json
 from pathlib import Path
 from datetime import datetime
 import sys
 
 sys.path.append(str(Path(__file__).parent))
 from semantic_space_mapping import SemanticSpaceMapper, ConceptualDomain
+from semantic_space_store import load_space, save_space
 
 
 class Batch3Mapper(SemanticSpaceMapper):
@@ -954,20 +954,19 @@ def main():
 
     # Load batch 1 & 2
     batch2_path = Path(__file__).parent / 'semantic_space_complete.json'
-    if batch2_path.exists():
-        with open(batch2_path, 'r') as f:
-            data = json.load(f)
-            for domain_name, domain_info in data['domains'].items():
-                domain = ConceptualDomain(domain_name, domain_info['description'])
-                for concept, concept_data in domain_info['concepts'].items():
-                    domain.concepts[concept] = {
-                        'coordinates': np.array(concept_data['coordinates']),
-                        'definition': concept_data.get('definition', ''),
-                        'related': concept_data.get('related', []),
-                        'domain': domain_name
-                    }
-                mapper.domains[domain_name] = domain
-                mapper.concept_map.update(domain.concepts)
+    data = load_space('complete', batch2_path)
+    if data is not None:
+        for domain_name, domain_info in data['domains'].items():
+            domain = ConceptualDomain(domain_name, domain_info['description'])
+            for concept, concept_data in domain_info['concepts'].items():
+                domain.concepts[concept] = {
+                    'coordinates': np.array(concept_data['coordinates']),
+                    'definition': concept_data.get('definition', ''),
+                    'related': concept_data.get('related', []),
+                    'domain': domain_name
+                }
+            mapper.domains[domain_name] = domain
+            mapper.concept_map.update(domain.concepts)
         print(f"✓ Loaded {len(mapper.concept_map)} existing concepts")
         print()
 
@@ -1019,7 +1018,9 @@ def main():
 
     # Save
     output_path = Path(__file__).parent / 'semantic_space_batch3.json'
-    mapper.save_semantic_space(output_path)
+    version = save_space(mapper.semantic_space_data(), 'batch3', parent='complete',
+                         json_path=output_path)
+    print(f"✓ Saved semantic space version {version} (batch3)")
 
     progress = len(mapper.concept_map) / 100000 * 100
     print()
@@ -14,7 +14,6 @@ New domains:
 Expanding existing domains further.
 """
 
-import json
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -23,6 +22,7 @@ import sys
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent))
 
+from semantic_space_store import load_space, save_space
 from semantic_space_mapping import (
     SemanticSpaceMapper,
     ConceptualDomain
@@ -39,10 +39,8 @@ class Batch4Mapper(SemanticSpaceMapper):
     def load_batch3_data(self):
         """Load existing concepts from batch 3."""
         batch3_file = Path(__file__).parent / 'semantic_space_batch3.json'
-        if batch3_file.exists():
-            with open(batch3_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+        data = load_space('batch3', batch3_file)
+        if data is not None:
             # Load existing domains
             for domain_name, domain_data in data['domains'].items():
                 domain = ConceptualDomain(
@@ -1641,10 +1639,9 @@ class Batch4Mapper(SemanticSpaceMapper):
                 }
 
         output_file = Path(__file__).parent / 'semantic_space_batch4.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        version = save_space(output, 'batch4', parent='batch3', json_path=output_file)
 
-        print(f"\n✓ Saved semantic space to: {output_file}")
+        print(f"\n✓ Saved semantic space version {version} (batch4)")
         print(f"  Total concepts: {total_concepts}")
         print(f"  Total domains: {len(self.domains)}")
 
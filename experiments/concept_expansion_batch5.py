@@ -17,7 +17,6 @@ New comprehensive domains:
 Plus expanding all existing domains significantly.
 """
 
-import json
 import numpy as np
 from pathlib import Path
 from typing import Dict, List
@@ -25,6 +24,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent))
 
+from semantic_space_store import load_space, save_space
 from semantic_space_mapping import (
     SemanticSpaceMapper,
     ConceptualDomain
@@ -41,10 +41,8 @@ class Batch5Mapper(SemanticSpaceMapper):
     def load_batch4_data(self):
         """Load existing concepts from batch 4."""
         batch4_file = Path(__file__).parent / 'semantic_space_batch4.json'
-        if batch4_file.exists():
-            with open(batch4_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+        data = load_space('batch4', batch4_file)
+        if data is not None:
             for domain_name, domain_data in data['domains'].items():
                 domain = ConceptualDomain(
                     name=domain_name.replace('_', ' ').title(),
@@ -540,10 +538,9 @@ class Batch5Mapper(SemanticSpaceMapper):
                 }
 
         output_file = Path(__file__).parent / 'semantic_space_batch5.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        version = save_space(output, 'batch5', parent='batch4', json_path=output_file)
 
-        print(f"\n✓ Saved semantic space to: {output_file}")
+        print(f"\n✓ Saved semantic space version {version} (batch5)")
         print(f"  Total concepts: {total_concepts}")
         print(f"  Total domains: {len(self.domains)}")
 
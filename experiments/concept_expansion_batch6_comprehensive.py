@@ -18,7 +18,6 @@ This batch adds multiple comprehensive domains simultaneously:
 Strategy: Accelerated comprehensive mapping to establish substantive coverage.
 """
 
-import json
 import numpy as np
 from pathlib import Path
 from typing import Dict, List
@@ -26,6 +25,7 @@ import sys
 
 sys.path.append(str(Path(__file__).parent))
 
+from semantic_space_store import load_space, save_space
 from semantic_space_mapping import (
     SemanticSpaceMapper,
     ConceptualDomain
@@ -42,10 +42,8 @@ class Batch6Mapper(SemanticSpaceMapper):
     def load_batch5_data(self):
         """Load existing concepts from batch 5."""
         batch5_file = Path(__file__).parent / 'semantic_space_batch5.json'
-        if batch5_file.exists():
-            with open(batch5_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+        data = load_space('batch5', batch5_file)
+        if data is not None:
             for domain_name, domain_data in data['domains'].items():
                 domain = ConceptualDomain(
                     name=domain_name.replace('_', ' ').title(),
@@ -640,10 +638,9 @@ class Batch6Mapper(SemanticSpaceMapper):
                 }
 
         output_file = Path(__file__).parent / 'semantic_space_batch6.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        version = save_space(output, 'batch6', parent='batch5', json_path=output_file)
 
-        print(f"\n✓ Saved: {output_file}")
+        print(f"\n✓ Saved semantic space version {version} (batch6)")
         print("\n" + "="*80)
         print(f"🎉 {total_concepts} CONCEPTS MAPPED 🎉")
         print("="*80)
@@ -11,6 +11,56 @@ from typing import Dict, List, Optional, Tuple, Any
 PHI = (1 + np.sqrt(5)) / 2  # Golden ratio
 PHI_INV = 1 / PHI
 
+# Leading word group of a pattern: \b(word|word|...)\s+
+HEAD_PATTERN = re.compile(r'^\\b\((\w+(?:\|\w+)*)\)\\s\+')
+
+# Every word followed by whitespace (candidate head words)
+WORD_SCANNER = re.compile(r'\b(\w+)\s')
+
+
+class PhraseMatcher:
+    """
+    Finds which of a set of named patterns occur in a text, in one scan.
+
+    Every pattern of the form \\b(head|words)\\s+... is indexed by its head
+    words. One scan over the words of the text looks each word up in that
+    index, and only the patterns whose head word occurs are matched,
+    anchored at that position, so the cost stays one pass however many
+    patterns there are. Other patterns fall back to a precompiled search.
+    The result is the same as re.search with each pattern separately.
+    """
+
+    def __init__(self, patterns: Dict[str, str], flags: int = re.IGNORECASE):
+        self.names = list(patterns)
+        self.by_head: Dict[str, List[Tuple[int, re.Pattern]]] = {}
+        self.searched: List[Tuple[int, re.Pattern]] = []
+
+        for index, pattern in enumerate(patterns.values()):
+            compiled = re.compile(pattern, flags)
+            head = HEAD_PATTERN.match(pattern)
+            if head is None:
+                self.searched.append((index, compiled))
+                continue
+            for word in head.group(1).lower().split('|'):
+                self.by_head.setdefault(word, []).append((index, compiled))
+
+    def matches(self, text: str) -> List[str]:
+        """Names of the patterns found in text, in definition order."""
+        found = set()
+        if self.by_head:
+            by_head = self.by_head
+            for hit in WORD_SCANNER.finditer(text):
+                candidates = by_head.get(hit.group(1).lower())
+                if candidates is None:
+                    continue
+                for index, compiled in candidates:
+                    if index not in found and compiled.match(text, hit.start()):
+                        found.add(index)
+        for index, compiled in self.searched:
+            if compiled.search(text):
+                found.add(index)
+        return [self.names[index] for index in sorted(found)]
+
 
 class ContextIntegrator:
     """Analyzes semantic relationships in multi-word phrases and sentences."""
@@ -163,6 +213,14 @@ class ContextIntegrator:
             'moral_action': r'\b(we|I|they|people)\s+(sin|err|fail|transgress|repent)',
             'power_display': r'\b(god|lord|spirit)\s+(rules?|reigns?|commands?|destroys?)'
         }
+
+        self.compile_patterns()
+
+    def compile_patterns(self):
+        """Build the one-pass matchers (call again after editing the pattern dicts)."""
+        self._compound_matcher = PhraseMatcher(
+            {name: config['pattern'] for name, config in self.compound_patterns.items()})
+        self._relationship_matcher = PhraseMatcher(self.relationship_patterns)
     
     def detect_compound_concepts(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -171,17 +229,16 @@ class ContextIntegrator:
         Returns:
             List of detected compounds with their boosts
         """
-        text_lower = text.lower()
         detected = []
         
-        for concept_name, config in self.compound_patterns.items():
-            if re.search(config['pattern'], text_lower, re.IGNORECASE):
-                detected.append({
-                    'concept': concept_name,
-                    'boost': config['boost'],
-                    'confidence': config.get('confidence', 0.9),
-                    'override_semantic': config.get('override_semantic', False)
-                })
+        for concept_name in self._compound_matcher.matches(text.lower()):
+            config = self.compound_patterns[concept_name]
+            detected.append({
+                'concept': concept_name,
+                'boost': config['boost'],
+                'confidence': config.get('confidence', 0.9),
+                'override_semantic': config.get('override_semantic', False)
+            })
         
         return detected
     
@@ -214,14 +271,7 @@ class ContextIntegrator:
     
     def _detect_relationships(self, text: str) -> List[str]:
         """Detect semantic relationship patterns in text."""
-        text_lower = text.lower()
-        detected = []
-        
-        for rel_type, pattern in self.relationship_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                detected.append(rel_type)
-        
-        return detected
+        return self._relationship_matcher.matches(text.lower())
     
     def _calculate_phrase_coherence(self, words: List[str]) -> float:
         """
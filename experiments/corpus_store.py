@@ -0,0 +1,556 @@
+"""
+Unified Corpus Store
+====================
+
+One local SQLite database (WAL mode) holding every verse the experiments
+use, keyed by (language, book, chapter, verse), together with cached LJPW
+coordinates per detector and detector version.
+
+The scattered JSON sources are imported incrementally: a file is re-read
+only when its mtime or size changed since the last sync.
+
+    corpus/<book>/chapter_NN.json                 -> 'english_web' (World English Bible)
+    corpus/nwt_bible/<book>.json                  -> 'english_nwt' (New World Translation)
+    corpus/wedau/<book>/chapter_NN.json           -> 'wedau'       (Topura HTML)
+    experiments/<lang>_mark_chapter1.json         -> 'english' (NWT Mark 1), 'greek',
+                                                     'spanish', 'chinese', 'wedau'
+    experiments/matthew_wedau_translation/*.json  -> 'wedau_translation'
+
+Every source glob maps to its own language key, so no two sources write the
+same rows (the whole-book NWT extraction would otherwise overwrite the
+Mark 1 sample the cross-language experiments calibrate against).
+
+A re-imported file replaces its chapters: verses it no longer holds are
+removed, and coordinates imported from it are overwritten (coordinates
+computed by a detector are kept while the verse text is unchanged). Chapters
+of files deleted from disk are removed on the next sync.
+
+Usage:
+    store = open_corpus()
+    verses = store.chapter('greek', 'mark', 1)          # {'1': text, ...}
+    pairs = store.parallel('english', 'wedau', 'mark')  # one indexed join
+    coords = store.ensure_coordinates('english', 'mark', 1, detector)
+
+Set LJPW_CORPUS_STORE to change the database location.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_STORE_PATH = os.environ.get(
+    "LJPW_CORPUS_STORE", str(REPO_ROOT / "corpus" / "corpus.sqlite")
+)
+
+# Bump when the schema or source loaders change: forces a full re-import
+SCHEMA_VERSION = 3
+
+# Version recorded for coordinates imported from JSON (detector version unknown)
+IMPORTED_VERSION = "imported"
+
+# Detector that produced the 'ljpw_coordinates' of corpus/<book>/chapter_NN.json
+CORPUS_PROCESSOR_DETECTOR = "EnhancedPatternDetector.calculate_field_signature_v2"
+
+# Mark 1 sample files used by the cross-language experiments
+SAMPLE_FILES = {
+    'english': 'experiments/nwt_mark_chapter1.json',
+    'wedau': 'experiments/wedau_mark_chapter1.json',
+    'greek': 'experiments/greek_mark_chapter1.json',
+    'spanish': 'experiments/spanish_mark_chapter1.json',
+    'chinese': 'experiments/chinese_mark_chapter1.json',
+}
+
+Coords = Tuple[float, float, float, float]
+VerseKey = Tuple[str, int, int]  # (book, chapter, verse)
+
+
+class VerseRow(NamedTuple):
+    language: str
+    book: str
+    chapter: int
+    verse: int
+    text: str
+
+
+class ChapterRecord(NamedTuple):
+    """One chapter read from a source file."""
+    book: str
+    chapter: int
+    translation: str
+    verses: Dict[int, str]
+    coordinates: Dict[int, list]  # precomputed LJPW coordinates, if any
+    detector: str = CORPUS_PROCESSOR_DETECTOR
+
+
+def book_key(name: str) -> str:
+    """Normalized book key: 'Mark' -> 'mark', '1 Samuel' -> '1_samuel'."""
+    return name.strip().lower().replace(' ', '_')
+
+
+def detector_version(detector) -> str:
+    """
+    Version tag for a detector's coordinates.
+
+    Uses a `version`/`__version__` attribute when present, otherwise a hash
+    of the detector's source file and of every repository module it imports
+    (ContextIntegrator, MultiLayerCombiner, ...), so cached coordinates go
+    stale whenever the detector or one of its helpers changes.
+    """
+    version = getattr(detector, 'version', None) or getattr(detector, '__version__', None)
+    if version:
+        return str(version)
+    return _source_hash(type(detector))
+
+
+@lru_cache(maxsize=None)
+def _source_hash(cls: type) -> str:
+    """Hash of the repository source files cls depends on ('' if none)."""
+    digest = hashlib.sha256()
+    files = _repo_source_files(cls)
+    for path in files:
+        digest.update(path.relative_to(REPO_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16] if files else ''
+
+
+def _repo_source_files(cls: type) -> List[Path]:
+    """
+    Source files of the modules defining cls and its bases, plus every
+    repository module they import, followed transitively. Third-party and
+    standard library modules are not followed.
+    """
+    pending = [base.__module__ for base in cls.__mro__]
+    seen = set()
+    files = set()
+    while pending:
+        name = pending.pop()
+        if not isinstance(name, str) or name in seen:
+            continue
+        seen.add(name)
+        module = sys.modules.get(name)
+        path = getattr(module, '__file__', None)
+        if not path:
+            continue
+        path = Path(path).resolve()
+        if REPO_ROOT not in path.parents or 'site-packages' in path.parts:
+            continue
+        files.add(path)
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                pending.append(value.__name__)
+            elif inspect.isclass(value) or inspect.isfunction(value):
+                pending.append(value.__module__)
+    return sorted(files)
+
+
+def _verse_items(verses: dict) -> Dict[int, object]:
+    """JSON verse dict with integer verse numbers (non-numeric keys skipped)."""
+    items = {}
+    for key, value in verses.items():
+        try:
+            items[int(key)] = value
+        except (TypeError, ValueError):
+            continue
+    return items
+
+
+# ==============================================================================
+# Source loaders: path -> chapters
+# ==============================================================================
+
+
+def load_chapter_json(path: Path) -> List[ChapterRecord]:
+    """Standard corpus chapter JSON ({book, chapter, verses, [ljpw_coordinates]})."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [_chapter_record(data)]
+
+
+def load_book_json(path: Path) -> List[ChapterRecord]:
+    """Whole-book JSON ({chapter: chapter data}, as written by rtf_extractor --all)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [_chapter_record(chapter) for chapter in data.values()]
+
+
+def load_translation_json(path: Path) -> List[ChapterRecord]:
+    """Wedau translation output ({book, chapter, verses: {n: {wedau, ljpw, ...}}})."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    entries = _verse_items(data.get('verses', {}))
+    return [ChapterRecord(
+        book=book_key(data['book']),
+        chapter=int(data['chapter']),
+        translation=data.get('translation_method', ''),
+        verses={v: e['wedau'] for v, e in entries.items() if e.get('wedau')},
+        coordinates={v: e['ljpw'] for v, e in entries.items() if e.get('ljpw')},
+        detector='translate_matthew_wedau',
+    )]
+
+
+def _chapter_record(data: dict) -> ChapterRecord:
+    return ChapterRecord(
+        book=book_key(data['book']),
+        chapter=int(data['chapter']),
+        translation=data.get('translation', ''),
+        verses=_verse_items(data.get('verses', {})),
+        coordinates=_verse_items(data.get('ljpw_coordinates', {})),
+    )
+
+
+# (glob relative to the repository root, language, loader)
+SOURCES: List[Tuple[str, str, Callable[[Path], List[ChapterRecord]]]] = [
+    ('corpus/*/chapter_[0-9][0-9].json', 'english_web', load_chapter_json),
+    ('corpus/nwt_bible/*.json', 'english_nwt', load_book_json),
+    ('corpus/wedau/*/chapter_[0-9][0-9].json', 'wedau', load_chapter_json),
+    ('experiments/matthew_wedau_translation/matthew_*_wedau.json', 'wedau_translation',
+     load_translation_json),
+] + [(path, language, load_chapter_json) for language, path in SAMPLE_FILES.items()]
+
+
+# ==============================================================================
+# Store
+# ==============================================================================
+
+
+class CorpusStore:
+    """
+    Indexed verse and coordinate store.
+
+    Reads return plain dicts keyed like the JSON files they replace
+    (verse numbers as strings for single chapters).
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    # -- connection ------------------------------------------------------------
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is not None and self._conn_pid != os.getpid():
+            # Forked worker: never share a SQLite connection across processes
+            self._conn = None
+        if self._conn is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(self._conn)
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS verses (
+                language TEXT NOT NULL, book TEXT NOT NULL,
+                chapter INTEGER NOT NULL, verse INTEGER NOT NULL,
+                text TEXT NOT NULL, translation TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (language, book, chapter, verse)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS coordinates (
+                language TEXT NOT NULL, book TEXT NOT NULL,
+                chapter INTEGER NOT NULL, verse INTEGER NOT NULL,
+                detector TEXT NOT NULL, version TEXT NOT NULL,
+                L REAL NOT NULL, J REAL NOT NULL, P REAL NOT NULL, W REAL NOT NULL,
+                PRIMARY KEY (language, book, chapter, verse, detector)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS sources (
+                path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS source_chapters (
+                path TEXT NOT NULL, language TEXT NOT NULL, book TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                PRIMARY KEY (path, language, book, chapter)) WITHOUT ROWID;
+        """)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or int(row[0]) != SCHEMA_VERSION:
+            # Loaders or language keys changed: rebuild from the sources on the
+            # next sync (rows of an old key would otherwise linger)
+            conn.execute("DELETE FROM verses")
+            conn.execute("DELETE FROM coordinates")
+            conn.execute("DELETE FROM sources")
+            conn.execute("DELETE FROM source_chapters")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        conn.commit()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # -- import ----------------------------------------------------------------
+
+    def sync(self, root: Path = REPO_ROOT, verbose: bool = False) -> int:
+        """
+        Import every source file that is new or changed since the last sync,
+        and remove the chapters of source files no longer on disk.
+
+        Returns:
+            Number of files imported
+        """
+        root = Path(root)
+        known = {p: (m, s) for p, m, s in self.conn.execute("SELECT path, mtime, size FROM sources")}
+        seen = set()
+        imported = 0
+        for pattern, language, loader in SOURCES:
+            for path in sorted(root.glob(pattern)):
+                stat = path.stat()
+                rel = path.relative_to(root).as_posix()
+                seen.add(rel)
+                if known.get(rel) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    chapters = loader(path)
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    if verbose:
+                        print(f"  [SKIP] {rel}: {e}")
+                    continue
+                with self.conn:
+                    self._put_source(rel, language, chapters)
+                    self.conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)",
+                                      (rel, stat.st_mtime, stat.st_size))
+                imported += 1
+                if verbose:
+                    print(f"  Imported {rel} -> {language}")
+
+        for rel in sorted(set(known) - seen):
+            with self.conn:
+                self._remove_source(rel)
+            if verbose:
+                print(f"  Removed {rel}")
+        return imported
+
+    def _put_source(self, rel: str, language: str, chapters: List[ChapterRecord]):
+        """Replace the chapters of one source file (dropping chapters it no longer has)."""
+        old = set(self.conn.execute(
+            "SELECT language, book, chapter FROM source_chapters WHERE path = ?", (rel,)))
+        new = set()
+        for record in chapters:
+            self._put_chapter(language, record)
+            new.add((language, book_key(record.book), record.chapter))
+        for key in old - new:
+            self._delete_chapter(*key)
+        self.conn.execute("DELETE FROM source_chapters WHERE path = ?", (rel,))
+        self.conn.executemany("INSERT INTO source_chapters VALUES (?, ?, ?, ?)",
+                              [(rel, *key) for key in sorted(new)])
+
+    def _remove_source(self, rel: str):
+        """Remove a deleted source file's chapters and its sync record."""
+        for key in self.conn.execute(
+                "SELECT language, book, chapter FROM source_chapters WHERE path = ?",
+                (rel,)).fetchall():
+            self._delete_chapter(*key)
+        self.conn.execute("DELETE FROM source_chapters WHERE path = ?", (rel,))
+        self.conn.execute("DELETE FROM sources WHERE path = ?", (rel,))
+
+    def _delete_chapter(self, language: str, book: str, chapter: int):
+        for table in ('verses', 'coordinates'):
+            self.conn.execute(f"DELETE FROM {table} WHERE language = ? AND book = ? AND chapter = ?",
+                              (language, book, chapter))
+
+    def import_file(self, path: Path, language: str,
+                    loader: Callable[[Path], List[ChapterRecord]] = load_chapter_json):
+        """Import one file (any location) under a language."""
+        with self.conn:
+            for record in loader(Path(path)):
+                self._put_chapter(language, record)
+
+    def _put_chapter(self, language: str, record: ChapterRecord):
+        """
+        Replace a chapter with a source record: verses missing from the record
+        are removed, and previously imported coordinates give way to the
+        record's (computed coordinates of unchanged verses are kept).
+        """
+        book = book_key(record.book)
+        conn = self.conn
+        self.put_verses(language, book, record.chapter, record.verses,
+                        record.translation, commit=False)
+
+        kept = sorted(int(v) for v in record.verses)
+        placeholders = ','.join('?' * len(kept))
+        for table in ('verses', 'coordinates'):
+            conn.execute(f"DELETE FROM {table} WHERE language = ? AND book = ? AND chapter = ? "
+                         f"AND verse NOT IN ({placeholders})",
+                         [language, book, record.chapter, *kept])
+        conn.execute("DELETE FROM coordinates WHERE language = ? AND book = ? AND chapter = ? "
+                     "AND version = ?", (language, book, record.chapter, IMPORTED_VERSION))
+
+        if record.coordinates:
+            rows = {v: c for v, c in record.coordinates.items() if v in record.verses}
+            self.put_coordinates(language, book, record.chapter, rows,
+                                 record.detector, IMPORTED_VERSION, replace=False, commit=False)
+
+    def put_verses(self, language: str, book: str, chapter: int, verses: Dict,
+                   translation: str = '', commit: bool = True):
+        """Insert or update a chapter's verses; changed texts drop their cached coordinates."""
+        book = book_key(book)
+        rows = [(language, book, chapter, int(v), text, translation)
+                for v, text in verses.items()]
+        conn = self.conn
+        conn.executemany(
+            """DELETE FROM coordinates WHERE language = ? AND book = ? AND chapter = ? AND verse = ?
+               AND EXISTS (SELECT 1 FROM verses WHERE language = ? AND book = ? AND chapter = ?
+                           AND verse = ? AND text != ?)""",
+            [(l, b, c, v, l, b, c, v, t) for l, b, c, v, t, _ in rows])
+        conn.executemany("INSERT OR REPLACE INTO verses VALUES (?, ?, ?, ?, ?, ?)", rows)
+        if commit:
+            conn.commit()
+
+    # -- verse reads -----------------------------------------------------------
+
+    def languages(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT DISTINCT language FROM verses ORDER BY language")]
+
+    def books(self, language: str) -> List[str]:
+        return [r[0] for r in self.conn.execute(
+            "SELECT DISTINCT book FROM verses WHERE language = ? ORDER BY book", (language,))]
+
+    def chapters(self, language: str, book: str) -> List[int]:
+        return [r[0] for r in self.conn.execute(
+            "SELECT DISTINCT chapter FROM verses WHERE language = ? AND book = ? ORDER BY chapter",
+            (language, book_key(book)))]
+
+    def chapter(self, language: str, book: str, chapter: int) -> Dict[str, str]:
+        """{verse number (str): text} of one chapter, in verse order."""
+        return {str(v): text for v, text in self.conn.execute(
+            "SELECT verse, text FROM verses WHERE language = ? AND book = ? AND chapter = ? ORDER BY verse",
+            (language, book_key(book), chapter))}
+
+    def verses(self, language: str, book: Optional[str] = None,
+               chapter: Optional[int] = None) -> Dict[VerseKey, str]:
+        """Bulk read: {(book, chapter, verse): text}."""
+        return {(r.book, r.chapter, r.verse): r.text for r in self.iter_verses(language, book, chapter)}
+
+    def iter_verses(self, language: Optional[str] = None, book: Optional[str] = None,
+                    chapter: Optional[int] = None) -> Iterator[VerseRow]:
+        """Stream verses in (language, book, chapter, verse) order."""
+        where, params = self._filter(language, book, chapter)
+        cursor = self.conn.execute(
+            f"SELECT language, book, chapter, verse, text FROM verses {where} "
+            "ORDER BY language, book, chapter, verse", params)
+        for row in cursor:
+            yield VerseRow(*row)
+
+    def parallel(self, language1: str, language2: str, book: Optional[str] = None,
+                 chapter: Optional[int] = None) -> List[Tuple[VerseKey, str, str]]:
+        """Verses present in both languages: [((book, chapter, verse), text1, text2), ...]."""
+        where, params = self._filter(language1, book, chapter, alias='a.')
+        rows = self.conn.execute(
+            f"""SELECT a.book, a.chapter, a.verse, a.text, b.text FROM verses a
+                JOIN verses b ON b.language = ? AND b.book = a.book
+                               AND b.chapter = a.chapter AND b.verse = a.verse
+                {where} ORDER BY a.book, a.chapter, a.verse""", [language2] + params)
+        return [((bk, ch, v), t1, t2) for bk, ch, v, t1, t2 in rows]
+
+    @staticmethod
+    def _filter(language, book, chapter, alias: str = '') -> Tuple[str, list]:
+        clauses, params = [], []
+        for column, value in (('language', language), ('book', book), ('chapter', chapter)):
+            if value is not None:
+                clauses.append(f"{alias}{column} = ?")
+                params.append(book_key(value) if column == 'book' else value)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else '', params
+
+    # -- coordinates -----------------------------------------------------------
+
+    def coordinates(self, language: str, detector: str, book: Optional[str] = None,
+                    chapter: Optional[int] = None,
+                    version: Optional[str] = None) -> Dict[VerseKey, Coords]:
+        """
+        Cached coordinates {(book, chapter, verse): (L, J, P, W)}.
+
+        version=None accepts coordinates of any detector version.
+        """
+        where, params = self._filter(language, book, chapter)
+        where += " AND detector = ?"
+        params.append(detector)
+        if version is not None:
+            where += " AND version = ?"
+            params.append(version)
+        return {(b, c, v): (L, J, P, W) for b, c, v, L, J, P, W in self.conn.execute(
+            f"SELECT book, chapter, verse, L, J, P, W FROM coordinates {where} "
+            "ORDER BY book, chapter, verse", params)}
+
+    def put_coordinates(self, language: str, book: str, chapter: int, coords: Dict,
+                        detector: str, version: str, replace: bool = True, commit: bool = True):
+        """Store {verse: (L, J, P, W)} for one chapter."""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        self.conn.executemany(
+            f"{verb} INTO coordinates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(language, book_key(book), chapter, int(v), detector, version, *map(float, c[:4]))
+             for v, c in coords.items()])
+        if commit:
+            self.conn.commit()
+
+    def ensure_coordinates(self, language: str, book: str, chapter: int, detector,
+                           method: str = 'calculate_field_signature') -> Dict[str, Coords]:
+        """
+        Coordinates of every verse in a chapter for detector.method, computing
+        (and caching) only the verses missing for the current detector version.
+
+        Returns:
+            {verse number (str): (L, J, P, W)}
+        """
+        name = f"{type(detector).__name__}.{method}"
+        version = detector_version(detector)
+        book = book_key(book)
+        cached = self.coordinates(language, name, book, chapter, version)
+        texts = self.chapter(language, book, chapter)
+
+        missing = {}
+        score = getattr(detector, method)
+        for verse, text in texts.items():
+            if (book, chapter, int(verse)) not in cached:
+                sig = score(text)
+                missing[verse] = (sig['L'], sig['J'], sig['P'], sig['W'])
+        if missing:
+            self.put_coordinates(language, book, chapter, missing, name, version)
+
+        return {verse: missing[verse] if verse in missing else cached[(book, chapter, int(verse))]
+                for verse in texts}
+
+
+_STORES: Dict[str, CorpusStore] = {}
+
+
+def open_corpus(path: str = DEFAULT_STORE_PATH, sync: bool = True) -> CorpusStore:
+    """Shared CorpusStore for path, synced with the JSON sources on first open."""
+    store = _STORES.get(path)
+    if store is None:
+        store = _STORES[path] = CorpusStore(path)
+        if sync:
+            store.sync()
+    return store
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Build / inspect the unified corpus store")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="Database path")
+    args = parser.parse_args()
+
+    store = CorpusStore(args.store)
+    print(f"Syncing {args.store} ...")
+    imported = store.sync(verbose=True)
+    print(f"\n{imported} source files imported\n")
+    for language in store.languages():
+        books = store.books(language)
+        count = store.conn.execute(
+            "SELECT COUNT(*) FROM verses WHERE language = ?", (language,)).fetchone()[0]
+        print(f"  {language:<18} {len(books):3d} books {count:7d} verses")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,30 @@
-import json
+import sys
 import numpy as np
 from pathlib import Path
 from collections import defaultdict
 
+# Add experiments dir to path so we can import the corpus store
+sys.path.append(str(Path(__file__).parent))
+
+from corpus_store import CORPUS_PROCESSOR_DETECTOR, open_corpus
+
 class CrossBookValidator:
     """Analyze LJPW semantic patterns across the 4 Gospels."""
     
     def __init__(self):
-        self.corpus_root = Path('corpus')
+        self.store = open_corpus()
         self.data = self._load_corpus()
         
     def _load_corpus(self):
-        """Load all processed JSON files."""
+        """Load the precomputed LJPW coordinates of each Gospel (one indexed query per book)."""
         data = defaultdict(dict)
         books = ['mark', 'matthew', 'luke', 'john']
         
         print("Loading corpus...")
         for book in books:
-            book_dir = self.corpus_root / book
-            for json_file in book_dir.glob('*.json'):
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    chapter_data = json.load(f)
-                    ch = chapter_data['chapter']
-                    coords = chapter_data.get('ljpw_coordinates', {})
-                    data[book][str(ch)] = coords
+            coords = self.store.coordinates('english_web', CORPUS_PROCESSOR_DETECTOR, book)
+            for (_, ch, v), c in coords.items():
+                data[book].setdefault(str(ch), {})[str(v)] = list(c)
         print(f"Loaded {len(data)} books.")
         return data
 
@@ -13,12 +13,16 @@ Approach:
   1. Use parallel verses (same verse in multiple languages)
   2. Learn affine transform: coords_normalized = A * coords_raw + b
   3. Minimize distance between parallel verses
+
+The objective is separable per dimension, so each (scale, offset) pair is a
+1-D weighted least-squares fit solved in closed form; all dimensions and all
+language pairs are solved together on stacked coordinate arrays.
 """
 
 import sys
 import os
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 from scipy.optimize import minimize
 
@@ -28,6 +32,91 @@ from experiments.enhanced_pattern_detector import EnhancedPatternDetector
 from experiments.greek_pattern_detector import GreekPatternDetector
 from experiments.spanish_pattern_detector import SpanishPatternDetector
 from experiments.chinese_pattern_detector import ChinesePatternDetector
+from experiments.corpus_store import detector_version, open_corpus
+
+
+# Parallel chapter read from the corpus store when no verse files are given
+DEFAULT_PASSAGE = ('mark', 1)
+
+# Detector method whose coordinates are calibrated (and cached in the store)
+SIGNATURE_METHOD = 'calculate_field_signature'
+
+# Huber tuning constant (95% efficiency under Gaussian residuals)
+HUBER_K = 1.345
+
+
+def _verse_sort_key(verse_id: str) -> Tuple:
+    """Sort key for verse ids like '12' or '3:16'."""
+    return tuple(int(part) if part.isdigit() else part for part in str(verse_id).split(':'))
+
+
+def solve_affine_calibration(source: np.ndarray, target: np.ndarray,
+                             weights: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form weighted least squares for target ~ scale * source + offset.
+
+    Each dimension is an independent 1-D regression, so the solution is
+    scale = cov_w(x, y) / var_w(x), offset = mean_w(y) - scale * mean_w(x).
+    Leading axes broadcast, so several language pairs can be solved at once
+    by padding to a common length with zero weights.
+
+    Args:
+        source: (..., N, 4) source coordinates
+        target: (..., N, 4) target coordinates
+        weights: (..., N) per-verse weights (default: uniform)
+
+    Returns:
+        (scale, offset), each (..., 4). Dimensions with no source variance
+        keep scale 1 and only fit the offset.
+    """
+    source = np.asarray(source, dtype=float)
+    target = np.asarray(target, dtype=float)
+    if weights is None:
+        weights = np.ones(source.shape[:-1])
+    w = np.asarray(weights, dtype=float)[..., None]
+
+    total = np.maximum(w.sum(axis=-2), 1e-12)
+    mean_x = (w * source).sum(axis=-2) / total
+    mean_y = (w * target).sum(axis=-2) / total
+    dx = source - mean_x[..., None, :]
+    dy = target - mean_y[..., None, :]
+    var_x = (w * dx * dx).sum(axis=-2)
+    cov_xy = (w * dx * dy).sum(axis=-2)
+
+    degenerate = var_x <= 1e-12
+    scale = np.where(degenerate, 1.0, cov_xy / np.where(degenerate, 1.0, var_x))
+    offset = mean_y - scale * mean_x
+    return scale, offset
+
+
+def robust_affine_calibration(source: np.ndarray, target: np.ndarray,
+                              mask: Optional[np.ndarray] = None,
+                              iterations: int = 10) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Huber-weighted fit by iteratively reweighted least squares.
+
+    Weights are per verse, from the Euclidean residual of the whole
+    coordinate, so verses the detector gets badly wrong are down-weighted
+    in every dimension together.
+
+    Returns:
+        (scale, offset, weights)
+    """
+    mask = np.ones(np.asarray(source).shape[:-1]) if mask is None else np.asarray(mask, dtype=float)
+    weights = mask.copy()
+    for _ in range(iterations):
+        scale, offset = solve_affine_calibration(source, target, weights)
+        residual = np.linalg.norm(scale[..., None, :] * source + offset[..., None, :] - target, axis=-1)
+        # Robust residual scale from the median absolute residual of real verses
+        masked = np.where(mask > 0, residual, np.nan)
+        sigma = np.nanmedian(masked, axis=-1, keepdims=True) / 0.6745
+        sigma = np.maximum(np.nan_to_num(sigma), 1e-9)
+        new_weights = mask * np.minimum(1.0, HUBER_K * sigma / np.maximum(residual, 1e-12))
+        if np.allclose(new_weights, weights, atol=1e-6):
+            break
+        weights = new_weights
+    scale, offset = solve_affine_calibration(source, target, weights)
+    return scale, offset, weights
 
 
 class CrossLanguageCalibrator:
@@ -35,8 +124,10 @@ class CrossLanguageCalibrator:
     Calibrates LJPW coordinates across languages using parallel verses.
     """
     
-    def __init__(self, reference_language='english'):
+    def __init__(self, reference_language='english', verse_files: Optional[Dict[str, str]] = None):
         self.reference_language = reference_language
+        self.verse_files = verse_files
+        self.store = open_corpus() if verse_files is None else None
         
         self.detectors = {
             'english': EnhancedPatternDetector(),
@@ -49,34 +140,79 @@ class CrossLanguageCalibrator:
         # Calibration transforms: coords_calibrated = scale * coords_raw + offset
         self.calibrations = {}
         
+        # (language, text) -> coordinates, so each verse is detected only once
+        self._coords_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        
         # Load verse data
         self.verse_data = {}
         self._load_verse_data()
     
     def _load_verse_data(self):
-        """Load all verse data."""
-        files = {
-            'english': 'experiments/nwt_mark_chapter1.json',
-            'wedau': 'experiments/wedau_mark_chapter1.json',
-            'greek': 'experiments/greek_mark_chapter1.json',
-            'spanish': 'experiments/spanish_mark_chapter1.json',
-            'chinese': 'experiments/chinese_mark_chapter1.json'
-        }
+        """Load all verse data (and coordinates already cached in the corpus store)."""
+        if self.store is None:
+            for lang, filepath in self.verse_files.items():
+                try:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                        self.verse_data[lang] = data['verses']
+                except FileNotFoundError:
+                    print(f"Warning: {filepath} not found")
+                    self.verse_data[lang] = {}
+            return
         
-        for lang, filepath in files.items():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.verse_data[lang] = data['verses']
-            except FileNotFoundError:
-                print(f"Warning: {filepath} not found")
-                self.verse_data[lang] = {}
+        book, chapter = DEFAULT_PASSAGE
+        for lang, detector in self.detectors.items():
+            verses = self.store.chapter(lang, book, chapter)
+            self.verse_data[lang] = verses
+            if not verses:
+                print(f"Warning: no {lang} verses for {book.title()} {chapter} in the corpus store")
+            cached = self.store.coordinates(lang, self._detector_key(detector), book, chapter,
+                                            detector_version(detector))
+            for (_, _, verse), coords in cached.items():
+                text = verses.get(str(verse))
+                if text is not None:
+                    self._coords_cache[(lang, text)] = np.array(coords)
+    
+    @staticmethod
+    def _detector_key(detector) -> str:
+        return f"{type(detector).__name__}.{SIGNATURE_METHOD}"
+    
+    def save_coordinates(self):
+        """Write coordinates computed so far back to the corpus store for other consumers."""
+        if self.store is None:
+            return
+        book, chapter = DEFAULT_PASSAGE
+        for lang, detector in self.detectors.items():
+            coords = {verse: self._coords_cache[(lang, text)]
+                      for verse, text in self.verse_data.get(lang, {}).items()
+                      if (lang, text) in self._coords_cache}
+            if coords:
+                self.store.put_coordinates(lang, book, chapter, coords,
+                                           self._detector_key(detector), detector_version(detector))
     
     def get_coords(self, text: str, language: str) -> np.ndarray:
-        """Get LJPW coordinates for text."""
-        detector = self.detectors[language]
-        sig = detector.calculate_field_signature(text)
-        return np.array([sig['L'], sig['J'], sig['P'], sig['W']])
+        """Get LJPW coordinates for text (cached per language and text)."""
+        key = (language, text)
+        coords = self._coords_cache.get(key)
+        if coords is None:
+            detector = self.detectors[language]
+            sig = detector.calculate_field_signature(text)
+            coords = np.array([sig['L'], sig['J'], sig['P'], sig['W']])
+            self._coords_cache[key] = coords
+        return coords
+    
+    def parallel_coordinates(self, lang1: str, lang2: str) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Stack coordinates of verses present in both languages.
+        
+        Returns: (coords1, coords2, verse_ids) with coords of shape (N, 4)
+        """
+        common_verses = set(self.verse_data[lang1].keys()) & set(self.verse_data[lang2].keys())
+        verse_ids = sorted(common_verses, key=_verse_sort_key)
+        
+        coords1 = np.array([self.get_coords(self.verse_data[lang1][v], lang1) for v in verse_ids]).reshape(-1, 4)
+        coords2 = np.array([self.get_coords(self.verse_data[lang2][v], lang2) for v in verse_ids]).reshape(-1, 4)
+        return coords1, coords2, verse_ids
     
     def extract_parallel_verses(self, lang1: str, lang2: str) -> List[Tuple[np.ndarray, np.ndarray]]:
         """
@@ -84,37 +220,32 @@ class CrossLanguageCalibrator:
         
         Returns: List of (coords1, coords2) tuples
         """
-        pairs = []
-        
-        # Find common verse numbers
-        verses1 = set(self.verse_data[lang1].keys())
-        verses2 = set(self.verse_data[lang2].keys())
-        common_verses = verses1 & verses2
-        
-        for verse_num in sorted(common_verses, key=int):
-            text1 = self.verse_data[lang1][verse_num]
-            text2 = self.verse_data[lang2][verse_num]
-            
-            coords1 = self.get_coords(text1, lang1)
-            coords2 = self.get_coords(text2, lang2)
-            
-            pairs.append((coords1, coords2))
-        
-        return pairs
+        coords1, coords2, _ = self.parallel_coordinates(lang1, lang2)
+        return list(zip(coords1, coords2))
     
-    def learn_calibration(self, source_lang: str, target_lang: str) -> Dict:
+    def learn_calibration(self, source_lang: str, target_lang: str,
+                          method: str = 'lstsq', robust: bool = False) -> Dict:
         """
         Learn calibration transform from source_lang to target_lang.
         
         Finds scale and offset such that:
           coords_target_calibrated = scale * coords_source + offset
         
-        Minimizes: sum of distances between calibrated source and target
+        Minimizes: sum of squared distances between calibrated source and target
+        
+        Args:
+            method: 'lstsq' (closed form) or 'bfgs' (iterative, for comparison)
+            robust: Huber-weight verses via IRLS (lstsq only)
         """
-        pairs = self.extract_parallel_verses(source_lang, target_lang)
+        if method == 'lstsq':
+            return self.learn_calibrations([source_lang], target_lang, robust=robust)[source_lang]
+        if method != 'bfgs':
+            raise ValueError(f"Unknown calibration method: {method}")
         
-        if len(pairs) < 5:
-            print(f"Warning: Only {len(pairs)} parallel verses found")
+        source, target, _ = self.parallel_coordinates(source_lang, target_lang)
+        
+        if len(source) < 5:
+            print(f"Warning: Only {len(source)} parallel verses found")
             return {
                 'scale': np.ones(4),
                 'offset': np.zeros(4),
@@ -125,34 +256,76 @@ class CrossLanguageCalibrator:
         x0 = np.concatenate([np.ones(4), np.zeros(4)])  # [scale, offset]
         
         def objective(x):
-            """Minimize sum of squared distances."""
-            scale = x[:4]
-            offset = x[4:]
-            
-            total_error = 0.0
-            for coords_source, coords_target in pairs:
-                coords_calibrated = scale * coords_source + offset
-                distance = np.linalg.norm(coords_calibrated - coords_target)
-                total_error += distance ** 2
-            
-            return total_error / len(pairs)
+            """Mean squared distance."""
+            residual = x[:4] * source + x[4:] - target
+            return float(np.mean(np.sum(residual ** 2, axis=1)))
         
-        # Optimize
         result = minimize(objective, x0, method='BFGS')
         
-        scale = result.x[:4]
-        offset = result.x[4:]
-        error = np.sqrt(result.fun)
-        
         return {
             'source_lang': source_lang,
             'target_lang': target_lang,
-            'scale': scale.tolist(),
-            'offset': offset.tolist(),
-            'error': float(error),
-            'num_verses': len(pairs)
+            'scale': result.x[:4].tolist(),
+            'offset': result.x[4:].tolist(),
+            'error': float(np.sqrt(result.fun)),
+            'num_verses': len(source)
         }
     
+    def learn_calibrations(self, source_langs: List[str], target_lang: str,
+                           robust: bool = False) -> Dict[str, Dict]:
+        """
+        Learn calibrations for several source languages in one closed-form solve.
+        
+        Parallel coordinates of every language pair are padded to a common
+        length (padding has zero weight) and solved together.
+        """
+        stacked = {lang: self.parallel_coordinates(lang, target_lang)[:2] for lang in source_langs}
+        calibrations = {}
+        
+        solvable = [lang for lang, (source, _) in stacked.items() if len(source) >= 5]
+        for lang in source_langs:
+            if lang not in solvable:
+                print(f"Warning: Only {len(stacked[lang][0])} parallel verses found")
+                calibrations[lang] = {
+                    'scale': np.ones(4),
+                    'offset': np.zeros(4),
+                    'error': float('inf')
+                }
+        if not solvable:
+            return calibrations
+        
+        length = max(len(stacked[lang][0]) for lang in solvable)
+        source = np.zeros((len(solvable), length, 4))
+        target = np.zeros((len(solvable), length, 4))
+        mask = np.zeros((len(solvable), length))
+        for i, lang in enumerate(solvable):
+            n = len(stacked[lang][0])
+            source[i, :n], target[i, :n] = stacked[lang]
+            mask[i, :n] = 1.0
+        
+        if robust:
+            scale, offset, weights = robust_affine_calibration(source, target, mask)
+        else:
+            scale, offset = solve_affine_calibration(source, target, mask)
+            weights = mask
+        
+        squared = np.sum((scale[:, None, :] * source + offset[:, None, :] - target) ** 2, axis=-1)
+        mse = (squared * mask).sum(axis=1) / mask.sum(axis=1)
+        
+        for i, lang in enumerate(solvable):
+            calibrations[lang] = {
+                'source_lang': lang,
+                'target_lang': target_lang,
+                'scale': scale[i].tolist(),
+                'offset': offset[i].tolist(),
+                'error': float(np.sqrt(mse[i])),
+                'num_verses': int(mask[i].sum())
+            }
+            if robust:
+                calibrations[lang]['downweighted_verses'] = int(np.sum(weights[i, :int(mask[i].sum())] < 1.0))
+        
+        return calibrations
+    
     def apply_calibration(self, coords: np.ndarray, calibration: Dict) -> np.ndarray:
         """Apply calibration transform to coordinates."""
         scale = np.array(calibration['scale'])
@@ -166,6 +339,9 @@ class CrossLanguageCalibrator:
         print(f"Calibrating all languages to reference: {self.reference_language}")
         print("=" * 80)
         
+        sources = [lang for lang in self.detectors.keys() if lang != self.reference_language]
+        learned = self.learn_calibrations(sources, self.reference_language)
+        
         for lang in self.detectors.keys():
             if lang == self.reference_language:
                 # Reference language has identity transform
@@ -180,7 +356,7 @@ class CrossLanguageCalibrator:
                 continue
             
             print(f"\nCalibrating {lang} -> {self.reference_language}...")
-            calibration = self.learn_calibration(lang, self.reference_language)
+            calibration = learned[lang]
             self.calibrations[lang] = calibration
             
             print(f"  Scale: {[f'{x:.3f}' for x in calibration['scale']]}")
@@ -188,6 +364,8 @@ class CrossLanguageCalibrator:
             print(f"  Error: {calibration['error']:.4f}")
             print(f"  Verses: {calibration['num_verses']}")
         
+        self.save_coordinates()
+        
         # Save calibrations
         with open('experiments/language_calibrations.json', 'w', encoding='utf-8') as f:
             json.dump(self.calibrations, f, indent=2)
@@ -7,7 +7,8 @@ Phase 2: Integrated with Context and Multi-Layer Combination.
 import numpy as np
 import re
 import unicodedata
-from typing import Dict, List, Optional, Any, Set
+from bisect import bisect_left
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 # Import Phase 2 modules
 from context_integrator import ContextIntegrator
@@ -20,6 +21,15 @@ E_M2 = np.e - 2
 LN2 = np.log(2)
 EQUILIBRIUM = np.array([PHI_INV, SQRT2_M1, E_M2, LN2])
 
+MARKER_CATEGORIES = ('divine', 'power', 'wisdom', 'love', 'justice', 'negative')
+
+# High-value compounds that boost marker confidence (English/Romance)
+COMPOUND_PHRASES = ('son of god', 'fils de dieu', 'hijo de dios')
+
+# Methods whose behaviour calculate_field_signatures() inlines; a subclass
+# overriding any of them is scored token by token instead
+BATCHED_METHODS = ('calculate_field_signature', 'analyze_phonetic_profile', 'detect_semantic_markers')
+
 
 class EnhancedPatternDetector:
     """Advanced pattern detection for semantic field signatures."""
@@ -157,7 +167,7 @@ class EnhancedPatternDetector:
         
         # Check for specific high-value compounds (English/Romance/Greek)
         compound_boost = 0.0
-        if 'son of god' in combined or 'fils de dieu' in combined or 'hijo de dios' in combined:
+        if any(phrase in combined for phrase in COMPOUND_PHRASES):
             compound_boost = 0.4
         
         # Greek 'Huiou Theou' (Son of God)
@@ -173,6 +183,10 @@ class EnhancedPatternDetector:
             'negative': sum(1 for m in self.negative_markers if m in combined)
         }
         
+        return self._summarize_markers(markers_found, compound_boost)
+    
+    def _summarize_markers(self, markers_found: Dict[str, int], compound_boost: float) -> Dict[str, Any]:
+        """Pick the dominant marker category and its confidence."""
         total_markers = sum(markers_found.values())
         
         if total_markers > 0:
@@ -186,6 +200,15 @@ class EnhancedPatternDetector:
     
     def calculate_field_signature(self, text: str, context: Optional[str] = None) -> Dict[str, Any]:
         """Calculate enhanced semantic field signature."""
+        return self._build_signature(
+            self.analyze_phonetic_profile(text),
+            self.analyze_morphological_structure(text),
+            self.detect_semantic_markers(text, context)
+        )
+    
+    def _build_signature(self, phonetic: Dict[str, Any], morphology: Dict[str, Any],
+                         markers: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn phonetic, morphological and marker analyses into a field signature."""
         # Initialize signature
         signature = {
             'L': 0.5,
@@ -197,7 +220,6 @@ class EnhancedPatternDetector:
         }
         
         # Phonetic analysis
-        phonetic = self.analyze_phonetic_profile(text)
         if phonetic:
             if phonetic['soft_ratio'] > 0.5:
                 signature['L'] += 0.20 * phonetic['soft_ratio']
@@ -218,7 +240,6 @@ class EnhancedPatternDetector:
                 signature['evidence'].append(f"Liquid phonemes ({phonetic['liquid_ratio']:.2f})")
         
         # Morphological analysis
-        morphology = self.analyze_morphological_structure(text)
         if morphology:
             if morphology['reduplication']:
                 signature['W'] += 0.15
@@ -237,7 +258,6 @@ class EnhancedPatternDetector:
                 signature['evidence'].append(f"Compound words ({morphology['compound_ratio']:.2f})")
         
         # Semantic marker analysis
-        markers = self.detect_semantic_markers(text, context)
         if markers['dominant']:
             marker_strength = markers['confidence']
             
@@ -290,11 +310,9 @@ class EnhancedPatternDetector:
             signature['confidence'] += 0.2
             signature['evidence'].append("Synergy: Divine + Power -> Kingly Authority")
         
-        # Normalize to [0, 1]
-        signature['L'] = np.clip(signature['L'], 0, 1)
-        signature['J'] = np.clip(signature['J'], 0, 1)
-        signature['P'] = np.clip(signature['P'], 0, 1)
-        signature['W'] = np.clip(signature['W'], 0, 1)
+        # Normalize to [0, 1] (scalar clip; np.clip is slow on Python floats)
+        for dim in ('L', 'J', 'P', 'W'):
+            signature[dim] = np.float64(min(max(signature[dim], 0.0), 1.0))
         
         signature['coordinates'] = np.array([
             signature['L'],
@@ -321,10 +339,175 @@ class EnhancedPatternDetector:
         signature['emergent_dimension'] = ', '.join(emergent) if emergent else 'Balanced'
         
         # Normalize confidence
-        signature['confidence'] = np.clip(signature['confidence'], 0, 1)
+        signature['confidence'] = np.float64(min(max(signature['confidence'], 0.0), 1.0))
         
         return signature
     
+    def _marker_table(self) -> Tuple[Dict[str, Tuple[str, ...]], Set[str], List[Tuple[str, int]]]:
+        """
+        Map every marker (and compound phrase) to its categories.
+        
+        Also returns the set of all marker prefixes and the (marker, index) of
+        every inner space, used to find markers spanning a join.
+        """
+        sets = [getattr(self, f'{category}_markers') for category in MARKER_CATEGORIES]
+        key = tuple(len(markers) for markers in sets)
+        cached = getattr(self, '_marker_table_cache', None)
+        if cached is not None and cached[0] == key:
+            return cached[1:]
+        
+        table: Dict[str, Tuple[str, ...]] = {}
+        for category, markers in zip(MARKER_CATEGORIES, sets):
+            for marker in markers:
+                table[marker] = table.get(marker, ()) + (category,)
+        for phrase in COMPOUND_PHRASES:
+            table[phrase] = table.get(phrase, ()) + ('compound',)
+        prefixes = {marker[:k] for marker in table for k in range(1, len(marker) + 1)}
+        spaces = [(marker, i) for marker in table for i, char in enumerate(marker) if char == ' ' and i > 0]
+        self._marker_table_cache = (key, table, prefixes, spaces)
+        return table, prefixes, spaces
+    
+    @staticmethod
+    def _scan_markers(text: str, table: Dict[str, Tuple[str, ...]],
+                      prefixes: Set[str]) -> List[Tuple[int, int, str]]:
+        """Return (start, end, marker) for every marker occurrence, in start order."""
+        hits = []
+        n = len(text)
+        for start in range(n):
+            end = start + 1
+            # Walk forward only while the substring is still a prefix of some marker
+            while end <= n and text[start:end] in prefixes:
+                if text[start:end] in table:
+                    hits.append((start, end, text[start:end]))
+                end += 1
+        return hits
+    
+    def _markers_from_hits(self, found: Set[str], table: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+        """Equivalent of detect_semantic_markers() given the set of markers present."""
+        compound_boost = 0.0
+        if any(phrase in found for phrase in COMPOUND_PHRASES):
+            compound_boost = 0.4
+        if ('υιου' in found and 'θεου' in found) or ('υιος' in found and 'θεος' in found):
+            compound_boost = 0.4
+        
+        markers_found = dict.fromkeys(MARKER_CATEGORIES, 0)
+        for marker in found:
+            for category in table[marker]:
+                if category != 'compound':
+                    markers_found[category] += 1
+        if compound_boost > 0:
+            markers_found['divine'] += 1
+        
+        return self._summarize_markers(markers_found, compound_boost)
+    
+    def calculate_field_signatures(self, tokens: List[str], context: Optional[str] = None,
+                                   text: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Calculate field signatures for every token and for the whole text in one pass.
+        
+        Equivalent to calling calculate_field_signature() on each token and then
+        on the text, but lowercasing, phonetic counts (via prefix sums) and marker
+        hits are computed once over the text and shared between the two scales.
+        The context is scanned for markers once instead of once per token.
+        Subclasses overriding the per-text scoring (e.g. the Wedau or Greek
+        detectors) get plain calculate_field_signature() calls.
+        
+        Args:
+            tokens: Tokens of the text, in order (e.g. text.split())
+            context: Optional context applied at both scales
+            text: Full text; defaults to the tokens joined by spaces
+        
+        Returns:
+            (token_signatures, text_signature)
+        """
+        if text is None:
+            text = ' '.join(tokens)
+        text_lower = text.lower()
+        overridden = any(getattr(type(self), name) is not getattr(EnhancedPatternDetector, name)
+                         for name in BATCHED_METHODS)
+        if overridden or len(text_lower) != len(text):
+            # Subclass scoring, or lowercasing changed offsets; fall back to independent calls
+            return ([self.calculate_field_signature(token, context) for token in tokens],
+                    self.calculate_field_signature(text, context))
+        
+        table, prefixes, spaces = self._marker_table()
+        
+        # Markers found in " " + context are shared by every scale
+        context_tail = ' ' + (context.lower() if context else '')
+        context_found = {m for _, _, m in self._scan_markers(context_tail, table, prefixes)}
+        
+        # Markers that can straddle the join between a scale and " " + context:
+        # they contain a space, and what follows it must start the context
+        straddling = [(marker, marker[:i]) for marker, i in spaces
+                      if context_tail.startswith(marker[i:])]
+        
+        def joint_markers(prefix: str) -> Set[str]:
+            return {marker for marker, head in straddling if prefix.endswith(head)}
+        
+        # One scan of the text; each hit is later attributed to the token containing it
+        text_hits = self._scan_markers(text_lower, table, prefixes)
+        hit_starts = [hit[0] for hit in text_hits]
+        
+        # Phonetic prefix sums over the text
+        classes = (self.soft_phonemes, self.harsh_phonemes, self.liquid_phonemes, self.fricative_phonemes)
+        flags = np.array([[c.isalpha()] + [c in phonemes for phonemes in classes] for c in text_lower],
+                         dtype=np.int64).reshape(len(text_lower), 5)
+        prefix = np.vstack([np.zeros((1, 5), dtype=np.int64), np.cumsum(flags, axis=0)])
+        
+        def phonetic_profile(start: int, end: int) -> Dict[str, Any]:
+            total_chars, soft, harsh, liquid, fricative = (prefix[end] - prefix[start]).tolist()
+            if total_chars == 0:
+                return {}
+            return {
+                'soft_ratio': soft / total_chars,
+                'harsh_ratio': harsh / total_chars,
+                'liquid_ratio': liquid / total_chars,
+                'fricative_ratio': fricative / total_chars,
+                'dominant': max([
+                    ('soft', soft),
+                    ('harsh', harsh),
+                    ('liquid', liquid),
+                    ('fricative', fricative)
+                ], key=lambda x: x[1])[0]
+            }
+        
+        token_signatures = []
+        seen: Dict[str, Dict[str, Any]] = {}
+        cursor = 0
+        for token in tokens:
+            if token in seen:
+                # A token's signature depends only on the token and the context
+                signature = seen[token]
+                token_signatures.append(dict(signature, evidence=list(signature['evidence']),
+                                             coordinates=signature['coordinates'].copy()))
+                continue
+            token_lower = token.lower()
+            start = text_lower.find(token_lower, cursor) if token_lower else -1
+            if start < 0 or len(token_lower) != len(token):
+                token_signatures.append(self.calculate_field_signature(token, context))
+                continue
+            end = start + len(token_lower)
+            cursor = end
+            
+            first, last = bisect_left(hit_starts, start), bisect_left(hit_starts, end)
+            found = {m for _, e, m in text_hits[first:last] if e <= end}
+            found |= context_found | joint_markers(token_lower)
+            seen[token] = self._build_signature(
+                phonetic_profile(start, end),
+                self.analyze_morphological_structure(token),
+                self._markers_from_hits(found, table)
+            )
+            token_signatures.append(seen[token])
+        
+        found = {m for _, _, m in text_hits} | context_found | joint_markers(text_lower)
+        text_signature = self._build_signature(
+            phonetic_profile(0, len(text_lower)),
+            self.analyze_morphological_structure(text),
+            self._markers_from_hits(found, table)
+        )
+        
+        return token_signatures, text_signature
+    
     def normalize_greek(self, text: str) -> str:
         """Strip diacritics and accents from Greek text for marker matching."""
         # Normalize to NFD form (decompose characters)
@@ -19,6 +19,7 @@ from experiments.enhanced_pattern_detector import EnhancedPatternDetector
 from experiments.greek_pattern_detector import GreekPatternDetector
 from experiments.spanish_pattern_detector import SpanishPatternDetector
 from experiments.chinese_pattern_detector import ChinesePatternDetector
+from experiments.corpus_store import open_corpus
 
 
 class EnhancedVerseMatcher:
@@ -63,23 +64,12 @@ class EnhancedVerseMatcher:
         self._load_verse_data()
     
     def _load_verse_data(self):
-        """Load all verse data for lookup."""
-        files = {
-            'english': 'experiments/nwt_mark_chapter1.json',
-            'wedau': 'experiments/wedau_mark_chapter1.json',
-            'greek': 'experiments/greek_mark_chapter1.json',
-            'spanish': 'experiments/spanish_mark_chapter1.json',
-            'chinese': 'experiments/chinese_mark_chapter1.json'
-        }
-        
-        for lang, filepath in files.items():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.verse_data[lang] = data['verses']
-            except FileNotFoundError:
-                print(f"Warning: {filepath} not found")
-                self.verse_data[lang] = {}
+        """Load Mark 1 in every language from the corpus store."""
+        store = open_corpus()
+        for lang in self.detectors:
+            self.verse_data[lang] = store.chapter(lang, 'mark', 1)
+            if not self.verse_data[lang]:
+                print(f"Warning: no {lang} verses for Mark 1 in the corpus store")
     
     def weighted_distance(self, coords1: np.ndarray, coords2: np.ndarray) -> float:
         """
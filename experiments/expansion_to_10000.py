@@ -6,11 +6,13 @@ New Domains: Arts & Aesthetics, Economy & Commerce
 
 import json
 import numpy as np
-import random
 from pathlib import Path
 from typing import Dict, List, Tuple
 import sys
 
+from space_expansion import BulkExpansionEngine, ExpansionShortfall
+from semantic_space_store import load_space, open_space_store, EXPORT_JSON_SNAPSHOTS
+
 # Constants for LJPW Equilibrium
 PHI = 0.618033988749895  # Golden Ratio (Love)
 SQRT2_MINUS_1 = 0.414213562373095  # Silver Ratio (Justice)
@@ -24,12 +26,13 @@ class TenThousandMapper:
         self.base_path = Path("experiments")
         self.input_file = self.base_path / "semantic_space_6854_SOCIAL.json"
         self.output_file = self.base_path / "semantic_space_10000_MILESTONE.json"
+        self.input_tag = "6854_SOCIAL"
+        self.output_tag = "10000_MILESTONE"
         self.data = self.load_data()
         
     def load_data(self):
-        print(f"Loading base semantic space from {self.input_file}...")
-        with open(self.input_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        print(f"Loading base semantic space {self.input_tag}...")
+        return load_space(self.input_tag, self.input_file)
 
     def generate_arts_concepts(self) -> Dict:
         """Generate Arts & Aesthetics domain concepts."""
@@ -234,91 +237,15 @@ class TenThousandMapper:
         needed = target_total - current_total
         print(f"Need approximately {needed} additional concepts.")
         
-        new_concepts = {}
-        
-        # Get list of existing keys to sample from
-        keys = list(existing_concepts.keys())
-        
-        # Prefixes/Suffixes for generating variations
-        modifiers = {
-            "anti": ([-0.2, 0.0, 0.1, 0.0], "Opposing or opposite of "),
-            "meta": ([0.0, 0.0, 0.0, 0.2], "Higher level nature of "),
-            "hyper": ([0.0, 0.0, 0.2, 0.0], "Extreme or excessive "),
-            "pseudo": ([0.0, -0.2, 0.0, -0.1], "False or imitation "),
-            "neo": ([0.0, 0.0, 0.1, 0.1], "New or revived form of "),
-            "post": ([0.0, 0.0, 0.0, 0.1], "Subsequent to "),
-            "pre": ([0.0, 0.0, 0.0, -0.1], "Prior to "),
-            "sub": ([0.0, -0.1, -0.1, 0.0], "Lower or subordinate "),
-            "super": ([0.1, 0.0, 0.2, 0.0], "Higher or superior "),
-            "inter": ([0.1, 0.0, 0.0, 0.1], "Between or among "),
-        }
+        # Candidates are sampled, blended and deduplicated in vectorized batches
+        engine = BulkExpansionEngine(existing_concepts)
+        try:
+            new_concepts = engine.expand(needed)
+        except ExpansionShortfall as shortfall:
+            print(f"WARNING: {shortfall}; the space is too crowded for more separated concepts.")
+            new_concepts = shortfall.concepts
+        generated_count = len(new_concepts)
         
-        generated_count = 0
-        attempts = 0
-        
-        while generated_count < needed and attempts < needed * 4:
-            attempts += 1
-            
-            # Strategy 1: Modification
-            if random.random() < 0.4:
-                base_key = random.choice(keys)
-                base_concept = existing_concepts[base_key]
-                mod_prefix, (mod_delta, mod_desc) = random.choice(list(modifiers.items()))
-                
-                new_key = f"{mod_prefix}_{base_key}"
-                if new_key in existing_concepts or new_key in new_concepts:
-                    continue
-                    
-                base_name = base_concept.get('name', base_key.replace('_', ' ').title())
-                
-                base_coords = np.array(base_concept['coordinates'])
-                delta = np.array(mod_delta)
-                # Add some noise
-                noise = (np.random.rand(4) - 0.5) * 0.05
-                new_coords = np.clip(base_coords + delta + noise, 0.01, 0.99)
-                
-                new_concepts[new_key] = {
-                    "name": f"{mod_prefix.capitalize()}-{base_name}",
-                    "definition": f"{mod_desc}{base_concept['definition'].lower()}",
-                    "coordinates": new_coords.tolist(),
-                    "domain": base_concept.get('domain', 'Derived'),
-                    "generated": True
-                }
-                generated_count += 1
-
-            # Strategy 2: Blending / Interpolation
-            else:
-                key1, key2 = random.sample(keys, 2)
-                c1 = existing_concepts[key1]
-                c2 = existing_concepts[key2]
-                
-                # Only blend if somewhat related (simple heuristic: Euclidean distance < 0.5)
-                coord1 = np.array(c1['coordinates'])
-                coord2 = np.array(c2['coordinates'])
-                dist = np.linalg.norm(coord1 - coord2)
-                
-                if dist < 0.5:
-                    midpoint = (coord1 + coord2) / 2
-                    # Add noise
-                    noise = (np.random.rand(4) - 0.5) * 0.05
-                    new_coords = np.clip(midpoint + noise, 0.01, 0.99)
-                    
-                    new_key = f"{key1}_{key2}_blend"
-                    if new_key in existing_concepts or new_key in new_concepts:
-                        continue
-                        
-                    n1 = c1.get('name', key1.replace('_', ' ').title())
-                    n2 = c2.get('name', key2.replace('_', ' ').title())
-                    
-                    new_concepts[new_key] = {
-                        "name": f"{n1}-{n2} Hybrid",
-                        "definition": f"Conceptual blend of {n1} and {n2}",
-                        "coordinates": new_coords.tolist(),
-                        "domain": c1.get('domain', 'Blended'),
-                        "generated": True
-                    }
-                    generated_count += 1
-                    
         print(f"Generated {generated_count} interpolated concepts.")
         return new_concepts
 
@@ -387,10 +314,27 @@ class TenThousandMapper:
         self.data['metadata']['version'] = "25.0-MILESTONE_10K"
         self.data['metadata']['milestone'] = "10,000 CONCEPTS - 10% MILESTONE ACHIEVED!"
         
-        # Save
-        print(f"Saving to {self.output_file}...")
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        # Save: only the new domains and concepts are written, as a new version
+        new_domains = ("arts_aesthetics", "economy_commerce", "semantic_exploration")
+        store = open_space_store()
+        version = store.commit(
+            concepts={
+                "arts_aesthetics": arts_concepts,
+                "economy_commerce": econ_concepts,
+                "semantic_exploration": expansion_concepts,
+            },
+            domains={key: self.data['domains'][key] for key in new_domains},
+            header={k: v for k, v in self.data.items() if k != 'domains'},
+            parent=self.input_tag,
+            tag=self.output_tag,
+            message="expansion to 10,000: arts, economy and interpolated concepts",
+        )
+        print(f"Committed version {version} ({self.output_tag})")
+        if EXPORT_JSON_SNAPSHOTS:
+            print(f"Saving to {self.output_file}...")
+            with open(self.output_file, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            store.record_snapshot(self.output_tag, self.output_file)
             
         print(f"{'='*60}")
         print(f"EXPANSION COMPLETE")
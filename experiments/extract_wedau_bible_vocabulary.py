@@ -20,137 +20,67 @@ Available books:
 - And many more...
 """
 
-import os
-import re
 import sys
 import json
+import argparse
 from pathlib import Path
 from collections import Counter
 
+from usfm_tokenizer import BIBLE_DIR, BIBLE_ZIP, USFMBook, list_usfm_files, tokenize_book, tokenize_corpus
+
 # Fix Windows console encoding
 sys.stdout.reconfigure(encoding='utf-8')
 
-# Path to Wedau Bible files
-BIBLE_DIR = Path(__file__).parent.parent / "corpus" / "wedau_bible"
-
-# USFM markers to skip (metadata, not content)
-SKIP_MARKERS = ['id', 'h', 'toc1', 'toc2', 'mt1', 'mt2', 'imt1', 'imq', 'ipr', 
-                'im', 'ili', 'iot', 'io1', 'io2', 'io3', 'c', 's1', 's2', 
-                'f', 'x', 'fig', 'fr', 'ft', 'fq', 'xo', 'xt', 'r', 'rq',
-                'mi', 'sp', 'qs', 'qa', 'qac']
-
-
-def extract_wedau_text(usfm_content: str) -> str:
-    """Extract plain Wedau text from USFM markup."""
-    
-    # Remove footnotes and cross-references
-    text = re.sub(r'\\f\s+.*?\\f\*', '', usfm_content)
-    text = re.sub(r'\\x\s+.*?\\x\*', '', text)
-    
-    # Remove figure references
-    text = re.sub(r'\\fig\s+.*?\\fig\*', '', text)
-    
-    # Remove word attributes
-    text = re.sub(r'\\w\s+(.*?)\|.*?\\w\*', r'\1', text)
-    
-    # Remove quoted text markers but keep content
-    text = re.sub(r'\\qt\s+(.*?)\\qt\*', r'\1', text)
-    
-    # Remove emphasis markers but keep content
-    text = re.sub(r'\\em\s+(.*?)\\em\*', r'\1', text)
-    
-    # Remove transliteration markers but keep content
-    text = re.sub(r'\\tl\s+(.*?)\\tl\*', r'\1', text)
-    
-    # Remove divine name markers but keep content
-    text = re.sub(r'\\nd\s+(.*?)\\nd\*', r'\1', text)
-    
-    # Remove proper name markers but keep content
-    text = re.sub(r'\\pn\s*(.*?)\\pn\*', r'\1', text)
-    
-    # Remove structural markers (keep verse content)
-    for marker in SKIP_MARKERS:
-        text = re.sub(rf'\\{marker}\s+.*', '', text)
-    
-    # Keep verse markers for context but extract text after them
-    # \v 1 text -> extract "text"
-    
-    # Remove remaining USFM markers
-    text = re.sub(r'\\[a-z0-9]+\s*', ' ', text)
-    
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    return text
-
+# Front matter and introduction files (no verse text)
+FRONT_MATTER_PREFIXES = ('00-', '01-')
 
-def extract_words(text: str) -> list:
-    """Extract individual words from text."""
-    
-    # Remove punctuation except for special Wedau characters
-    text = re.sub(r'[.,;:!?"\'\[\]()—\-–]', ' ', text)
-    
-    # Split into words
-    words = text.lower().split()
-    
-    # Filter out numbers, references, and very short strings
-    words = [w for w in words if len(w) > 1 and not w.isdigit()]
-    
-    return words
 
-
-def process_usfm_file(filepath: Path) -> dict:
-    """Process a single USFM file."""
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def process_usfm_book(book: USFMBook) -> dict:
+    """Word statistics for one tokenized USFM book."""
     
-    # Get book name
-    book_match = re.search(r'\\h\s+(.+)', content)
-    book_name = book_match.group(1).strip() if book_match else filepath.stem
-    
-    # Extract text
-    text = extract_wedau_text(content)
-    
-    # Extract words
-    words = extract_words(text)
-    
-    # Count words
+    words = book.words
     word_counts = Counter(words)
     
     return {
-        'book': book_name,
+        'book': book.name,
         'word_count': len(words),
         'unique_words': len(word_counts),
         'words': word_counts
     }
 
 
-def main():
+def process_usfm_file(filepath: Path) -> dict:
+    """Process a single USFM file."""
+    
+    content = filepath.read_text(encoding='utf-8-sig')
+    return process_usfm_book(tokenize_book(filepath.name, content))
+
+
+def main(source: Path = None, workers: int = None):
     print("=" * 70)
     print("WEDAU BIBLE VOCABULARY EXTRACTOR")
     print("=" * 70)
     
-    if not BIBLE_DIR.exists():
-        print(f"ERROR: Bible directory not found: {BIBLE_DIR}")
+    if source is None:
+        # Extracted files if present, otherwise read the archive in place
+        source = BIBLE_DIR if BIBLE_DIR.exists() else BIBLE_ZIP
+    if not Path(source).exists():
+        print(f"ERROR: Bible source not found: {source}")
         return
     
     # Find all USFM files
-    usfm_files = list(BIBLE_DIR.glob("*.usfm"))
-    print(f"\nFound {len(usfm_files)} USFM files")
+    usfm_files = list_usfm_files(source)
+    print(f"\nFound {len(usfm_files)} USFM files in {source}")
     
-    # Process each file
+    # Tokenize books in parallel (front matter has no verse text)
+    books = [name for name in usfm_files if not name.startswith(FRONT_MATTER_PREFIXES)]
     all_words = Counter()
     book_stats = []
     
-    for filepath in sorted(usfm_files):
-        if filepath.name.startswith('00-') or filepath.name.startswith('01-'):
-            continue  # Skip front matter
-            
-        result = process_usfm_file(filepath)
+    for book in tokenize_corpus(source, books, workers):
+        result = process_usfm_book(book)
         book_stats.append({
-            'file': filepath.name,
+            'file': book.file,
             'book': result['book'],
             'words': result['word_count'],
             'unique': result['unique_words']
@@ -230,4 +160,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Extract vocabulary from the Wedau Bible USFM files")
+    parser.add_argument('--source', type=Path, help="Corpus directory or .zip (default: corpus/wedau_bible)")
+    parser.add_argument('--workers', type=int, help="Worker processes")
+    args = parser.parse_args()
+    main(args.source, args.workers)
@@ -1,13 +1,35 @@
 """
 Extract Wedau verses from HTML and save to JSON
+
+    python experiments/extract_wedau_verses.py                # Mark 1 sample
+    python experiments/extract_wedau_verses.py --all          # every chapter -> corpus/wedau
 """
 
 from wedau_html_parser import WedauHTMLParser
+import argparse
 import json
 
 
+def extract_all(parser: WedauHTMLParser, output_dir: str, workers: int = None):
+    """Parse every chapter in a worker pool and write corpus chapter JSON."""
+    books = parser.parse_all(output_dir, workers)
+    for book, chapters in books.items():
+        verses = sum(data['verse_count'] for data in chapters.values())
+        print(f"  {book}: {len(chapters)} chapters, {verses} verses")
+    print(f"Saved to: {output_dir}/ ({parser.backend} backend)")
+
+
 def main():
+    cli = argparse.ArgumentParser(description="Extract Wedau verses from HTML")
+    cli.add_argument('--all', action='store_true', help="Extract every chapter of every book")
+    cli.add_argument('--output', default='corpus/wedau', help="Output directory for --all")
+    cli.add_argument('--workers', type=int, help="Worker processes for --all")
+    args = cli.parse_args()
+
     parser = WedauHTMLParser('experiments/wed-topura_html')
+    if args.all:
+        extract_all(parser, args.output, args.workers)
+        return
     
     # Extract Mark Chapter 1
     verses = parser.parse_chapter('MRK', 1)
@@ -9,6 +9,7 @@ import sys
 sys.path.append('experiments')
 
 from enhanced_pattern_detector import EnhancedPatternDetector
+from resonance_kernel import concept_kernel, harmonic_match_names
 
 PHI_INV = 1 / ((1 + np.sqrt(5)) / 2)
 SQRT2_M1 = np.sqrt(2) - 1
@@ -45,14 +46,9 @@ def calculate_fractal_coherence(text, context, detector):
     """
     words = text.split()
     
-    # Word-level signatures
-    word_sigs = []
-    for word in words:
-        sig = detector.calculate_field_signature(word, context)
-        word_sigs.append(sig['coordinates'])
-    
-    # Phrase-level signature
-    phrase_sig = detector.calculate_field_signature(text, context)
+    # Word-level and phrase-level signatures in one detector pass
+    word_results, phrase_sig = detector.calculate_field_signatures(words, context, text=text)
+    word_sigs = [sig['coordinates'] for sig in word_results]
     
     # Calculate coherence
     if word_sigs:
@@ -134,22 +130,26 @@ def calculate_optimized_resonance(coord1, coord2, is_enriched=False, fractal_coh
 
 
 def find_resonant_concepts(field_position, all_concepts, fractal_coherence, top_n=20):
-    resonances = []
+    # Same formula as calculate_optimized_resonance, one array pass over all concepts
+    kernel = concept_kernel(all_concepts, 'fractal')
+    top = kernel.search(np.asarray(field_position), top_n, coherence=fractal_coherence)
     
-    for concept in all_concepts:
-        resonance = calculate_optimized_resonance(
-            field_position,
-            concept['coordinates'],
-            concept['is_enriched'],
-            fractal_coherence
-        )
+    resonances = []
+    for rank, index in enumerate(top['index']):
+        concept = all_concepts[index]
+        strength = top['strength'][rank]
         resonances.append({
             'concept': concept,
-            'resonance': resonance
+            'resonance': {
+                'strength': strength,
+                'distance': top['distance'][rank],
+                'harmonic': top['harmonic'][rank],
+                'harmonic_matches': harmonic_match_names(top['codes'][rank]),
+                'is_enriched': concept['is_enriched'],
+                'type': 'strong' if strength > 0.7 else 'moderate' if strength > 0.4 else 'weak'
+            }
         })
-    
-    resonances.sort(key=lambda x: x['resonance']['strength'], reverse=True)
-    return resonances[:top_n]
+    return resonances
 
 
 def translate_final(source_text, context_hint=None, detector=None, all_concepts=None):
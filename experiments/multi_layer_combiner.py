@@ -1,12 +1,43 @@
 """
 Multi-Layer Combiner for Universal Translation System
 Intelligently combines phonetic, morphological, semantic, and contextual signals.
+
+Besides the per-word dict API (combine_signatures, hierarchical_integration),
+the combiner has an array back-end for bulk runs over whole books:
+
+    signatures:  (N, 4 layers, 4 dims)  in LAYERS x DIMENSIONS order
+    confidences: (N, 4 layers)
+    combined = combiner.combine_arrays(signatures, confidences)
+    combined.signatures  # (N, 4), combined.confidence  # (N,)
+
+Row for row it gives the same numbers as combine_signatures.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any, Sequence
 from scipy.stats import hmean  # Harmonic mean for balanced combination
 
+# Layer and dimension order of the array back-end
+LAYERS = ['phonetic', 'morphological', 'semantic', 'context']
+DIMENSIONS = ['L', 'J', 'P', 'W']
+
+# Unknown words fall back to phonetic/morphological
+UNKNOWN_WORD_WEIGHTS = {
+    'phonetic': 0.50,
+    'morphological': 0.30,
+    'semantic': 0.10,
+    'context': 0.10
+}
+
+
+class CombinedLayers(NamedTuple):
+    """Array result of combining N words, rows in input order."""
+    signatures: np.ndarray   # (N, 4) combined L, J, P, W
+    confidence: np.ndarray   # (N,) overall confidence
+    weights: np.ndarray      # (N, 4) adaptive weight per layer
+    unknown: np.ndarray      # (N,) unknown-word fallback used
+    evidence: Optional[List[List[str]]] = None
+
 
 class MultiLayerCombiner:
     """Combines multiple detection layers with adaptive weighting."""
@@ -101,12 +132,7 @@ class MultiLayerCombiner:
         
         # Unknown word fallback: prioritize phonetic/morphological
         if is_unknown:
-            return {
-                'phonetic': 0.50,
-                'morphological': 0.30,
-                'semantic': 0.10,
-                'context': 0.10
-            }
+            return dict(UNKNOWN_WORD_WEIGHTS)
         
         adaptive_weights = {}
         
@@ -273,6 +299,128 @@ class MultiLayerCombiner:
         
         return result
     
+    # -- Array back-end ------------------------------------------------------
+    
+    def detect_unknown_words(self, confidences: np.ndarray) -> np.ndarray:
+        """
+        Vectorized detect_unknown_word.
+        
+        Args:
+            confidences: (N, 4) layer confidences in LAYERS order
+            
+        Returns:
+            (N,) boolean mask of unknown words
+        """
+        confidences = np.asarray(confidences, dtype=float)
+        return (confidences[:, 2] + confidences[:, 3]) < 0.2
+    
+    def adaptive_weight_arrays(
+        self,
+        confidences: np.ndarray,
+        is_unknown: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized adaptive_weight_calculation.
+        
+        Args:
+            confidences: (N, 4) layer confidences in LAYERS order
+            is_unknown: Optional (N,) mask forcing the unknown-word fallback
+            
+        Returns:
+            (N, 4) adaptive weights in LAYERS order
+        """
+        confidences = np.asarray(confidences, dtype=float)
+        unknown = self.detect_unknown_words(confidences)
+        if is_unknown is not None:
+            unknown = unknown | np.asarray(is_unknown, dtype=bool)
+        
+        high = self.high_confidence_threshold
+        low = self.low_confidence_threshold
+        scale = np.select(
+            [confidences >= high, confidences <= low],
+            [1.0 + (confidences - high) * 1.5, confidences / low * 0.5],
+            0.5 + (confidences - low) / (high - low) * 0.5
+        )
+        weights = np.array([self.base_weights[layer] for layer in LAYERS]) * scale
+        
+        # Summed left to right, like the dict version
+        total_weight = weights[:, 0] + weights[:, 1] + weights[:, 2] + weights[:, 3]
+        normalized = total_weight > 0
+        weights[normalized] /= total_weight[normalized, None]
+        
+        weights[unknown] = [UNKNOWN_WORD_WEIGHTS[layer] for layer in LAYERS]
+        return weights
+    
+    def combine_arrays(
+        self,
+        signatures: np.ndarray,
+        confidences: Optional[np.ndarray] = None
+    ) -> CombinedLayers:
+        """
+        Combine the layer signatures of N words at once.
+        
+        Args:
+            signatures: (N, 4, 4) signatures, LAYERS x DIMENSIONS
+            confidences: (N, 4) layer confidences (default: 0.5 everywhere)
+            
+        Returns:
+            CombinedLayers with (N, 4) signatures and (N,) confidences
+        """
+        signatures = np.asarray(signatures, dtype=float)
+        if confidences is None:
+            confidences = np.full(signatures.shape[:2], 0.5)
+        confidences = np.asarray(confidences, dtype=float)
+        
+        unknown = self.detect_unknown_words(confidences)
+        weights = self.adaptive_weight_arrays(confidences)
+        
+        # Accumulate layer by layer so rows match combine_signatures exactly
+        combined = np.zeros((len(signatures), len(DIMENSIONS)))
+        confidence = np.zeros(len(signatures))
+        for i in range(len(LAYERS)):
+            combined += signatures[:, i, :] * weights[:, i, None]
+            confidence += confidences[:, i] * weights[:, i]
+        
+        return CombinedLayers(combined, confidence, weights, unknown)
+    
+    def hierarchical_integration_many(
+        self,
+        raw_features: Sequence[Dict[str, Any]],
+        semantic_markers: Sequence[Dict[str, Any]],
+        context_analysis: Sequence[Dict[str, Any]]
+    ) -> CombinedLayers:
+        """
+        hierarchical_integration for N words, combined in one array pass.
+        
+        Args:
+            raw_features: Phonetic and morphological data per word
+            semantic_markers: Semantic marker detection results per word
+            context_analysis: Context integration results per word
+            
+        Returns:
+            CombinedLayers with the evidence trail of every word
+        """
+        rows = list(zip(raw_features, semantic_markers, context_analysis))
+        signatures = stack_signatures(
+            (raw.get('phonetic_signature'), raw.get('morphological_signature'),
+             markers.get('signature'), context.get('signature'))
+            for raw, markers, context in rows
+        )
+        confidences = np.array([
+            (raw.get('phonetic_confidence', 0.3),
+             raw.get('morphological_confidence', 0.3),
+             markers.get('confidence', 0.0),
+             context.get('context_confidence', 0.0))
+            for raw, markers, context in rows
+        ], dtype=float).reshape(-1, len(LAYERS))
+        
+        evidence = [
+            [*raw.get('evidence', []), *markers.get('evidence', []),
+             *context.get('evidence', [])]
+            for raw, markers, context in rows
+        ]
+        return self.combine_arrays(signatures, confidences)._replace(evidence=evidence)
+    
     def explain_combination(self, combination_result: Dict[str, Any]) -> str:
         """
         Generate human-readable explanation of how layers were combined.
@@ -307,6 +455,20 @@ class MultiLayerCombiner:
         return "\n".join(explanation)
 
 
+def stack_signatures(rows) -> np.ndarray:
+    """
+    Stack per-word layer signatures into an (N, 4, 4) tensor.
+    
+    Each row holds one LJPW dict per layer in LAYERS order; missing or empty
+    signatures and missing dimensions default to 0.5, as in combine_signatures.
+    """
+    tensor = [
+        [[(sig or {}).get(dim, 0.5) for dim in DIMENSIONS] for sig in row]
+        for row in rows
+    ]
+    return np.array(tensor, dtype=float).reshape(-1, len(LAYERS), len(DIMENSIONS))
+
+
 if __name__ == "__main__":
     # Test the multi-layer combiner
     combiner = MultiLayerCombiner()
@@ -359,7 +521,26 @@ if __name__ == "__main__":
     )
     
     print("\n" + combiner.explain_combination(result))
-    
+
+    # Test 3: Bulk combination
+    print("\n\n3. Bulk Combination (array back-end):")
+
+    rng = np.random.default_rng(0)
+    n_words = 10000
+    bulk_signatures = rng.random((n_words, len(LAYERS), len(DIMENSIONS)))
+    bulk_confidences = rng.random((n_words, len(LAYERS)))
+    bulk = combiner.combine_arrays(bulk_signatures, bulk_confidences)
+
+    single = combiner.combine_signatures(
+        *[dict(zip(DIMENSIONS, sig)) for sig in bulk_signatures[0]],
+        layer_confidences=dict(zip(LAYERS, bulk_confidences[0]))
+    )
+    matches = np.allclose(bulk.signatures[0], [single['signature'][d] for d in DIMENSIONS])
+    print(f"  Words combined: {n_words}")
+    print(f"  Unknown words:  {int(bulk.unknown.sum())}")
+    print(f"  Mean confidence: {bulk.confidence.mean():.3f}")
+    print(f"  Matches combine_signatures: {matches}")
+
     print("\n" + "="*70)
     print("Multi-Layer Combiner initialized successfully!")
     print("="*70)
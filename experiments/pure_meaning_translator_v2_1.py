@@ -9,6 +9,7 @@ import sys
 sys.path.append('experiments')
 
 from enhanced_pattern_detector import EnhancedPatternDetector
+from resonance_kernel import concept_kernel, harmonic_match_names
 
 # Natural Equilibrium
 PHI_INV = 1 / ((1 + np.sqrt(5)) / 2)
@@ -117,23 +118,29 @@ def calculate_enhanced_resonance(coord1, coord2, is_enriched=False):
 
 def find_resonant_concepts(field_position, all_concepts, top_n=20):
     """Find concepts with enrichment prioritization."""
-    resonances = []
+    # Same formula as calculate_enhanced_resonance, one array pass over all concepts
+    kernel = concept_kernel(all_concepts, 'enriched_v2_1')
+    top = kernel.search(np.asarray(field_position), top_n)
     
-    for concept in all_concepts:
-        resonance = calculate_enhanced_resonance(
-            field_position, 
-            concept['coordinates'],
-            concept['is_enriched']
-        )
+    resonances = []
+    for rank, index in enumerate(top['index']):
+        concept = all_concepts[index]
+        strength = top['strength'][rank]
         resonances.append({
             'concept': concept,
-            'resonance': resonance
+            'resonance': {
+                'strength': strength,
+                'distance': top['distance'][rank],
+                'harmonic': top['harmonic'][rank],
+                'alignment': top['alignment'][rank],
+                'emergent': top['emergent'][rank],
+                'harmonic_matches': harmonic_match_names(top['codes'][rank]),
+                'is_enriched': concept['is_enriched'],
+                'type': 'strong' if strength > 0.7 else 'moderate' if strength > 0.4 else 'weak'
+            }
         })
     
-    # Sort by resonance strength
-    resonances.sort(key=lambda x: x['resonance']['strength'], reverse=True)
-    
-    return resonances[:top_n]
+    return resonances
 
 
 def translate_v2_1(source_text, context_hint=None, detector=None, all_concepts=None):
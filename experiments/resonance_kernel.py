@@ -0,0 +1,367 @@
+"""
+Resonance Kernel
+Vectorized resonance scoring of one field position against a whole concept matrix.
+
+Computes the same Distance, Harmonic, Alignment and Emergent components as
+CosmicResonator.calculate_resonance and the translator resonance functions,
+but for all (n, 4) concepts in one pass of NumPy, followed by argpartition
+top-k selection.
+
+search() adds coarse-to-fine pruning: only the distance component depends on
+how far a concept is, so a radius can be derived beyond which no concept can
+reach the current k-th best score. Only concepts inside it are rescored.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Dict, List, Optional, Any
+
+# Dimension pairs checked for harmonic ratios (same order as the scalar loops)
+DIMENSION_PAIRS = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+PAIR_I = np.array([p[0] for p in DIMENSION_PAIRS])
+PAIR_J = np.array([p[1] for p in DIMENSION_PAIRS])
+
+# Harmonic intervals: (name, query ratio range, max ratio difference, strength)
+HARMONIC_INTERVALS = [
+    ('perfect_fifth', 1.45, 1.55, 0.1, 0.4),
+    ('unison', 0.95, 1.05, 0.05, 0.5),
+    ('golden_ratio', 1.60, 1.65, 0.1, 0.6),
+]
+
+# Component weights of the combined resonance
+WEIGHTS = {'distance': 0.40, 'harmonic': 0.25, 'alignment': 0.20, 'emergent': 0.15}
+
+
+class ResonanceKernel:
+    """
+    Array resonance scoring over a fixed concept matrix.
+
+    Concept-side features (dimension ratios, emergent dimensions, high/low
+    masks) are computed once at construction; each query is then a few
+    vector operations over all concepts.
+
+    The variants used across the translators are selected with flags:
+    - CosmicResonator: align 0.65/0.35, ratio guard on both coordinates,
+      harmonic capped at 1.0, CW+LP emergent similarity
+    - pure_meaning_translator_v2_1: align 0.7/0.3, query-only ratio guard,
+      uncapped harmonic, CW+LP emergent, 'v2_1' enrichment boost
+    - fractal_translator_final: as v2.1 but CW-only emergent, coherence
+      factor and 'strong_only' enrichment boost
+    """
+
+    def __init__(self,
+                 coords: np.ndarray,
+                 enriched: Optional[np.ndarray] = None,
+                 align_high: float = 0.65,
+                 align_low: float = 0.35,
+                 guard_concepts: bool = True,
+                 cap_harmonic: bool = True,
+                 emergent: str = 'cw_lp',
+                 enrichment_boost: Optional[str] = None):
+        if emergent not in ('cw_lp', 'cw'):
+            raise ValueError(f"Unknown emergent mode: {emergent}")
+        if enrichment_boost not in (None, 'v2_1', 'strong_only'):
+            raise ValueError(f"Unknown enrichment boost: {enrichment_boost}")
+
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 4)
+        n = len(self.coords)
+        self.enriched = (np.zeros(n, dtype=bool) if enriched is None
+                         else np.asarray(enriched, dtype=bool))
+        self.align_high = align_high
+        self.align_low = align_low
+        self.guard_concepts = guard_concepts
+        self.cap_harmonic = cap_harmonic
+        self.emergent = emergent
+        self.enrichment_boost = enrichment_boost
+
+        c = self.coords
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.ratios = c[:, PAIR_I] / c[:, PAIR_J]  # (n, 6); inf/nan never match
+        self.pair_valid = (c[:, PAIR_I] > 0.01) & (c[:, PAIR_J] > 0.01)
+        self.high = c > align_high
+        self.low = c < align_low
+        self.cw = (c[:, 0] + c[:, 3]) - (c[:, 1] + c[:, 2])
+        self.lp = (c[:, 0] + c[:, 2]) - (c[:, 1] + c[:, 3])
+        self._tree: Optional[cKDTree] = None
+        self._enriched_rows: Optional[np.ndarray] = None
+
+    @classmethod
+    def cosmic(cls, coords: np.ndarray) -> 'ResonanceKernel':
+        """Kernel matching CosmicResonator.calculate_resonance."""
+        return cls(coords)
+
+    @classmethod
+    def enriched_v2_1(cls, coords: np.ndarray, enriched: np.ndarray) -> 'ResonanceKernel':
+        """Kernel matching pure_meaning_translator_v2_1.calculate_enhanced_resonance."""
+        return cls(coords, enriched, align_high=0.7, align_low=0.3,
+                   guard_concepts=False, cap_harmonic=False,
+                   emergent='cw_lp', enrichment_boost='v2_1')
+
+    @classmethod
+    def fractal(cls, coords: np.ndarray, enriched: np.ndarray) -> 'ResonanceKernel':
+        """Kernel matching fractal_translator_final.calculate_optimized_resonance."""
+        return cls(coords, enriched, align_high=0.7, align_low=0.3,
+                   guard_concepts=False, cap_harmonic=False,
+                   emergent='cw', enrichment_boost='strong_only')
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def score(self, query: np.ndarray, coherence: float = 1.0,
+              rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Score one query against every concept (or a subset of rows).
+
+        Args:
+            query: Field position [L, J, P, W]
+            coherence: Fractal coherence factor (only used when the kernel
+                       applies the 'strong_only' boost, like the fractal translator)
+            rows: Optional concept row indices to score instead of all
+
+        Returns:
+            Dict of arrays: strength, distance, distance_strength, harmonic,
+            alignment, emergent and harmonic codes (n, 6) where 0 = none and
+            k > 0 = HARMONIC_INTERVALS[k - 1]
+        """
+        q = np.asarray(query, dtype=float)
+        sel = slice(None) if rows is None else rows
+        coords = self.coords[sel]
+
+        # 1. Distance
+        distance = np.linalg.norm(coords - q, axis=1)
+        distance_strength = 1.0 / (1.0 + distance * 2.0)
+
+        # 2. Harmonic: the interval is decided by the query ratio alone
+        harmonic = np.zeros(len(coords))
+        codes = np.zeros((len(coords), len(DIMENSION_PAIRS)), dtype=np.int8)
+        ratios = self.ratios[sel]
+        pair_valid = self.pair_valid[sel] if self.guard_concepts else None
+        for p, (i, j) in enumerate(DIMENSION_PAIRS):
+            if not (q[i] > 0.01 and q[j] > 0.01):
+                continue
+            ratio1 = q[i] / q[j]
+            for k, (_, low, high, tolerance, strength) in enumerate(HARMONIC_INTERVALS):
+                if low < ratio1 < high:
+                    match = np.abs(ratio1 - ratios[:, p]) < tolerance
+                    if pair_valid is not None:
+                        match &= pair_valid[:, p]
+                    harmonic += np.where(match, strength, 0.0)
+                    codes[match, p] = k + 1
+                    break
+        if self.cap_harmonic:
+            harmonic = np.minimum(harmonic, 1.0)
+
+        # 3. Dimensional alignment
+        aligned = ((self.high[sel] & (q > self.align_high)) |
+                   (self.low[sel] & (q < self.align_low)))
+        alignment = np.minimum(aligned.sum(axis=1) * 0.25, 1.0)
+
+        # 4. Emergent dimension similarity
+        cw_q = (q[0] + q[3]) - (q[1] + q[2])
+        if self.emergent == 'cw_lp':
+            lp_q = (q[0] + q[2]) - (q[1] + q[3])
+            emergent = 1.0 - (np.abs(cw_q - self.cw[sel]) + np.abs(lp_q - self.lp[sel])) / 4.0
+            emergent = np.maximum(emergent, 0.0)
+        else:
+            emergent = 1.0 - np.minimum(np.abs(cw_q - self.cw[sel]) / 2.0, 1.0)
+
+        # 5. Combined
+        strength = (distance_strength * WEIGHTS['distance'] +
+                    harmonic * WEIGHTS['harmonic'] +
+                    alignment * WEIGHTS['alignment'] +
+                    emergent * WEIGHTS['emergent'])
+
+        enriched = self.enriched[sel]
+        if self.enrichment_boost == 'v2_1':
+            boost = np.where(strength > 0.3, 1.25, 1.10)
+            strength = np.where(enriched, np.minimum(1.0, strength * boost), strength)
+        elif self.enrichment_boost == 'strong_only':
+            strength = strength * (0.9 + 0.1 * coherence)
+            strength = np.where(enriched & (strength > 0.3),
+                                np.minimum(1.0, strength * 1.25), strength)
+
+        return {
+            'strength': strength,
+            'distance': distance,
+            'distance_strength': distance_strength,
+            'harmonic': harmonic,
+            'alignment': alignment,
+            'emergent': emergent,
+            'codes': codes,
+        }
+
+    def top_k(self, query: np.ndarray, k: int, coherence: float = 1.0,
+              rows: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Highest-resonance concepts for one query.
+
+        Returns:
+            The score() arrays restricted to the top k, sorted by strength
+            (descending), plus 'index' with the concept row of each entry
+        """
+        scores = self.score(query, coherence, rows)
+        strength = scores['strength']
+        k = min(k, len(strength))
+        if k <= 0:
+            top = np.array([], dtype=int)
+        else:
+            top = np.argpartition(-strength, k - 1)[:k]
+            top = top[np.argsort(-strength[top], kind='stable')]
+        result = {name: values[top] for name, values in scores.items()}
+        result['index'] = top if rows is None else np.asarray(rows)[top]
+        return result
+
+    def upper_bound(self, query: np.ndarray, distance, coherence: float = 1.0,
+                    enriched: bool = False):
+        """
+        Upper bound on the strength of any concept at a given distance.
+
+        Harmonic and alignment can only score on pairs/dimensions where the
+        query itself qualifies, emergent similarity is at most 1, and the
+        boosts are at most their largest factor.
+
+        Args:
+            query: Field position
+            distance: Euclidean distance (scalar or array)
+            coherence: Fractal coherence factor
+            enriched: Bound for enriched concepts (includes their boost)
+        """
+        q = np.asarray(query, dtype=float)
+        harmonic_max = 0.0
+        for i, j in DIMENSION_PAIRS:
+            if q[i] > 0.01 and q[j] > 0.01:
+                ratio1 = q[i] / q[j]
+                for _, low, high, _, strength in HARMONIC_INTERVALS:
+                    if low < ratio1 < high:
+                        harmonic_max += strength
+                        break
+        if self.cap_harmonic:
+            harmonic_max = min(harmonic_max, 1.0)
+        alignment_max = min(0.25 * int(np.sum((q > self.align_high) | (q < self.align_low))), 1.0)
+
+        bound = (WEIGHTS['distance'] / (1.0 + 2.0 * np.asarray(distance)) +
+                 WEIGHTS['harmonic'] * harmonic_max +
+                 WEIGHTS['alignment'] * alignment_max +
+                 WEIGHTS['emergent'] * 1.0)
+        if self.enrichment_boost == 'strong_only':
+            bound = bound * (0.9 + 0.1 * coherence)
+        if enriched and self.enrichment_boost is not None:
+            bound = bound * 1.25
+        return bound
+
+    def pruning_radius(self, query: np.ndarray, threshold: float,
+                       coherence: float = 1.0, enriched: bool = False) -> float:
+        """
+        Distance beyond which no concept can reach `threshold` strength.
+
+        Returns np.inf when the non-distance components alone could reach it.
+        """
+        offset = self.upper_bound(query, np.inf, coherence, enriched)  # no distance term
+        scale = self.upper_bound(query, 0.0, coherence, enriched) - offset
+        if threshold <= offset or scale <= 0:
+            return np.inf
+        # scale / (1 + 2r) = threshold - offset
+        return max(0.0, (scale / (threshold - offset) - 1.0) / 2.0)
+
+    def search(self, query: np.ndarray, k: int, coherence: float = 1.0,
+               seed_size: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Top-k resonance search with spatial candidate pruning.
+
+        Stage one scores the `seed_size` nearest concepts to set a threshold
+        (the k-th best strength) and converts it into a radius via
+        pruning_radius(); every concept inside it is fetched from a KD-tree.
+        Enriched concepts get their own (boosted) radius. Stage two rescores
+        the candidates exactly. Concepts outside the radius provably cannot
+        beat the threshold, so the result equals top_k() up to ties.
+
+        Returns:
+            Same as top_k(), plus 'scored': number of concepts scored
+        """
+        n = len(self.coords)
+        k = min(k, n)
+        if k <= 0:
+            result = self.top_k(query, k, coherence)
+            result['scored'] = 0
+            return result
+        if self._tree is None:
+            self._tree = cKDTree(self.coords)
+            self._enriched_rows = np.flatnonzero(self.enriched)
+
+        q = np.asarray(query, dtype=float)
+        seed_size = min(n, seed_size or max(4 * k, 64))
+        _, seed = self._tree.query(q, k=seed_size)
+        seed = np.atleast_1d(seed)
+        seed_strength = self.score(q, coherence, rows=seed)['strength']
+        threshold = np.partition(seed_strength, len(seed_strength) - k)[len(seed_strength) - k]
+
+        radius = self.pruning_radius(q, threshold, coherence)
+        enriched_radius = self.pruning_radius(q, threshold, coherence, enriched=True)
+        if not np.isfinite(radius):
+            result = self.top_k(q, k, coherence)
+            result['scored'] = n
+            return result
+
+        # Small tolerance so boundary concepts are never lost to rounding
+        candidates = np.array(self._tree.query_ball_point(q, radius + 1e-9), dtype=int)
+        enriched_rows = self._enriched_rows
+        if len(enriched_rows):
+            near = np.linalg.norm(self.coords[enriched_rows] - q, axis=1) <= enriched_radius + 1e-9
+            candidates = np.union1d(candidates, enriched_rows[near])
+        candidates = np.union1d(candidates, seed)
+
+        result = self.top_k(q, k, coherence, rows=candidates)
+        result['scored'] = len(candidates)
+        return result
+
+
+def harmonic_match_names(codes: np.ndarray, with_pairs: bool = False) -> List[str]:
+    """
+    Harmonic match labels for one concept's (6,) code row.
+
+    Args:
+        codes: Harmonic codes from ResonanceKernel.score
+        with_pairs: Append the dimension pair (e.g. 'unison_0_3'), as
+                    CosmicResonator does
+    """
+    names = []
+    for p, code in enumerate(codes):
+        if code:
+            name = HARMONIC_INTERVALS[code - 1][0]
+            if with_pairs:
+                i, j = DIMENSION_PAIRS[p]
+                name = f'{name}_{i}_{j}'
+            names.append(name)
+    return names
+
+
+# Kernels for concept lists, so list-based callers build each matrix once
+_CONCEPT_KERNELS: Dict[tuple, tuple] = {}
+
+
+def concept_kernel(concepts: List[Dict[str, Any]], variant: str) -> ResonanceKernel:
+    """
+    Cached kernel for a list of concept dicts ('coordinates', 'is_enriched').
+
+    Args:
+        concepts: Concept list as built by extract_concepts_with_coords
+        variant: 'cosmic', 'enriched_v2_1' or 'fractal'
+    """
+    key = (id(concepts), variant)
+    cached = _CONCEPT_KERNELS.get(key)
+    if cached is not None and cached[0] is concepts and len(cached[1]) == len(concepts):
+        return cached[1]
+
+    coords = np.array([c['coordinates'] for c in concepts], dtype=float).reshape(-1, 4)
+    enriched = np.array([c.get('is_enriched', False) for c in concepts], dtype=bool)
+    if variant == 'cosmic':
+        kernel = ResonanceKernel.cosmic(coords)
+    elif variant == 'enriched_v2_1':
+        kernel = ResonanceKernel.enriched_v2_1(coords, enriched)
+    elif variant == 'fractal':
+        kernel = ResonanceKernel.fractal(coords, enriched)
+    else:
+        raise ValueError(f"Unknown kernel variant: {variant}")
+
+    _CONCEPT_KERNELS[key] = (concepts, kernel)
+    return kernel
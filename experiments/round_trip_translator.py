@@ -10,6 +10,7 @@ from enhanced_pattern_detector import EnhancedPatternDetector
 from greek_pattern_detector import GreekPatternDetector
 from spanish_pattern_detector import SpanishPatternDetector
 from chinese_pattern_detector import ChinesePatternDetector
+from corpus_store import open_corpus
 import numpy as np
 import json
 
@@ -39,19 +40,10 @@ class RoundTripTranslator:
         self._load_verse_data()
     
     def _load_verse_data(self):
-        """Load all verse data for lookup."""
-        files = {
-            'english': 'experiments/nwt_mark_chapter1.json',
-            'wedau': 'experiments/wedau_mark_chapter1.json',
-            'greek': 'experiments/greek_mark_chapter1.json',
-            'spanish': 'experiments/spanish_mark_chapter1.json',
-            'chinese': 'experiments/chinese_mark_chapter1.json'
-        }
-        
-        for lang, filepath in files.items():
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.verse_data[lang] = data['verses']
+        """Load Mark 1 in every language from the corpus store."""
+        store = open_corpus()
+        for lang in self.detectors:
+            self.verse_data[lang] = store.chapter(lang, 'mark', 1)
     
     def analyze_text(self, text: str, language: str) -> dict:
         """Analyze text and return LJPW coordinates."""
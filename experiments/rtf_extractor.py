@@ -1,18 +1,105 @@
 """
 RTF Bible Extractor
 Extracts clean Gospel verses from NWT RTF files
+
+Each book RTF is converted to plain text ONCE (cached on disk, keyed by the
+RTF file's hash) and indexed in a single pass: chapter headings are located
+with precompiled patterns and verses are scanned sequentially with absolute
+offsets. Whole-Bible mode (--all) processes the 66 books in a process pool.
 """
 
 from striprtf.striprtf import rtf_to_text
 import re
 import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Book order of the nwt_NN_*_E.rtf files: (key, display name)
+BIBLE_BOOKS = [
+    ('genesis', 'Genesis'), ('exodus', 'Exodus'), ('leviticus', 'Leviticus'),
+    ('numbers', 'Numbers'), ('deuteronomy', 'Deuteronomy'), ('joshua', 'Joshua'),
+    ('judges', 'Judges'), ('ruth', 'Ruth'), ('1_samuel', '1 Samuel'),
+    ('2_samuel', '2 Samuel'), ('1_kings', '1 Kings'), ('2_kings', '2 Kings'),
+    ('1_chronicles', '1 Chronicles'), ('2_chronicles', '2 Chronicles'), ('ezra', 'Ezra'),
+    ('nehemiah', 'Nehemiah'), ('esther', 'Esther'), ('job', 'Job'), ('psalms', 'Psalms'),
+    ('proverbs', 'Proverbs'), ('ecclesiastes', 'Ecclesiastes'),
+    ('song_of_solomon', 'Song of Solomon'), ('isaiah', 'Isaiah'), ('jeremiah', 'Jeremiah'),
+    ('lamentations', 'Lamentations'), ('ezekiel', 'Ezekiel'), ('daniel', 'Daniel'),
+    ('hosea', 'Hosea'), ('joel', 'Joel'), ('amos', 'Amos'), ('obadiah', 'Obadiah'),
+    ('jonah', 'Jonah'), ('micah', 'Micah'), ('nahum', 'Nahum'), ('habakkuk', 'Habakkuk'),
+    ('zephaniah', 'Zephaniah'), ('haggai', 'Haggai'), ('zechariah', 'Zechariah'),
+    ('malachi', 'Malachi'), ('matthew', 'Matthew'), ('mark', 'Mark'), ('luke', 'Luke'),
+    ('john', 'John'), ('acts', 'Acts'), ('romans', 'Romans'),
+    ('1_corinthians', '1 Corinthians'), ('2_corinthians', '2 Corinthians'),
+    ('galatians', 'Galatians'), ('ephesians', 'Ephesians'), ('philippians', 'Philippians'),
+    ('colossians', 'Colossians'), ('1_thessalonians', '1 Thessalonians'),
+    ('2_thessalonians', '2 Thessalonians'), ('1_timothy', '1 Timothy'),
+    ('2_timothy', '2 Timothy'), ('titus', 'Titus'), ('philemon', 'Philemon'),
+    ('hebrews', 'Hebrews'), ('james', 'James'), ('1_peter', '1 Peter'), ('2_peter', '2 Peter'),
+    ('1_john', '1 John'), ('2_john', '2 John'), ('3_john', '3 John'), ('jude', 'Jude'),
+    ('revelation', 'Revelation'),
+]
+
+BOOK_FILE_PATTERN = re.compile(r'^nwt_(\d{2})_\w+_E\.rtf$')
+
+# "Chapter N" heading lines ("Psalm N" in Psalms)
+CHAPTER_PATTERN = re.compile(r'^(?:Chapter|Psalm) (\d+)\s*$', re.MULTILINE)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Editorial note after the last verse of a book (end of Malachi)
+TRAILER_PATTERN = re.compile(r'^\(End of the translation[^\n]*', re.MULTILINE)
+
+# First verse of a book without chapter headings
+BODY_START_PATTERN = re.compile(r'^1\s', re.MULTILINE)
+
+# Verse number a chapter body opens with
+CHAPTER_OPENING_PATTERN = re.compile(r'\s*(\d+)\s')
+
+# Verse counts where the NWT differs from the reference chapter files
+# (World English Bible): the NWT ends Mark at 16:8 and omits John 7:53-8:11
+REFERENCE_VERSE_COUNTS = {('mark', 16): 8, ('john', 7): 52, ('john', 8): 48}
+
+
+@lru_cache(maxsize=None)
+def _verse_pattern(verse: int):
+    """Whitespace + verse number + whitespace."""
+    return re.compile(rf'\s{verse}\s')
+
+
+@lru_cache(maxsize=None)
+def _verse_start_pattern(verse: int):
+    """Verse number + whitespace, anchored at the search position."""
+    return re.compile(rf'{verse}\s')
+
+
+def _find_verse(text: str, verse: int, pos: int, end: int):
+    """
+    Leftmost (?:^|\\s)N\\s in text[pos:end], treating pos as the start of line.
+
+    Returns (match_start, match_end) or None. Searching with offsets avoids
+    copying the remaining chapter text for every verse.
+    """
+    m = _verse_start_pattern(verse).match(text, pos, end)
+    if m:
+        return m.start(), m.end()
+    m = _verse_pattern(verse).search(text, pos, end)
+    if m:
+        return m.start(), m.end()
+    return None
+
+
 class RTFBibleExtractor:
     """Extract Bible verses from RTF files."""
-    
+
     RTF_DIR = Path('experiments/nwt_E.rtf')
-    
+
+    # Plain-text conversions, keyed by RTF content hash
+    TEXT_CACHE_DIR = Path('experiments/.rtf_text_cache')
+
     # Gospel files
     GOSPEL_FILES = {
         'matthew': 'nwt_40_Mt_E.rtf',
@@ -20,7 +107,7 @@ class RTFBibleExtractor:
         'luke': 'nwt_42_Lu_E.rtf',
         'john': 'nwt_43_Joh_E.rtf'
     }
-    
+
     # Priority chapters for Phase 6
     PRIORITY_CHAPTERS = {
         'mark': [1, 2, 4, 8, 13, 16],
@@ -28,175 +115,242 @@ class RTFBibleExtractor:
         'luke': [1, 6, 15, 24],
         'john': [1, 3, 14, 15, 16, 17, 20, 21]
     }
-    
+
+    def __init__(self):
+        # book -> (text with \xa0 as spaces, {chapter: (start, end) of its body})
+        self._books = {}
+
+    def book_files(self) -> dict:
+        """All 66 books in the RTF directory: key -> file name."""
+        files = {}
+        for path in sorted(self.RTF_DIR.glob('nwt_*_E.rtf')):
+            m = BOOK_FILE_PATTERN.match(path.name)
+            if m and 1 <= int(m.group(1)) <= len(BIBLE_BOOKS):
+                files[BIBLE_BOOKS[int(m.group(1)) - 1][0]] = path.name
+        return files
+
+    def _book_file(self, book: str) -> Path:
+        if book in self.GOSPEL_FILES:
+            return self.RTF_DIR / self.GOSPEL_FILES[book]
+        return self.RTF_DIR / self.book_files()[book]
+
+    def load_text(self, rtf_file: Path) -> str:
+        """Plain text of an RTF file, converting at most once per file content."""
+        data = Path(rtf_file).read_bytes()
+        cache_file = self.TEXT_CACHE_DIR / f'{hashlib.sha256(data).hexdigest()}.txt'
+        if cache_file.exists():
+            return cache_file.read_text(encoding='utf-8')
+
+        text = rtf_to_text(data.decode('utf-8', errors='ignore'))
+        try:
+            self.TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            tmp_file.write_text(text, encoding='utf-8')
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass  # Read-only checkout: just convert again next time
+        return text
+
+    def _book_index(self, book: str):
+        """Converted text and chapter body spans for a book (cached)."""
+        if book not in self._books:
+            # \xa0 -> space keeps every offset, and \xa0 already counts as \s
+            text = self.load_text(self._book_file(book)).replace('\u00a0', ' ')
+            self._books[book] = (text, self._chapter_spans(text))
+        return self._books[book]
+
+    def _chapter_spans(self, text: str) -> dict:
+        """
+        {chapter: (start, end)} of every chapter body in a book's text.
+
+        Books open with an Outline of Contents that repeats the chapter
+        headings, so the body is the LAST run of headings starting at
+        Chapter 1. Each chapter ends at the next body heading; the last one
+        ends at the book's trailing note (if any) or the end of the text.
+        Chapters missing from the body run are simply absent.
+        """
+        headings = [(int(m.group(1)), m.start(), m.end())
+                    for m in CHAPTER_PATTERN.finditer(text)]
+        trailer = TRAILER_PATTERN.search(text)
+        text_end = trailer.start() if trailer else len(text)
+
+        if not headings:
+            # Single-chapter books (Obadiah, Philemon, ...) have no headings:
+            # the body starts at the first line opening with verse 1
+            first = BODY_START_PATTERN.search(text)
+            return {1: (first.start() if first else 0, text_end)}
+
+        body_start = max(i for i, (chapter, _, _) in enumerate(headings) if chapter == 1)
+        body = headings[body_start:]
+        spans = {}
+        for i, (chapter, _, start) in enumerate(body):
+            end = body[i + 1][1] if i + 1 < len(body) else text_end
+            spans.setdefault(chapter, (start, end))
+        return spans
+
+    def expected_chapters(self, book: str) -> int:
+        """Number of chapters listed for a book (outline or body headings)."""
+        text, spans = self._book_index(book)
+        headings = [int(m.group(1)) for m in CHAPTER_PATTERN.finditer(text)]
+        return max(headings + list(spans))
+
+    def _locate_chapter(self, book: str, chapter: int):
+        """(start, end) of a chapter's body, or None if it has no body heading."""
+        _, spans = self._book_index(book)
+        return spans.get(chapter)
+
+    def _scan_verses(self, text: str, start: int, end: int) -> dict:
+        """
+        Sequentially scan verses 1, 2, 3... in text[start:end].
+
+        A chapter whose opening verses are not part of the translation
+        (John 8 starts at verse 12) is scanned from the number it opens with.
+        """
+        verses = {}
+        current_v = 1
+        cursor = start
+        if not _find_verse(text, 1, start, end):
+            opening = CHAPTER_OPENING_PATTERN.match(text, start, end)
+            if opening:
+                current_v = int(opening.group(1))
+
+        while True:
+            match = _find_verse(text, current_v, cursor, end)
+            if not match:
+                break  # No more verses found (normal end of chapter)
+
+            v_start = match[1]
+            match_next = _find_verse(text, current_v + 1, v_start, end)
+            if not match_next:
+                # Last verse: everything to the end of the chapter block
+                verses[str(current_v)] = self._clean_text(text[v_start:end])
+                break
+
+            verses[str(current_v)] = self._clean_text(text[v_start:match_next[0]])
+            cursor = match_next[0]
+            current_v += 1
+
+        return verses
+
+    def _chapter_data(self, name: str, chapter: int, verses: dict) -> dict:
+        return {
+            'book': name,
+            'chapter': chapter,
+            'translation': 'New World Translation',
+            'language': 'English',
+            'verse_count': len(verses),
+            'verses': verses
+        }
+
     def extract_chapter(self, book: str, chapter: int) -> dict:
         """Extract all verses from a specific chapter."""
-        rtf_file = self.RTF_DIR / self.GOSPEL_FILES[book]
-        
         print(f"  Extracting {book.title()} {chapter}...")
-        
+
         try:
-            # Read and convert RTF to plain text
-            with open(rtf_file, 'r', encoding='utf-8', errors='ignore') as f:
-                rtf_content = f.read()
-            
-            text = rtf_to_text(rtf_content)
-            
-            # Find the chapter block
-            # 1. Find all "Chapter X" occurrences
-            chapter_marker = f"Chapter {chapter}"
-            matches = list(re.finditer(rf'^{chapter_marker}\s*$', text, re.MULTILINE))
-            
-            start_idx = -1
-            end_idx = len(text)
-            
-            # 2. Identify the REAL chapter start (not Outline)
-            # The real chapter is followed by verse 1
-            for m in matches:
-                # Look ahead for "1 "
-                # Reduced window to 200 chars to avoid catching Verse 1 of NEXT chapter (or First chapter if matching Outline)
-                chunk = text[m.end():m.end()+200] 
-                if re.search(r'(?:^|\s)1[\s\xa0]', chunk):
-                    start_idx = m.end()
-                    break
-            
-            if start_idx == -1:
-                # Fallback: Try just finding "1 " after ANY "Chapter X"
-                # If rigorous check failed, just take the last "Chapter X" as it's usually the text body
-                # (Outline is usually at start)
-                if matches:
-                    start_idx = matches[-1].end()
-                    print(f"    [WARN] Rigorous check failed, using last occurrence of 'Chapter {chapter}'")
-                else:
-                    print(f"    [WARN] Could not locate 'Chapter {chapter}' marker")
-                    return None
-
-            # 3. Find end of chapter (Chapter X+1 OR End of text)
-            next_chapter_marker = f"Chapter {chapter + 1}"
-            next_matches = list(re.finditer(rf'^{next_chapter_marker}\s*$', text, re.MULTILINE))
-            
-            for m in next_matches:
-                if m.start() > start_idx:
-                    end_idx = m.start()
-                    break
-            
-            chapter_text = text[start_idx:end_idx]
-            
-            # 4. Sequential Verse Scanning
-            # Extract verses 1, 2, 3... in order
-            verses = {}
-            current_v = 1
-            
-            # Replace non-breaking spaces with regular spaces for easier regex
-            chapter_text = chapter_text.replace('\u00a0', ' ')
-            
-            # Current search cursor within chapter_text
-            cursor = 0
-            
-            while True:
-                # Find start of current verse
-                # Pattern: (Start or Space) + N + Space
-                # We search from current cursor position
-                pattern_start = rf'(?:^|\s){current_v}\s'
-                match = re.search(pattern_start, chapter_text[cursor:])
-                
-                if not match:
-                    if current_v == 1:
-                        print(f"    [WARN] Verse 1 not found in extracted text block")
-                        # Debug: print first 100 chars
-                        print(f"    Snippe: {chapter_text[:100]!r}")
-                        return None
-                    break # No more verses found (normal end of chapter)
-                
-                # Start of verse text is end of number match
-                # match.start() is relative to cursor
-                match_abs_start = cursor + match.start()
-                v_start = cursor + match.end()
-                
-                # Find start of NEXT verse to define end of THIS verse
-                pattern_next = rf'(?:^|\s){current_v + 1}\s'
-                match_next = re.search(pattern_next, chapter_text[v_start:])
-                
-                if match_next:
-                    # Found next verse, so this verse ends here
-                    v_end = v_start + match_next.start()
-                    v_text = chapter_text[v_start:v_end]
-                    
-                    # Update cursor to point to the start of the next verse NUMBER
-                    # (so the next iteration finds '{current_v+1} ')
-                    # match_next.start() points to the space before number
-                    cursor = v_start + match_next.start()
-                    
-                else:
-                    # Last verse in chapter
-                    # Capture everything until end of chapter block
-                    # But be careful of trailing junk. Actually chapter split should handle it.
-                    v_text = chapter_text[v_start:]
-                    verses[str(current_v)] = self._clean_text(v_text)
-                    break
-                
-                verses[str(current_v)] = self._clean_text(v_text)
-                current_v += 1
-            
+            text, _ = self._book_index(book)
+            located = self._locate_chapter(book, chapter)
+            if located is None:
+                print(f"    [WARN] Could not locate 'Chapter {chapter}' marker")
+                return None
+            start, end = located
+
+            verses = self._scan_verses(text, start, end)
             if not verses:
-                 print(f"    [WARN] No verses extracted")
-                 return None
-                 
+                print(f"    [WARN] Verse 1 not found in extracted text block")
+                print(f"    Snippe: {text[start:end][:100]!r}")
+                return None
+
             print(f"    [OK] {len(verses)} verses extracted")
-            
-            return {
-                'book': book.title(),
-                'chapter': chapter,
-                'translation': 'New World Translation',
-                'language': 'English',
-                'verse_count': len(verses),
-                'verses': verses
-            }
-            
+            return self._chapter_data(book.title(), chapter, verses)
+
         except Exception as e:
             print(f"    [ERROR] {e}")
             import traceback
             traceback.print_exc()
             return None
 
+    def extract_book(self, book: str, name: str = None) -> dict:
+        """
+        Extract every chapter of a book in one pass over its converted text.
+
+        Returns:
+            {chapter number: chapter data}
+
+        Raises:
+            ValueError: if a chapter listed for the book has no body or no verses
+        """
+        name = name or book.title()
+        text, spans = self._book_index(book)
+        chapters = {}
+        missing = []
+        for chapter in range(1, self.expected_chapters(book) + 1):
+            verses = self._scan_verses(text, *spans[chapter]) if chapter in spans else {}
+            if not verses:
+                missing.append(chapter)
+                continue
+            chapters[chapter] = self._chapter_data(name, chapter, verses)
+        if missing:
+            raise ValueError(f"{name}: no verses found for chapter(s) {missing}")
+        return chapters
+
+    def check_reference_counts(self, book: str, chapters: dict,
+                               reference_dir: str = 'corpus') -> list:
+        """
+        Compare verse counts with the reference chapter files in
+        corpus/<book>/chapter_NN.json (the Gospels).
+
+        Returns:
+            [(chapter, extracted, expected)] for every mismatch
+        """
+        mismatches = []
+        for path in sorted(Path(reference_dir, book).glob('chapter_*.json')):
+            with open(path, encoding='utf-8') as f:
+                reference = json.load(f)
+            chapter = reference['chapter']
+            expected = REFERENCE_VERSE_COUNTS.get((book, chapter), reference['verse_count'])
+            extracted = chapters[chapter]['verse_count'] if chapter in chapters else 0
+            if extracted != expected:
+                mismatches.append((chapter, extracted, expected))
+        return mismatches
+
     def _clean_text(self, text: str) -> str:
         """Clean extracted verse text."""
         # Remove footnotes markers like + or *
         # Consolidate whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         return text.strip()
-    
+
     def extract_all_priority_chapters(self):
         """Extract all priority chapters for Phase 6."""
         print("="*80)
         print("RTF GOSPEL EXTRACTOR (SEQUENTIAL SCAN)")
         print("="*80)
         print()
-        
+
         total_verses = 0
         total_chapters = 0
-        
+
         for book, chapters in self.PRIORITY_CHAPTERS.items():
             print(f"Extracting {book.title()}...")
-            
+
             # Create corpus directory
             corpus_dir = Path(f'corpus/{book}')
             corpus_dir.mkdir(parents=True, exist_ok=True)
-            
+
             for chapter in chapters:
                 chapter_data = self.extract_chapter(book, chapter)
-                
+
                 if chapter_data:
                     # Save to JSON
                     output_file = corpus_dir / f'chapter_{chapter:02d}.json'
                     with open(output_file, 'w', encoding='utf-8') as f:
                         json.dump(chapter_data, f, indent=2, ensure_ascii=False)
-                    
+
                     total_verses += chapter_data['verse_count']
                     total_chapters += 1
-            
+
             print()
-        
+
         print("="*80)
         print("EXTRACTION COMPLETE")
         print("="*80)
@@ -205,9 +359,65 @@ class RTFBibleExtractor:
         print(f"Progress toward 1000-verse goal: {total_verses/10:.1f}%")
         print()
 
+    def extract_bible(self, output_dir: str = 'corpus/nwt_bible', workers: int = None) -> dict:
+        """
+        Extract all 66 books, one book per worker process.
+
+        Writes one JSON per book ({chapter: chapter data}) to output_dir.
+
+        Returns:
+            {book key: number of verses extracted}
+        """
+        print("="*80)
+        print("RTF BIBLE EXTRACTOR (WHOLE BIBLE)")
+        print("="*80)
+        print()
+
+        names = dict(BIBLE_BOOKS)
+        books = list(self.book_files())
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        totals = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [(book, names[book]) for book in books]
+            for (book, name), chapters in zip(jobs, pool.map(_extract_book_job, jobs)):
+                with open(out_dir / f'{book}.json', 'w', encoding='utf-8') as f:
+                    json.dump({str(c): data for c, data in chapters.items()}, f,
+                              indent=2, ensure_ascii=False)
+                totals[book] = sum(data['verse_count'] for data in chapters.values())
+                print(f"  {name:20s} {len(chapters):4d} chapters {totals[book]:6d} verses")
+                for chapter, extracted, expected in self.check_reference_counts(book, chapters):
+                    print(f"    [WARN] {name} {chapter}: {extracted} verses, reference has {expected}")
+
+        print()
+        print("="*80)
+        print("EXTRACTION COMPLETE")
+        print("="*80)
+        print(f"\nBooks extracted: {len(totals)}")
+        print(f"Total verses extracted: {sum(totals.values())}")
+        print()
+        return totals
+
+
+def _extract_book_job(job):
+    """Process-pool entry point: (book key, display name) -> chapters."""
+    book, name = job
+    return RTFBibleExtractor().extract_book(book, name)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Extract NWT verses from RTF files")
+    parser.add_argument('--all', action='store_true', help="Extract all 66 books")
+    parser.add_argument('--output', default='corpus/nwt_bible', help="Output directory for --all")
+    parser.add_argument('--workers', type=int, help="Worker processes for --all")
+    args = parser.parse_args()
+
     extractor = RTFBibleExtractor()
-    extractor.extract_all_priority_chapters()
+    if args.all:
+        extractor.extract_bible(args.output, args.workers)
+    else:
+        extractor.extract_all_priority_chapters()
 
 if __name__ == '__main__':
     main()
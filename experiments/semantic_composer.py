@@ -4,9 +4,18 @@ Uses LJPW coordinates to emergently determine how concepts compose.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from semantic_space_lookup import SemanticSpaceLookup
 
+# Parsed phrase structures kept per composer
+STRUCTURE_CACHE_SIZE = 65536
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Cache key of a phrase: surrounding and repeated whitespace collapsed."""
+    return ' '.join(phrase.split())
+
 
 class SemanticComposer:
     """Dynamic semantic composition using coordinate-based weighting."""
@@ -30,14 +39,18 @@ class SemanticComposer:
             'attribute_noun': {'noun': 1.0, 'attribute': 0.6},  # Noun anchors
             'conjunction': {'concept1': 1.0, 'concept2': 1.0}  # Equal
         }
+        
+        # normalized phrase -> parse_structure result (shared, read-only)
+        self._structures: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def calculate_semantic_weight(self, coords: np.ndarray) -> float:
         """
         Calculate inherent semantic weight from LJPW coordinates.
         
         Higher weight = more influence in composition.
+        Works on one (4,) vector or an (n, 4) array of them.
         """
-        L, J, P, W = coords
+        L, J, P, W = np.moveaxis(np.asarray(coords), -1, 0)
         
         weight = (
             W * self.weight_formula['W'] +
@@ -52,20 +65,22 @@ class SemanticComposer:
         """
         Detect synergistic or conflicting interactions.
         
+        Works on two (4,) vectors or two (n, 4) arrays (row-wise).
+        
         Returns:
             Synergy score: -0.5 (conflict) to 1.0 (synergy)
         """
-        L1, J1, P1, W1 = coord1
-        L2, J2, P2, W2 = coord2
+        L1, J1, P1, W1 = np.moveaxis(np.asarray(coord1), -1, 0)
+        L2, J2, P2, W2 = np.moveaxis(np.asarray(coord2), -1, 0)
         
         # Love-Wisdom synergy (compassionate wisdom)
-        lw_synergy = min(L1, W2) + min(L2, W1)
+        lw_synergy = np.minimum(L1, W2) + np.minimum(L2, W1)
         
         # Justice-Power synergy (righteous authority)
-        jp_synergy = min(J1, P2) + min(J2, P1)
+        jp_synergy = np.minimum(J1, P2) + np.minimum(J2, P1)
         
         # Love-Power conflict (compassion vs force)
-        lp_conflict = abs(L1 - P2) + abs(L2 - P1)
+        lp_conflict = np.abs(L1 - P2) + np.abs(L2 - P1)
         
         synergy_score = (lw_synergy + jp_synergy - lp_conflict * 0.5) / 4
         
@@ -125,6 +140,18 @@ class SemanticComposer:
             'roles': ['concept']
         }
     
+    def parsed_structure(self, phrase: str) -> Dict[str, Any]:
+        """parse_structure of the normalized phrase, cached (treat as read-only)."""
+        key = normalize_phrase(phrase)
+        structure = self._structures.get(key)
+        if structure is not None:
+            self._structures.move_to_end(key)
+            return structure
+        structure = self._structures[key] = self.parse_structure(key)
+        if len(self._structures) > STRUCTURE_CACHE_SIZE:
+            self._structures.popitem(last=False)
+        return structure
+    
     def lookup_components(
         self,
         structure: Dict[str, Any]
@@ -153,7 +180,7 @@ class SemanticComposer:
             }
         """
         # Parse structure
-        structure = self.parse_structure(phrase)
+        structure = self.parsed_structure(phrase)
         
         # Look up components
         component_lookups = self.lookup_components(structure)
@@ -258,6 +285,129 @@ class SemanticComposer:
             'explanation': explanation
         }
     
+    def compose_many(
+        self,
+        phrases: Sequence[str],
+        explain: bool = True,
+        nearest: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Compose a batch of phrases; same results as compose() for each.
+        
+        Structures come from the parse cache, every distinct component is
+        resolved once, and weights, synergy and composition of all
+        two-component phrases are computed as array operations.
+        
+        Args:
+            phrases: Phrases to compose
+            explain: Build the explanation text (skip for bulk glossaries)
+            nearest: Also attach the `nearest` concepts of each result as
+                (name, distance) pairs, from the lookup's KD-tree
+        """
+        structures = [self.parsed_structure(phrase) for phrase in phrases]
+        words = [name for structure in structures for name in structure['components']]
+        rows = self.lookup.find_rows(words).tolist()
+        matrix = self.lookup.coordinate_matrix
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(phrases)
+        pairs = []  # (phrase index, row1, row2, boost1, boost2)
+        negations = []  # (phrase index, row)
+        start = 0
+        for index, (phrase, structure) in enumerate(zip(phrases, structures)):
+            names = structure['components']
+            phrase_rows = rows[start:start + len(names)]
+            start += len(names)
+            structure_type = structure['type']
+            
+            if min(phrase_rows) < 0:
+                missing = [name for name, row in zip(names, phrase_rows) if row < 0]
+                results[index] = {
+                    'coordinates': np.array([0.5, 0.5, 0.5, 0.5]),
+                    'confidence': 0.0,
+                    'components': list(names),
+                    'weights': {},
+                    'synergy': 0.0,
+                    'explanation': f"Missing concepts: {', '.join(missing)}",
+                    'error': 'missing_components'
+                }
+            elif structure_type == 'single':
+                results[index] = {
+                    'coordinates': matrix[phrase_rows[0]].copy(),
+                    'confidence': 1.0,
+                    'components': [names[0]],
+                    'weights': {names[0]: 1.0},
+                    'synergy': 0.0,
+                    'explanation': f"Single concept: {names[0]}"
+                }
+            elif structure_type == 'negation':
+                negations.append((index, phrase_rows[0]))
+                results[index] = {
+                    'coordinates': None,  # filled in below, in one array op
+                    'confidence': 0.8,
+                    'components': [names[0]],
+                    'weights': {names[0]: -1.0},
+                    'synergy': 0.0,
+                    'explanation': f"Negation of {names[0]}"
+                }
+            elif len(names) == 2 and names[0] != names[1]:
+                boosts = self.positional_boosts.get(structure_type, {})
+                roles = structure['roles']
+                pairs.append((index, phrase_rows[0], phrase_rows[1],
+                              boosts.get(roles[0], 1.0), boosts.get(roles[1], 1.0)))
+            else:
+                # Repeated component names collapse in the weight dicts
+                results[index] = self.compose(phrase)
+        
+        if negations:
+            index, row = zip(*negations)
+            negated = np.clip(1.0 - matrix[list(row)], 0, 1)
+            for phrase_index, coords in zip(index, negated):
+                results[phrase_index]['coordinates'] = coords
+        
+        if pairs:
+            index, row1, row2, boost1, boost2 = (np.array(column) for column in zip(*pairs))
+            coords1, coords2 = matrix[row1], matrix[row2]
+            weights1 = self.calculate_semantic_weight(coords1)
+            weights2 = self.calculate_semantic_weight(coords2)
+            adjusted1, adjusted2 = weights1 * boost1, weights2 * boost2
+            total = adjusted1 + adjusted2
+            influence1, influence2 = adjusted1 / total, adjusted2 / total
+            synergy = self.calculate_synergy(coords1, coords2)
+            
+            composed = coords1 * influence1[:, None] + coords2 * influence2[:, None]
+            adjustment = np.where(synergy > 0, 1.0 + synergy * 0.2, 1.0 + synergy * 0.1)
+            composed = np.clip(composed * adjustment[:, None], 0, 1)
+            
+            confidence = np.minimum(total / 2, 1.0)
+            confidence = np.where(synergy > 0, np.minimum(confidence * 1.1, 1.0), confidence)
+            
+            for i, phrase_index in enumerate(index):
+                name1, name2 = structures[phrase_index]['components']
+                influences = {name1: influence1[i], name2: influence2[i]}
+                explanation = ''
+                if explain:
+                    explanation = self.explain_composition(
+                        [(name1, coords1[i]), (name2, coords2[i])],
+                        {name1: weights1[i], name2: weights2[i]},
+                        {name1: adjusted1[i], name2: adjusted2[i]},
+                        influences, synergy[i]
+                    )
+                results[phrase_index] = {
+                    'coordinates': composed[i],
+                    'confidence': confidence[i],
+                    'components': [name1, name2],
+                    'weights': influences,
+                    'synergy': synergy[i],
+                    'explanation': explanation
+                }
+        
+        if nearest > 0 and results:
+            targets = np.array([result['coordinates'] for result in results])
+            for result, hits in zip(results, self.lookup.search_many(targets, nearest)):
+                result['nearest'] = [(name, distance) for name, _, distance in hits]
+        
+        return results
+    
     def explain_composition(
         self,
         components: List[Tuple[str, np.ndarray]],
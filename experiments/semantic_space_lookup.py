@@ -5,8 +5,9 @@ Provides fast concept retrieval from the semantic space.
 
 import json
 import numpy as np
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 from pathlib import Path
+from scipy.spatial import cKDTree
 
 
 class SemanticSpaceLookup:
@@ -18,6 +19,14 @@ class SemanticSpaceLookup:
         self.concepts = {}
         self.index = {}
         self.load_semantic_space()
+        
+        # Columnar view for batch lookups and nearest-neighbour search
+        self.keys = list(self.concepts)
+        self.coordinate_matrix = np.array(
+            [self.concepts[key]['coordinates'] for key in self.keys], dtype=float
+        ).reshape(-1, 4)
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self._tree = None
     
     def load_semantic_space(self):
         """Load all concepts from semantic space."""
@@ -55,20 +64,33 @@ class SemanticSpaceLookup:
             Concept dict with 'name', 'coordinates', 'domain', 'definition'
             or None if not found
         """
+        concept_key = self.find_concept_key(word)
+        return self.concepts[concept_key] if concept_key is not None else None
+    
+    def find_concept_key(self, word: str) -> Optional[str]:
+        """Concept key for a word (case-insensitive), or None."""
         word_lower = word.lower().strip()
         
         # Exact match
         if word_lower in self.index:
-            concept_key = self.index[word_lower]
-            return self.concepts[concept_key]
+            return self.index[word_lower]
         
         # Try with underscores (e.g., "holy spirit" -> "holy_spirit")
-        word_underscore = word_lower.replace(' ', '_')
-        if word_underscore in self.index:
-            concept_key = self.index[word_underscore]
-            return self.concepts[concept_key]
+        return self.index.get(word_lower.replace(' ', '_'))
+    
+    def find_rows(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Row of each word in coordinate_matrix (-1 if not found).
         
-        return None
+        Each distinct word is resolved once, so coordinates of a whole batch
+        are one fancy index: lookup.coordinate_matrix[rows].
+        """
+        resolved = {}
+        for word in words:
+            if word not in resolved:
+                key = self.find_concept_key(word)
+                resolved[word] = self.rows[key] if key is not None else -1
+        return np.array([resolved[word] for word in words], dtype=int)
     
     def find_multiple(self, words: List[str]) -> List[Tuple[str, Optional[Dict]]]:
         """
@@ -98,17 +120,41 @@ class SemanticSpaceLookup:
         Returns:
             List of (name, concept, distance) tuples
         """
-        distances = []
-        
-        for key, concept in self.concepts.items():
-            coords = concept['coordinates']
-            distance = np.linalg.norm(coords - target_coords)
-            distances.append((concept['name'], concept, distance))
+        return self.search_many(np.asarray(target_coords, dtype=float)[None, :], top_n)[0]
+    
+    @property
+    def tree(self) -> cKDTree:
+        """KD-tree over all concept coordinates (built on first use)."""
+        if self._tree is None:
+            self._tree = cKDTree(self.coordinate_matrix)
+        return self._tree
+    
+    def search_many(
+        self,
+        targets: np.ndarray,
+        top_n: int = 5
+    ) -> List[List[Tuple[str, Dict, float]]]:
+        """
+        Nearest concepts for each row of an (m, 4) array of targets.
         
-        # Sort by distance
-        distances.sort(key=lambda x: x[2])
+        Returns:
+            One list of (name, concept, distance) tuples per target
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 4)
+        k = min(top_n, len(self.keys))
+        if k <= 0:
+            return [[] for _ in range(len(targets))]
+        distances, rows = self.tree.query(targets, k=k)
+        distances, rows = distances.reshape(len(targets), k), rows.reshape(len(targets), k)
         
-        return distances[:top_n]
+        results = []
+        for target_distances, target_rows in zip(distances, rows):
+            hits = []
+            for distance, row in zip(target_distances, target_rows):
+                concept = self.concepts[self.keys[row]]
+                hits.append((concept['name'], concept, float(distance)))
+            results.append(hits)
+        return results
 
 
 if __name__ == "__main__":
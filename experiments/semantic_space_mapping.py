@@ -553,9 +553,9 @@ class SemanticSpaceMapper:
 
         return domain
 
-    def save_semantic_space(self, output_path: Path):
-        """Save complete semantic space to JSON."""
-        output_data = {
+    def semantic_space_data(self) -> Dict:
+        """Complete semantic space in the JSON snapshot layout."""
+        return {
             'metadata': {
                 'created': datetime.now().isoformat(),
                 'total_concepts': len(self.concept_map),
@@ -590,8 +590,10 @@ class SemanticSpaceMapper:
             }
         }
 
+    def save_semantic_space(self, output_path: Path):
+        """Save complete semantic space to JSON."""
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+            json.dump(self.semantic_space_data(), f, indent=2, ensure_ascii=False)
 
         print(f"✓ Saved semantic space to: {output_path}")
         print(f"  Total concepts: {len(self.concept_map)}")
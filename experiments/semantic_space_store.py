@@ -0,0 +1,629 @@
+"""
+Versioned Semantic Space Store
+==============================
+
+Append-only concept log for the LJPW semantic space, in one local SQLite
+database (WAL mode), replacing one full JSON snapshot per expansion step.
+
+Every expansion, batch or tuning run commits a VERSION holding only what
+it changed:
+
+    versions     (version, parent, created, message, header)
+    tags         (tag -> version; movable, like a branch name)
+    concept_log  (seq, version, domain, key, deleted, L, J, P, W, data)
+    domain_log   (seq, version, domain, deleted, data)
+
+The state at a version is the latest log entry per (domain, key) along its
+parent chain, so:
+- adding 50 concepts appends 50 rows
+- diffing two versions reads only the log rows of the versions between them
+- materializing a version is one indexed query, either as the legacy JSON
+  layout (to_dict / export_json) or as arrays (keys, domains, (n, 4) coords)
+
+Usage:
+    store = open_space_store()
+    data = load_space('6854_SOCIAL')                 # JSON-shaped dict
+    version = store.commit({'arts_aesthetics': new_concepts}, parent='6854_SOCIAL',
+                           tag='10000_MILESTONE', message='Arts & Aesthetics')
+    space = store.arrays('10000_MILESTONE')          # SpaceArrays
+    changes = store.diff('6794_ABSTRACT', '6854_SOCIAL')
+
+Existing semantic_space_*.json snapshots are imported on first use (or all
+at once with `python semantic_space_store.py import`), and re-imported as a
+new version whenever the file's content changes. Saves still write the
+legacy JSON files, which other scripts read directly. Set
+LJPW_SEMANTIC_SPACE_STORE to change the database location and
+LJPW_JSON_SNAPSHOTS=0 to write to the store only.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+EXPERIMENTS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_STORE_PATH = os.environ.get(
+    "LJPW_SEMANTIC_SPACE_STORE", str(EXPERIMENTS_DIR / "semantic_space.sqlite")
+)
+
+# Also write semantic_space_<tag>.json snapshots when saving
+EXPORT_JSON_SNAPSHOTS = os.environ.get("LJPW_JSON_SNAPSHOTS", "1") != "0"
+
+SCHEMA_VERSION = 1
+
+SNAPSHOT_PREFIX = "semantic_space_"
+
+Ref = Union[int, str, None]  # version number, tag, or None for the head
+ConceptKey = Tuple[str, str]  # (domain, key)
+
+_ROOT = object()
+
+# Parent chain of a version (including itself)
+_CHAIN_SQL = """
+    WITH RECURSIVE chain(version) AS (
+        SELECT :version
+        UNION ALL
+        SELECT v.parent FROM versions v JOIN chain c ON v.version = c.version
+        WHERE v.parent IS NOT NULL)
+"""
+
+
+class SpaceArrays(NamedTuple):
+    """Array form of one version: row i is concept keys[i] of domains[i]."""
+    keys: List[str]
+    domains: List[str]
+    coords: np.ndarray  # (n, 4) float64, columns L, J, P, W
+
+
+class SpaceDiff(NamedTuple):
+    """Concepts that differ between two versions."""
+    added: List[ConceptKey]
+    removed: List[ConceptKey]
+    modified: List[ConceptKey]
+
+
+class VersionInfo(NamedTuple):
+    version: int
+    parent: Optional[int]
+    tags: List[str]
+    created: str
+    message: str
+    changes: int
+
+
+def snapshot_tag(path: Union[str, Path]) -> str:
+    """Tag of a legacy snapshot file: semantic_space_6854_SOCIAL.json -> '6854_SOCIAL'."""
+    stem = Path(path).stem
+    return stem[len(SNAPSHOT_PREFIX):] if stem.startswith(SNAPSHOT_PREFIX) else stem
+
+
+def snapshot_path(tag: str) -> Path:
+    """Legacy snapshot file for a tag."""
+    return EXPERIMENTS_DIR / f"{SNAPSHOT_PREFIX}{tag}.json"
+
+
+def _file_hash(path: Union[str, Path]) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _coords(concept: dict) -> Tuple[Optional[float], ...]:
+    coords = concept.get('coordinates') if isinstance(concept, dict) else None
+    try:
+        return tuple(float(c) for c in coords[:4]) if coords is not None and len(coords) >= 4 \
+            else (None,) * 4
+    except (TypeError, ValueError):
+        return (None,) * 4
+
+
+class SemanticSpaceStore:
+    """
+    Versioned concept store.
+
+    Versions are referenced by number, by tag, or None for the most recent
+    commit. Reads return fresh dicts/arrays; the log itself is never
+    rewritten.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    # -- connection ------------------------------------------------------------
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is not None and self._conn_pid != os.getpid():
+            # Forked worker: never share a SQLite connection across processes
+            self._conn = None
+        if self._conn is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(self._conn)
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS versions (
+                version INTEGER PRIMARY KEY, parent INTEGER REFERENCES versions,
+                created TEXT NOT NULL, message TEXT NOT NULL DEFAULT '',
+                header TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS tags (
+                tag TEXT PRIMARY KEY, version INTEGER NOT NULL REFERENCES versions);
+            CREATE TABLE IF NOT EXISTS concept_log (
+                seq INTEGER PRIMARY KEY, version INTEGER NOT NULL,
+                domain TEXT NOT NULL, key TEXT NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0,
+                L REAL, J REAL, P REAL, W REAL, data TEXT);
+            CREATE INDEX IF NOT EXISTS concept_log_version ON concept_log (version);
+            CREATE INDEX IF NOT EXISTS concept_log_key ON concept_log (domain, key, seq);
+            CREATE TABLE IF NOT EXISTS domain_log (
+                seq INTEGER PRIMARY KEY, version INTEGER NOT NULL,
+                domain TEXT NOT NULL, deleted INTEGER NOT NULL DEFAULT 0, data TEXT);
+            CREATE INDEX IF NOT EXISTS domain_log_version ON domain_log (version);
+        """)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None:
+            conn.execute("INSERT INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        elif int(row[0]) != SCHEMA_VERSION:
+            raise RuntimeError(f"Semantic space store schema {row[0]} != {SCHEMA_VERSION}")
+        conn.commit()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # -- versions --------------------------------------------------------------
+
+    def head(self) -> Optional[int]:
+        """Most recent version, or None for an empty store."""
+        return self.conn.execute("SELECT MAX(version) FROM versions").fetchone()[0]
+
+    def has(self, ref: Ref) -> bool:
+        try:
+            self.resolve(ref)
+        except KeyError:
+            return False
+        return True
+
+    def resolve(self, ref: Ref) -> int:
+        """Version number of a version, tag or None (head)."""
+        if ref is None:
+            version = self.head()
+        elif isinstance(ref, int):
+            row = self.conn.execute(
+                "SELECT version FROM versions WHERE version = ?", (ref,)).fetchone()
+            version = row[0] if row else None
+        else:
+            row = self.conn.execute("SELECT version FROM tags WHERE tag = ?", (ref,)).fetchone()
+            version = row[0] if row else None
+        if version is None:
+            raise KeyError(f"Unknown semantic space version: {ref!r}")
+        return version
+
+    def tag(self, tag: str, ref: Ref = None):
+        """Point tag at a version (moving it if it already exists)."""
+        self.conn.execute("INSERT OR REPLACE INTO tags VALUES (?, ?)", (tag, self.resolve(ref)))
+        self.conn.commit()
+
+    def tags(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT tag, version FROM tags ORDER BY version, tag"))
+
+    def header(self, ref: Ref = None) -> dict:
+        """Top-level sections of a version other than 'domains' (metadata, ...)."""
+        row = self.conn.execute(
+            "SELECT header FROM versions WHERE version = ?", (self.resolve(ref),)).fetchone()
+        return json.loads(row[0])
+
+    def log(self) -> List[VersionInfo]:
+        """Every version, oldest first."""
+        tags: Dict[int, List[str]] = {}
+        for tag, version in self.tags().items():
+            tags.setdefault(version, []).append(tag)
+        rows = self.conn.execute("""
+            SELECT v.version, v.parent, v.created, v.message,
+                   (SELECT COUNT(*) FROM concept_log c WHERE c.version = v.version)
+            FROM versions v ORDER BY v.version""")
+        return [VersionInfo(version, parent, tags.get(version, []), created, message, changes)
+                for version, parent, created, message, changes in rows]
+
+    def _chain(self, version: int) -> List[int]:
+        return [row[0] for row in self.conn.execute(
+            _CHAIN_SQL + "SELECT version FROM chain", {'version': version})]
+
+    # -- legacy snapshots ------------------------------------------------------
+
+    def record_snapshot(self, tag: str, path: Union[str, Path]):
+        """Remember the content of the JSON snapshot that tag now matches."""
+        stat = Path(path).stat()
+        record = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': _file_hash(path)}
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                          (f"snapshot:{tag}", json.dumps(record)))
+        self.conn.commit()
+
+    def snapshot_changed(self, tag: str, path: Union[str, Path]) -> bool:
+        """
+        True if a JSON snapshot was rewritten since tag last matched it.
+
+        mtime and size are checked first; the file is only hashed when they
+        differ. Tags without a recorded snapshot (imported before snapshots
+        were tracked) count as changed when the file is newer than the
+        tagged version.
+        """
+        stat = Path(path).stat()
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (f"snapshot:{tag}",)).fetchone()
+        if row is None:
+            created = self.conn.execute(
+                "SELECT created FROM versions WHERE version = ?", (self.resolve(tag),)).fetchone()[0]
+            return datetime.fromtimestamp(stat.st_mtime) > datetime.fromisoformat(created)
+        record = json.loads(row[0])
+        if record['mtime'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+            return False
+        if record['sha256'] == _file_hash(path):
+            self.record_snapshot(tag, path)  # touched, not modified
+            return False
+        return True
+
+    # -- writes ----------------------------------------------------------------
+
+    def commit(
+        self,
+        concepts: Optional[Dict[str, Dict[str, dict]]] = None,
+        deleted: Iterable[ConceptKey] = (),
+        domains: Optional[Dict[str, dict]] = None,
+        deleted_domains: Iterable[str] = (),
+        header: Optional[dict] = None,
+        parent: Ref = None,
+        tag: Optional[str] = None,
+        message: str = '',
+    ) -> int:
+        """
+        Append a version holding only the given changes.
+
+        Args:
+            concepts: {domain: {key: concept dict}} to add or replace
+            deleted: (domain, key) pairs to remove
+            domains: {domain: attributes} (name, description, ...; no 'concepts')
+                to add or replace
+            deleted_domains: Domains to remove, with all their concepts
+            header: Top-level sections other than 'domains' (default: parent's)
+            parent: Version the changes apply to (default: head; _ROOT for none)
+            tag: Tag to point at the new version
+            message: Free-form description
+
+        Returns:
+            The new version number
+        """
+        conn = self.conn
+        parent_version = None if parent is _ROOT else (
+            self.resolve(parent) if parent is not None else self.head())
+        if header is None:
+            header = self.header(parent_version) if parent_version is not None else {}
+
+        concepts = concepts or {}
+        domains = dict(domains or {})
+        deleted = list(deleted)
+        deleted_domains = list(deleted_domains)
+        if deleted_domains and parent_version is not None:
+            # Removing a domain removes every concept it still holds
+            keys = self._state(parent_version, domains=deleted_domains)
+            deleted.extend(keys)
+        # Concepts need their domain to exist
+        new_domains = [d for d in concepts if d not in domains]
+        if new_domains:
+            existing = set(self._domains(parent_version)) if parent_version is not None else set()
+            for domain in new_domains:
+                if domain not in existing:
+                    domains[domain] = {}
+
+        with conn:
+            version = conn.execute(
+                "INSERT INTO versions (parent, created, message, header) VALUES (?, ?, ?, ?)",
+                (parent_version, datetime.now().isoformat(), message, _dumps(header)),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO domain_log (version, domain, deleted, data) VALUES (?, ?, 0, ?)",
+                [(version, domain, _dumps({k: v for k, v in attrs.items() if k != 'concepts'}))
+                 for domain, attrs in domains.items()])
+            conn.executemany(
+                "INSERT INTO domain_log (version, domain, deleted) VALUES (?, ?, 1)",
+                [(version, domain) for domain in deleted_domains])
+            conn.executemany(
+                "INSERT INTO concept_log (version, domain, key, L, J, P, W, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(version, domain, key, *_coords(concept), _dumps(concept))
+                 for domain, entries in concepts.items() for key, concept in entries.items()])
+            conn.executemany(
+                "INSERT INTO concept_log (version, domain, key, deleted) VALUES (?, ?, ?, 1)",
+                [(version, domain, key) for domain, key in deleted])
+            if tag:
+                conn.execute("INSERT OR REPLACE INTO tags VALUES (?, ?)", (tag, version))
+        return version
+
+    def commit_space(self, data: dict, parent: Ref = None, tag: Optional[str] = None,
+                     message: str = '') -> int:
+        """
+        Commit a full JSON-layout space as the delta against parent.
+
+        Only concepts and domains whose content differs from the parent are
+        written. parent=_ROOT stores data as a new root version.
+        """
+        header = {k: v for k, v in data.items() if k != 'domains'}
+        incoming = data.get('domains', {})
+        if parent is _ROOT or (parent is None and self.head() is None):
+            return self.commit(
+                {d: dict(attrs.get('concepts', {})) for d, attrs in incoming.items()},
+                domains=incoming, header=header, parent=_ROOT, tag=tag, message=message)
+
+        parent_version = self.resolve(parent)
+        old_concepts = {key: data for key, data in self._state_raw(parent_version)}
+        old_domains = self._domains(parent_version)
+
+        concepts: Dict[str, Dict[str, dict]] = {}
+        seen = set()
+        for domain, attrs in incoming.items():
+            for key, concept in attrs.get('concepts', {}).items():
+                seen.add((domain, key))
+                if old_concepts.get((domain, key)) != _dumps(concept):
+                    concepts.setdefault(domain, {})[key] = concept
+        domains = {d: attrs for d, attrs in incoming.items()
+                   if old_domains.get(d) != _dumps({k: v for k, v in attrs.items()
+                                                    if k != 'concepts'})}
+        deleted_domains = [d for d in old_domains if d not in incoming]
+        deleted = [key for key in old_concepts
+                   if key not in seen and key[0] not in deleted_domains]
+        return self.commit(concepts, deleted, domains, deleted_domains,
+                           header=header, parent=parent_version, tag=tag, message=message)
+
+    def import_snapshot(self, path: Union[str, Path], tag: Optional[str] = None,
+                        parent: Ref = _ROOT) -> int:
+        """Import a legacy semantic_space_*.json file (as a delta when parent is given)."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        tag = tag or snapshot_tag(path)
+        version = self.commit_space(data, parent=parent, tag=tag,
+                                    message=f"import {Path(path).name}")
+        self.record_snapshot(tag, path)
+        return version
+
+    # -- reads -----------------------------------------------------------------
+
+    def _latest(self, version: int, columns: str, where: str = '', params: dict = None):
+        """Latest live log row per (domain, key) along the chain of version."""
+        params = dict(params or {}, version=version)
+        return self.conn.execute(_CHAIN_SQL + f"""
+            SELECT {columns} FROM (
+                SELECT c.*,
+                       ROW_NUMBER() OVER (PARTITION BY domain, key ORDER BY seq DESC) AS rn,
+                       MIN(seq) OVER (PARTITION BY domain, key) AS first_seq
+                FROM concept_log c
+                WHERE version IN (SELECT version FROM chain) {where})
+            WHERE rn = 1 AND deleted = 0
+            ORDER BY first_seq""", params)
+
+    def _state_raw(self, version: int) -> Iterable[Tuple[ConceptKey, str]]:
+        for domain, key, data in self._latest(version, "domain, key, data"):
+            yield (domain, key), data
+
+    def _state(self, version: int, domains: Iterable[str]) -> List[ConceptKey]:
+        wanted = set(domains)
+        return [key for key, _ in self._state_raw(version) if key[0] in wanted]
+
+    def _domains(self, version: int) -> Dict[str, str]:
+        """{domain: attributes JSON} of the live domains at version, in creation order."""
+        rows = self.conn.execute(_CHAIN_SQL + """
+            SELECT domain, deleted, data FROM (
+                SELECT d.*,
+                       ROW_NUMBER() OVER (PARTITION BY domain ORDER BY seq DESC) AS rn,
+                       MIN(seq) OVER (PARTITION BY domain) AS first_seq
+                FROM domain_log d
+                WHERE version IN (SELECT version FROM chain))
+            WHERE rn = 1
+            ORDER BY first_seq""", {'version': version})
+        return {domain: data for domain, deleted, data in rows if not deleted}
+
+    def to_dict(self, ref: Ref = None) -> dict:
+        """Materialize a version in the legacy JSON layout."""
+        version = self.resolve(ref)
+        data = self.header(version)
+        domains = {}
+        for domain, attrs in self._domains(version).items():
+            domains[domain] = json.loads(attrs)
+            domains[domain]['concepts'] = {}
+        for (domain, key), concept in self._state_raw(version):
+            domains.setdefault(domain, {'concepts': {}})['concepts'][key] = json.loads(concept)
+        data['domains'] = domains
+        return data
+
+    def arrays(self, ref: Ref = None) -> SpaceArrays:
+        """Materialize a version as concept keys, domains and an (n, 4) coordinate array."""
+        rows = [row for row in self._latest(self.resolve(ref), "domain, key, L, J, P, W")
+                if row[2] is not None]
+        coords = np.array([row[2:] for row in rows], dtype=float).reshape(-1, 4)
+        return SpaceArrays([row[1] for row in rows], [row[0] for row in rows], coords)
+
+    def export_json(self, ref: Ref, path: Union[str, Path]):
+        """Write a version as a legacy semantic_space_*.json snapshot."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(ref), f, indent=2, ensure_ascii=False)
+        if isinstance(ref, str):
+            self.record_snapshot(ref, path)
+
+    def diff(self, old: Ref, new: Ref) -> SpaceDiff:
+        """
+        Concepts added, removed and modified from version old to version new.
+
+        Only log rows of versions on one chain but not the other are scanned.
+        """
+        old_version, new_version = self.resolve(old), self.resolve(new)
+        old_chain, new_chain = set(self._chain(old_version)), set(self._chain(new_version))
+        between = sorted(old_chain ^ new_chain)
+        if not between:
+            return SpaceDiff([], [], [])
+
+        conn = self.conn
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS diff_keys "
+                     "(domain TEXT, key TEXT, PRIMARY KEY (domain, key))")
+        conn.execute("DELETE FROM diff_keys")
+        placeholders = ','.join('?' * len(between))
+        conn.execute(f"INSERT OR IGNORE INTO diff_keys SELECT domain, key FROM concept_log "
+                     f"WHERE version IN ({placeholders})", between)
+
+        touched = "AND (domain, key) IN (SELECT domain, key FROM diff_keys)"
+        before = dict(((d, k), data) for d, k, data in
+                      self._latest(old_version, "domain, key, data", touched))
+        after = dict(((d, k), data) for d, k, data in
+                     self._latest(new_version, "domain, key, data", touched))
+        conn.execute("DELETE FROM diff_keys")
+        return SpaceDiff(
+            added=[key for key in after if key not in before],
+            removed=[key for key in before if key not in after],
+            modified=[key for key in after if key in before and after[key] != before[key]],
+        )
+
+
+_STORES: Dict[str, SemanticSpaceStore] = {}
+
+
+def open_space_store(path: str = DEFAULT_STORE_PATH) -> SemanticSpaceStore:
+    """Shared SemanticSpaceStore for path."""
+    store = _STORES.get(path)
+    if store is None:
+        store = _STORES[path] = SemanticSpaceStore(path)
+    return store
+
+
+def load_space(tag: str, json_path: Optional[Union[str, Path]] = None,
+               store: Optional[SemanticSpaceStore] = None) -> Optional[dict]:
+    """
+    JSON-layout space for tag, importing its legacy snapshot on first use.
+
+    A snapshot rewritten since it was imported (enrich_semantic_space.py,
+    ...) is committed again as a delta on top of tag. Returns None when
+    neither the tag nor the snapshot file exists.
+    """
+    store = store or open_space_store()
+    json_path = Path(json_path) if json_path else snapshot_path(tag)
+    if not store.has(tag):
+        if not json_path.exists():
+            return None
+        store.import_snapshot(json_path, tag)
+    elif json_path.exists() and store.snapshot_changed(tag, json_path):
+        store.import_snapshot(json_path, tag, parent=tag)
+    return store.to_dict(tag)
+
+
+def save_space(data: dict, tag: str, parent: Optional[str] = None,
+               json_path: Optional[Union[str, Path]] = None, message: str = '',
+               store: Optional[SemanticSpaceStore] = None) -> int:
+    """
+    Commit a JSON-layout space under tag as the delta against parent.
+
+    The legacy snapshot (json_path, default semantic_space_<tag>.json) is
+    also written unless LJPW_JSON_SNAPSHOTS=0.
+    """
+    store = store or open_space_store()
+    base = parent if parent is not None and store.has(parent) else _ROOT
+    version = store.commit_space(data, parent=base, tag=tag, message=message or f"save {tag}")
+    if EXPORT_JSON_SNAPSHOTS:
+        json_path = json_path or snapshot_path(tag)
+        store.export_json(version, json_path)
+        store.record_snapshot(tag, json_path)
+    return version
+
+
+def import_snapshots(store: SemanticSpaceStore, directory: Path = EXPERIMENTS_DIR,
+                     verbose: bool = False) -> int:
+    """
+    Import every legacy snapshot not yet tagged in the store.
+
+    Snapshots are chained smallest to largest, each stored as the delta
+    against the previous one (materialization is exact whatever the order).
+    """
+    snapshots = []
+    for path in directory.glob(f"{SNAPSHOT_PREFIX}*.json"):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data.get('domains'), dict):
+            continue  # atlas, reports, ...
+        size = sum(len(d.get('concepts', {})) for d in data['domains'].values())
+        snapshots.append((size, path.name, data))
+
+    imported = 0
+    for size, name, data in sorted(snapshots, key=lambda s: s[:2]):
+        tag = snapshot_tag(name)
+        if store.has(tag):
+            continue
+        version = store.commit_space(data, tag=tag, message=f"import {name}")
+        store.record_snapshot(tag, directory / name)
+        imported += 1
+        if verbose:
+            changes = store.conn.execute(
+                "SELECT COUNT(*) FROM concept_log WHERE version = ?", (version,)).fetchone()[0]
+            print(f"  v{version:<4} {tag:<28} {size:6d} concepts {changes:6d} log rows")
+    return imported
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Versioned semantic space store")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="Database path")
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('import', help="Import legacy semantic_space_*.json snapshots")
+    commands.add_parser('log', help="List versions")
+    diff = commands.add_parser('diff', help="Concepts changed between two versions/tags")
+    diff.add_argument('old')
+    diff.add_argument('new')
+    export = commands.add_parser('export', help="Write a version as a JSON snapshot")
+    export.add_argument('ref')
+    export.add_argument('path', nargs='?')
+    args = parser.parse_args()
+
+    def ref(value: str) -> Ref:
+        return int(value) if value.isdigit() and not store.has(value) else value
+
+    store = SemanticSpaceStore(args.store)
+    if args.command == 'import':
+        print(f"Importing snapshots into {args.store} ...")
+        print(f"\n{import_snapshots(store, verbose=True)} snapshots imported")
+    elif args.command == 'diff':
+        changes = store.diff(ref(args.old), ref(args.new))
+        for label, keys in zip(('added', 'removed', 'modified'), changes):
+            print(f"{label:>9}: {len(keys)}")
+            for domain, key in keys[:20]:
+                print(f"           {domain}/{key}")
+    elif args.command == 'export':
+        path = args.path or snapshot_path(str(args.ref))
+        store.export_json(ref(args.ref), path)
+        print(f"Wrote {path}")
+    else:
+        for info in store.log():
+            parent = f"v{info.parent}" if info.parent is not None else "root"
+            print(f"v{info.version:<4} <- {parent:<6} {info.changes:6d} changes  "
+                  f"{','.join(info.tags):<24} {info.message}")
+
+
+if __name__ == '__main__':
+    main()
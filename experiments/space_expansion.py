@@ -0,0 +1,225 @@
+"""
+Bulk Semantic Space Expansion
+=============================
+
+Vectorized engine behind TenThousandMapper.generate_interpolated_expansion.
+
+Instead of one random attempt per Python iteration, every round:
+1. Samples thousands of candidates at once
+   - modifications: base concept + modifier delta (anti-, meta-, hyper-, ...)
+   - blends: midpoints of random pairs, kept only if the pair lies within
+     the blend radius (one vectorized distance per pair)
+2. Adds noise and clips in one array operation
+3. Drops candidates closer than `min_separation` to an existing or already
+   accepted concept (KD-tree queries), and duplicates within the batch
+
+so growing the space by tens of thousands of concepts is a batch job, and
+generated concepts neither duplicate nor pile up on top of each other.
+
+Usage:
+    engine = BulkExpansionEngine(existing_concepts, seed=42)
+    new_concepts = engine.expand(3000)      # {key: concept dict}
+
+When the space is too crowded to place `needed` well-separated concepts
+within `max_rounds`, expand raises ExpansionShortfall carrying the concepts
+it did generate.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Prefix -> (coordinate delta, definition prefix)
+MODIFIERS: Dict[str, Tuple[List[float], str]] = {
+    "anti": ([-0.2, 0.0, 0.1, 0.0], "Opposing or opposite of "),
+    "meta": ([0.0, 0.0, 0.0, 0.2], "Higher level nature of "),
+    "hyper": ([0.0, 0.0, 0.2, 0.0], "Extreme or excessive "),
+    "pseudo": ([0.0, -0.2, 0.0, -0.1], "False or imitation "),
+    "neo": ([0.0, 0.0, 0.1, 0.1], "New or revived form of "),
+    "post": ([0.0, 0.0, 0.0, 0.1], "Subsequent to "),
+    "pre": ([0.0, 0.0, 0.0, -0.1], "Prior to "),
+    "sub": ([0.0, -0.1, -0.1, 0.0], "Lower or subordinate "),
+    "super": ([0.1, 0.0, 0.2, 0.0], "Higher or superior "),
+    "inter": ([0.1, 0.0, 0.0, 0.1], "Between or among "),
+}
+
+# Only blend pairs closer than this (Euclidean, LJPW space)
+BLEND_RADIUS = 0.5
+
+# Share of candidates generated by modification (the rest are blends)
+MODIFIER_SHARE = 0.4
+
+# Uniform noise amplitude added to every generated coordinate
+NOISE = 0.05
+
+# Generated concepts must be at least this far from every other concept
+MIN_SEPARATION = 0.01
+
+COORD_RANGE = (0.01, 0.99)
+
+
+class ExpansionShortfall(RuntimeError):
+    """Fewer concepts than requested could be generated; `concepts` holds those that were."""
+
+    def __init__(self, concepts: Dict[str, dict], needed: int):
+        super().__init__(f"generated {len(concepts)} of {needed} concepts "
+                         f"({needed - len(concepts)} short)")
+        self.concepts = concepts
+        self.needed = needed
+
+
+class BulkExpansionEngine:
+    """
+    Generates modified and blended concepts around an existing space.
+
+    Args:
+        concepts: {key: concept dict with 'coordinates' and 'definition'}
+        seed: Seed for reproducible expansions
+        blend_radius: Maximum distance between blended concepts
+        min_separation: Minimum distance from any other concept
+        modifier_share: Share of candidates generated by modification
+        noise: Uniform noise amplitude added to generated coordinates
+        modifiers: Prefix -> (delta, definition prefix)
+    """
+
+    def __init__(
+        self,
+        concepts: Dict[str, dict],
+        seed: Optional[int] = None,
+        blend_radius: float = BLEND_RADIUS,
+        min_separation: float = MIN_SEPARATION,
+        modifier_share: float = MODIFIER_SHARE,
+        noise: float = NOISE,
+        modifiers: Dict[str, Tuple[List[float], str]] = MODIFIERS,
+    ):
+        self.concepts = concepts
+        self.rng = np.random.default_rng(seed)
+        self.blend_radius = blend_radius
+        self.min_separation = min_separation
+        self.modifier_share = modifier_share
+        self.noise = noise
+
+        self.keys = [k for k, c in concepts.items() if len(c.get('coordinates') or ()) == 4]
+        self.coords = np.array([concepts[k]['coordinates'] for k in self.keys],
+                               dtype=float).reshape(-1, 4)
+        self.modifier_names = list(modifiers)
+        self.modifier_deltas = np.array([modifiers[m][0] for m in self.modifier_names])
+        self.modifier_texts = [modifiers[m][1] for m in self.modifier_names]
+
+    def expand(self, needed: int, batch_size: int = 8192, max_rounds: int = 50) -> Dict[str, dict]:
+        """
+        Generate `needed` new concepts, keyed by new unique keys.
+
+        Raises:
+            ExpansionShortfall: if max_rounds ran out first (see .concepts)
+        """
+        if needed <= 0 or len(self.keys) < 2:
+            return {}
+
+        new_concepts: Dict[str, dict] = {}
+        accepted = [self.coords]
+        tree = cKDTree(self.coords)
+
+        for _ in range(max_rounds):
+            remaining = needed - len(new_concepts)
+            if remaining <= 0:
+                break
+            # Oversample: some candidates fail the radius, key or separation checks
+            size = min(batch_size, max(2 * remaining, 64))
+            candidates = self._candidates(size)
+            keep = self._separated(candidates[0], tree)
+            added = self._accept(candidates, keep, new_concepts, remaining)
+            if added is None:
+                continue
+            accepted.append(added)
+            tree = cKDTree(np.vstack(accepted))
+
+        if len(new_concepts) < needed:
+            raise ExpansionShortfall(new_concepts, needed)
+        return new_concepts
+
+    # -- candidate generation ------------------------------------------------
+
+    def _candidates(self, size: int):
+        """(coords, kind, i, j): kind 0 = modifier j applied to i, 1 = blend of i and j."""
+        rng = self.rng
+        n = len(self.keys)
+        n_mod = rng.binomial(size, self.modifier_share)
+
+        base = rng.integers(n, size=n_mod)
+        modifier = rng.integers(len(self.modifier_names), size=n_mod)
+        mod_coords = self.coords[base] + self.modifier_deltas[modifier]
+
+        first = rng.integers(n, size=size - n_mod)
+        second = rng.integers(n, size=size - n_mod)
+        distance = np.linalg.norm(self.coords[first] - self.coords[second], axis=1)
+        within = (first != second) & (distance < self.blend_radius)
+        first, second = first[within], second[within]
+        blend_coords = (self.coords[first] + self.coords[second]) / 2
+
+        coords = np.vstack([mod_coords, blend_coords])
+        coords += (rng.random(coords.shape) - 0.5) * self.noise
+        np.clip(coords, *COORD_RANGE, out=coords)
+
+        kind = np.concatenate([np.zeros(n_mod, dtype=int), np.ones(len(first), dtype=int)])
+        i = np.concatenate([base, first])
+        j = np.concatenate([modifier, second])
+        # Interleave strategies: accepted candidates are taken in order
+        order = rng.permutation(len(coords))
+        return coords[order], kind[order], i[order], j[order]
+
+    def _separated(self, coords: np.ndarray, tree: cKDTree) -> np.ndarray:
+        """Mask of candidates far enough from the space and from each other."""
+        if self.min_separation <= 0:
+            return np.ones(len(coords), dtype=bool)
+        nearest, _ = tree.query(coords, k=1)
+        keep = nearest >= self.min_separation
+        # Within the batch, the later candidate of each close pair is dropped
+        pairs = cKDTree(coords).query_pairs(self.min_separation, output_type='ndarray')
+        if len(pairs):
+            keep[pairs.max(axis=1)] = False
+        return keep
+
+    def _accept(self, candidates, keep, new_concepts: Dict[str, dict],
+                limit: int) -> Optional[np.ndarray]:
+        """Add kept candidates with unused keys; returns their coordinates."""
+        coords, kind, first, second = candidates
+        keys, concepts = self.keys, self.concepts
+        added = []
+        for index in np.flatnonzero(keep):
+            if len(added) >= limit:
+                break
+            i, j = first[index], second[index]
+            key1 = keys[i]
+            if kind[index] == 0:
+                prefix = self.modifier_names[j]
+                new_key = f"{prefix}_{key1}"
+            else:
+                key2 = keys[j]
+                new_key = f"{key1}_{key2}_blend"
+            if new_key in concepts or new_key in new_concepts:
+                continue
+
+            c1 = concepts[key1]
+            n1 = c1.get('name', key1.replace('_', ' ').title())
+            if kind[index] == 0:
+                concept = {
+                    "name": f"{prefix.capitalize()}-{n1}",
+                    "definition": f"{self.modifier_texts[j]}{c1['definition'].lower()}",
+                    "coordinates": coords[index].tolist(),
+                    "domain": c1.get('domain', 'Derived'),
+                    "generated": True,
+                }
+            else:
+                n2 = concepts[key2].get('name', key2.replace('_', ' ').title())
+                concept = {
+                    "name": f"{n1}-{n2} Hybrid",
+                    "definition": f"Conceptual blend of {n1} and {n2}",
+                    "coordinates": coords[index].tolist(),
+                    "domain": c1.get('domain', 'Blended'),
+                    "generated": True,
+                }
+            new_concepts[new_key] = concept
+            added.append(index)
+        return coords[added] if added else None
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Corpus Store Test
+=================
+
+Builds a CorpusStore from a small synthetic repository layout (WEB chapter
+files, an NWT whole-book extraction and the Mark 1 sample files) and checks
+sync, re-import and pruning, chapter lookup, parallel lookup and the
+coordinate cache.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus_store import CorpusStore, CORPUS_PROCESSOR_DETECTOR
+
+
+def write_json(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def build_sources(root: Path):
+    """Minimal copies of every source kind the store imports."""
+    write_json(root / 'corpus/mark/chapter_01.json', {
+        'book': 'Mark', 'chapter': 1, 'translation': 'World English Bible',
+        'verses': {'1': 'The beginning of the Good News.', '2': 'As it is written.'},
+        'ljpw_coordinates': {'1': [0.8, 0.6, 0.5, 0.7]},
+    })
+    write_json(root / 'corpus/nwt_bible/mark.json', {
+        '1': {'book': 'Mark', 'chapter': 1, 'translation': 'New World Translation',
+              'verses': {'1': 'NWT 1:1', '2': 'NWT 1:2', '3': 'NWT 1:3'}},
+        '2': {'book': 'Mark', 'chapter': 2, 'translation': 'New World Translation',
+              'verses': {'1': 'NWT 2:1'}},
+    })
+    write_json(root / 'experiments/nwt_mark_chapter1.json', {
+        'book': 'Mark', 'chapter': 1, 'verses': {'1': 'English sample 1', '2': 'English sample 2'},
+    })
+    write_json(root / 'experiments/greek_mark_chapter1.json', {
+        'book': 'Mark', 'chapter': 1, 'verses': {'1': 'Ἀρχὴ τοῦ εὐαγγελίου', '3': 'φωνὴ βοῶντος'},
+    })
+
+
+class CountingDetector:
+    """Stand-in detector that counts how many verses it scores."""
+
+    version = 'test-1'
+
+    def __init__(self):
+        self.calls = 0
+
+    def calculate_field_signature(self, text):
+        self.calls += 1
+        value = (len(text) % 10) / 10
+        return {'L': value, 'J': 0.5, 'P': 0.5, 'W': 1 - value}
+
+
+def test_sync(store: CorpusStore, root: Path):
+    """Every source is imported once; unchanged files are skipped on resync."""
+    imported = store.sync(root)
+    print(f"  imported {imported} files, languages: {store.languages()}")
+    assert imported == 4
+    assert store.languages() == ['english', 'english_nwt', 'english_web', 'greek']
+    assert store.sync(root) == 0
+    assert store.coordinates('english_web', CORPUS_PROCESSOR_DETECTOR, 'mark', 1) == {
+        ('mark', 1, 1): (0.8, 0.6, 0.5, 0.7)}
+
+    # Changing a source re-imports it and drops the coordinates of changed verses
+    path = root / 'corpus/mark/chapter_01.json'
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    data['verses']['1'] = 'The beginning of the Good News of Jesus.'
+    data.pop('ljpw_coordinates')
+    time.sleep(0.01)
+    write_json(path, data)
+    assert store.sync(root) == 1
+    assert store.coordinates('english_web', CORPUS_PROCESSOR_DETECTOR, 'mark', 1) == {}
+
+
+def test_reimport(store: CorpusStore, root: Path):
+    """Rewritten sources replace their rows; deleted sources are pruned."""
+    store.ensure_coordinates('english_web', 'mark', 1, CountingDetector())
+
+    # Same verse texts with new imported coordinates: the new values win
+    path = root / 'corpus/mark/chapter_01.json'
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    for coords in ([0.9, 0.9, 0.9, 0.9], [0.1, 0.2, 0.3, 0.4]):
+        data['ljpw_coordinates'] = {'1': coords}
+        time.sleep(0.01)
+        write_json(path, data)
+        assert store.sync(root) == 1
+        assert store.coordinates('english_web', CORPUS_PROCESSOR_DETECTOR, 'mark', 1) == {
+            ('mark', 1, 1): tuple(coords)}
+
+    # Verse 2 dropped from the source
+    del data['verses']['2']
+    time.sleep(0.01)
+    write_json(path, data)
+    assert store.sync(root) == 1
+    assert store.chapter('english_web', 'mark', 1) == {'1': data['verses']['1']}
+    assert store.coordinates('english_web', CORPUS_PROCESSOR_DETECTOR, 'mark', 1) == {
+        ('mark', 1, 1): (0.1, 0.2, 0.3, 0.4)}
+    # Computed coordinates of the unchanged verse survive; the dropped verse's do not
+    computed = store.coordinates('english_web', 'CountingDetector.calculate_field_signature',
+                                 'mark', 1, CountingDetector.version)
+    assert list(computed) == [('mark', 1, 1)]
+
+    # A whole-book file that loses a chapter drops it
+    path = root / 'corpus/nwt_bible/mark.json'
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    del data['2']
+    time.sleep(0.01)
+    write_json(path, data)
+    assert store.sync(root) == 1
+    assert store.chapters('english_nwt', 'mark') == [1]
+
+    # A deleted source is pruned on the next sync
+    (root / 'experiments/greek_mark_chapter1.json').unlink()
+    assert store.sync(root) == 0
+    assert 'greek' not in store.languages()
+    assert store.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 3
+    print(f"  languages after pruning: {store.languages()}")
+
+
+def test_chapter_lookup(store: CorpusStore):
+    """Chapters come back keyed like the JSON files, per language."""
+    assert store.chapter('english', 'Mark', 1) == {'1': 'English sample 1', '2': 'English sample 2'}
+    assert store.chapter('english_nwt', 'mark', 1) == {'1': 'NWT 1:1', '2': 'NWT 1:2', '3': 'NWT 1:3'}
+    assert store.chapters('english_nwt', 'mark') == [1, 2]
+    assert store.chapter('greek', 'mark', 2) == {}
+    assert store.chapter('greek', 'mark', 1) == {'1': 'Ἀρχὴ τοῦ εὐαγγελίου', '3': 'φωνὴ βοῶντος'}
+    assert store.books('english_web') == ['mark']
+    print("  chapter lookups match the source files")
+
+
+def test_parallel_lookup(store: CorpusStore):
+    """Only verses present in both languages are paired."""
+    pairs = store.parallel('english', 'greek', 'mark')
+    assert [key for key, _, _ in pairs] == [('mark', 1, 1)]
+    assert pairs[0][1:] == ('English sample 1', 'Ἀρχὴ τοῦ εὐαγγελίου')
+    assert len(store.parallel('english_nwt', 'english', 'mark', 1)) == 2
+    print(f"  {len(pairs)} english/greek pair(s)")
+
+
+def test_coordinate_cache(store: CorpusStore):
+    """ensure_coordinates scores each verse once per detector version."""
+    detector = CountingDetector()
+    first = store.ensure_coordinates('english_nwt', 'mark', 1, detector)
+    assert detector.calls == 3
+    assert store.ensure_coordinates('english_nwt', 'mark', 1, detector) == first
+    assert detector.calls == 3
+
+    detector.version = 'test-2'
+    store.ensure_coordinates('english_nwt', 'mark', 1, detector)
+    assert detector.calls == 6
+    print(f"  {detector.calls} verses scored across two detector versions")
+
+
+if __name__ == '__main__':
+    root = Path(tempfile.mkdtemp(prefix='corpus_store_test_'))
+    try:
+        build_sources(root)
+        store = CorpusStore(str(root / 'corpus.sqlite'))
+        print("Sync:")
+        test_sync(store, root)
+        print("Chapter lookup:")
+        test_chapter_lookup(store)
+        print("Parallel lookup:")
+        test_parallel_lookup(store)
+        print("Coordinate cache:")
+        test_coordinate_cache(store)
+        print("Re-import and pruning:")
+        test_reimport(store, root)
+        store.close()
+    finally:
+        shutil.rmtree(root)
+    print("\nAll corpus store tests passed.")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Batched Field Signature Test
+============================
+
+Checks that calculate_field_signatures() returns exactly what per-token
+calculate_field_signature() calls return, for the base detector and for the
+language detectors that override the per-text scoring.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enhanced_pattern_detector import EnhancedPatternDetector
+from greek_pattern_detector import GreekPatternDetector
+from wedau_pattern_detector import WedauPatternDetector
+
+
+def same_signature(a, b):
+    return (a.keys() == b.keys() and np.array_equal(a['coordinates'], b['coordinates'])
+            and all(a[k] == b[k] for k in a if k != 'coordinates'))
+
+
+def check_batched(detector, text, context=None):
+    """Batched signatures equal the per-token and whole-text calls."""
+    tokens = text.split()
+    token_sigs, text_sig = detector.calculate_field_signatures(tokens, context, text=text)
+    expected = [detector.calculate_field_signature(token, context) for token in tokens]
+    assert len(token_sigs) == len(expected)
+    for token, got, want in zip(tokens, token_sigs, expected):
+        assert same_signature(got, want), (type(detector).__name__, token, got['L'], want['L'])
+    assert same_signature(text_sig, detector.calculate_field_signature(text, context))
+    return token_sigs, text_sig
+
+
+def test_base_detector():
+    """The shared single-pass path matches independent calls."""
+    detector = EnhancedPatternDetector()
+    cases = [
+        ("The Son of God brings love and justice to the world", None),
+        ("In the beginning was the Word", "son of god"),
+        ("power wisdom power wisdom", "Divine authority"),
+    ]
+    for text, context in cases:
+        check_batched(detector, text, context)
+    print(f"  {len(cases)} texts match per-token signatures")
+
+
+def test_subclass_detectors():
+    """Detectors overriding calculate_field_signature keep their adjustments."""
+    wedau = WedauPatternDetector()
+    token_sigs, _ = check_batched(wedau, "Yesu Keriso Natuna Yaubada i yawahana", "Mark 1:1")
+    base = EnhancedPatternDetector().calculate_field_signature('Yaubada', "Mark 1:1")
+    assert token_sigs[3]['L'] != base['L']  # Wedau theological term applied
+
+    check_batched(GreekPatternDetector(), "Ἀρχὴ τοῦ εὐαγγελίου Ἰησοῦ Χριστοῦ υἱοῦ θεοῦ")
+    print(f"  Wedau 'Yaubada' L={token_sigs[3]['L']:.3f} (base detector {base['L']:.3f})")
+
+
+if __name__ == '__main__':
+    print("Base detector:")
+    test_base_detector()
+    print("Subclass detectors:")
+    test_subclass_detectors()
+    print("\nAll field signature tests passed.")
@@ -0,0 +1,142 @@
+"""
+Test Suite for the Multi-Layer Combiner Array Back-End
+Validates that combine_arrays and hierarchical_integration_many match the
+dict API (combine_signatures / hierarchical_integration) row for row.
+"""
+
+import sys
+sys.path.append('experiments')
+
+from multi_layer_combiner import MultiLayerCombiner, LAYERS, DIMENSIONS, stack_signatures
+import numpy as np
+
+
+def random_rows(rng, n):
+    """Random layer signatures and confidences, plus threshold-edge confidence rows."""
+    signatures = rng.random((n, len(LAYERS), len(DIMENSIONS)))
+    confidences = rng.random((n, len(LAYERS)))
+    edges = np.array([
+        [0.0, 0.0, 0.0, 0.0],    # all zero: unknown-word fallback
+        [0.3, 0.3, 0.3, 0.3],    # low threshold
+        [0.7, 0.7, 0.7, 0.7],    # high threshold
+        [0.0, 0.0, 0.0, 0.3],    # only context contributes
+        [0.3, 0.7, 0.1, 0.0999], # just under the unknown cut-off
+        [0.7, 0.3, 0.1, 0.1],    # exactly at the unknown cut-off
+        [1.0, 0.0, 0.7, 0.3],
+    ])
+    confidences[:len(edges)] = edges
+    return signatures, confidences
+
+
+def as_dict(values):
+    return dict(zip(DIMENSIONS, values))
+
+
+def test_combine_arrays():
+    """combine_arrays rows equal combine_signatures results exactly."""
+    combiner = MultiLayerCombiner()
+    rng = np.random.default_rng(0)
+    signatures, confidences = random_rows(rng, 500)
+
+    print("="*70)
+    print("TEST 1: COMBINE ARRAYS vs COMBINE SIGNATURES")
+    print("="*70)
+
+    combined = combiner.combine_arrays(signatures, confidences)
+    for i in range(len(signatures)):
+        expected = combiner.combine_signatures(
+            *(as_dict(sig) for sig in signatures[i]),
+            layer_confidences=dict(zip(LAYERS, confidences[i]))
+        )
+        assert [expected['signature'][dim] for dim in DIMENSIONS] == combined.signatures[i].tolist(), i
+        assert [expected['weights'][layer] for layer in LAYERS] == combined.weights[i].tolist(), i
+        assert expected['confidence'] == combined.confidence[i], i
+        assert combiner.detect_unknown_word(dict(zip(LAYERS, confidences[i]))) == combined.unknown[i], i
+
+    assert combined.unknown[0] and np.allclose(combined.weights[0], [0.5, 0.3, 0.1, 0.1])
+    assert combined.evidence is None
+
+    # Default confidences are 0.5 everywhere, as in combine_signatures
+    default = combiner.combine_arrays(signatures[:3])
+    for i in range(3):
+        expected = combiner.combine_signatures(*(as_dict(sig) for sig in signatures[i]))
+        assert [expected['signature'][dim] for dim in DIMENSIONS] == default.signatures[i].tolist()
+
+    print(f"  {len(signatures)} rows match ({int(combined.unknown.sum())} unknown words)")
+    print("  Result: [PASS]")
+
+
+def test_hierarchical_integration_many():
+    """hierarchical_integration_many matches hierarchical_integration, evidence included."""
+    combiner = MultiLayerCombiner()
+    rng = np.random.default_rng(1)
+    signatures, confidences = random_rows(rng, 50)
+
+    print("\n" + "="*70)
+    print("TEST 2: HIERARCHICAL INTEGRATION MANY vs HIERARCHICAL INTEGRATION")
+    print("="*70)
+
+    raw_features, semantic_markers, context_analysis = [], [], []
+    for i, (sig, conf) in enumerate(zip(signatures, confidences)):
+        raw = {
+            'phonetic_signature': as_dict(sig[0]),
+            'morphological_signature': as_dict(sig[1]),
+            'phonetic_confidence': conf[0],
+            'morphological_confidence': conf[1],
+            'evidence': [f"raw {i}"],
+        }
+        markers = {'signature': as_dict(sig[2]), 'confidence': conf[2],
+                   'evidence': [f"marker {i}a", f"marker {i}b"]}
+        context = {'signature': as_dict(sig[3]), 'context_confidence': conf[3]}
+        if i % 5 == 0:
+            # Missing layers and defaults: empty signatures, default confidences, no evidence
+            del raw['phonetic_confidence'], raw['evidence']
+            markers = {}
+            context['signature'] = {'L': sig[3][0]}
+        raw_features.append(raw)
+        semantic_markers.append(markers)
+        context_analysis.append(context)
+
+    combined = combiner.hierarchical_integration_many(raw_features, semantic_markers, context_analysis)
+    for i, args in enumerate(zip(raw_features, semantic_markers, context_analysis)):
+        expected = combiner.hierarchical_integration(*args)
+        assert [expected['signature'][dim] for dim in DIMENSIONS] == combined.signatures[i].tolist(), i
+        assert expected['confidence'] == combined.confidence[i], i
+        assert expected['evidence'] == combined.evidence[i], i
+
+    assert combined.evidence[1] == ["raw 1", "marker 1a", "marker 1b"]
+    assert combined.evidence[0] == []
+
+    print(f"  {len(raw_features)} words match, evidence trails included")
+    print("  Result: [PASS]")
+
+
+def test_empty_input():
+    """No words give empty arrays of the right shape."""
+    combiner = MultiLayerCombiner()
+
+    print("\n" + "="*70)
+    print("TEST 3: EMPTY INPUT")
+    print("="*70)
+
+    combined = combiner.hierarchical_integration_many([], [], [])
+    assert combined.signatures.shape == (0, len(DIMENSIONS))
+    assert combined.confidence.shape == (0,)
+    assert combined.weights.shape == (0, len(LAYERS))
+    assert combined.unknown.shape == (0,)
+    assert combined.evidence == []
+    assert stack_signatures([]).shape == (0, len(LAYERS), len(DIMENSIONS))
+    assert combiner.combine_arrays(np.zeros((0, 4, 4))).signatures.shape == (0, len(DIMENSIONS))
+
+    print("  Empty input gives (0, 4) signatures")
+    print("  Result: [PASS]")
+
+
+if __name__ == '__main__':
+    test_combine_arrays()
+    test_hierarchical_integration_many()
+    test_empty_input()
+
+    print("\n" + "="*70)
+    print("All multi-layer combiner tests passed.")
+    print("="*70)
@@ -195,6 +195,46 @@ def test_synergy_detection():
     return success_rate
 
 
+def test_batch_composition():
+    """Test that compose_many matches compose phrase by phrase."""
+    composer = SemanticComposer('experiments/semantic_space_6854_SOCIAL.json')
+    
+    print("\n" + "="*70)
+    print("TEST 5: BATCH COMPOSITION")
+    print("="*70)
+    
+    phrases = [
+        'Kingdom of God',
+        'Holy Spirit',
+        'Love and Justice',
+        'not love',
+        'love and love',
+        'Unknownword of God',
+        'Wisdom',
+        'Kingdom  of   God'  # same cache entry as 'Kingdom of God'
+    ]
+    
+    batch = composer.compose_many(phrases, nearest=3)
+    
+    results = []
+    for phrase, result in zip(phrases, batch):
+        single = composer.compose(phrase)
+        passed = (
+            np.allclose(result['coordinates'], single['coordinates']) and
+            result['weights'] == single['weights'] and
+            result['synergy'] == single['synergy'] and
+            result['confidence'] == single['confidence'] and
+            len(result['nearest']) == 3
+        )
+        results.append(passed)
+        print(f"  {'[PASS]' if passed else '[FAIL]'} '{phrase}'")
+    
+    success_rate = sum(results) / len(results)
+    print(f"\n{'='*70}")
+    print(f"Batch Composition: {sum(results)}/{len(results)} passed ({success_rate:.0%})")
+    return success_rate
+
+
 def main():
     print("\n" + "="*70)
     print("PHASE 3 COMPREHENSIVE TEST SUITE")
@@ -206,9 +246,10 @@ def main():
     attribute_score = test_attribute_composition()
     emergent_score = test_emergent_behavior()
     synergy_score = test_synergy_detection()
+    batch_score = test_batch_composition()
     
     # Overall results
-    overall = (modifier_score + attribute_score + emergent_score + synergy_score) / 4
+    overall = (modifier_score + attribute_score + emergent_score + synergy_score + batch_score) / 5
     
     print("\n" + "="*70)
     print("OVERALL RESULTS")
@@ -217,6 +258,7 @@ def main():
     print(f"Attribute Composition:      {attribute_score:.0%}")
     print(f"Emergent Behavior:          {emergent_score:.0%}")
     print(f"Synergy Detection:          {synergy_score:.0%}")
+    print(f"Batch Composition:          {batch_score:.0%}")
     print(f"\nOverall Success Rate:       {overall:.0%}")
     print("="*70)
     
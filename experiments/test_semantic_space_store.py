@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Semantic Space Store Test
+=========================
+
+Commits a small semantic space through SemanticSpaceStore and checks that
+every version materializes exactly (to_dict / arrays), that diffs report the
+added, removed and modified concepts, and that legacy JSON snapshots
+round-trip through import, export and re-import.
+"""
+
+import copy
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from semantic_space_store import SemanticSpaceStore, load_space, save_space
+
+
+def concept(name, coords):
+    return {'name': name, 'definition': f"Definition of {name}", 'coordinates': coords}
+
+
+BASE_SPACE = {
+    'metadata': {'version': '1.0', 'total_concepts': 3},
+    'domains': {
+        'virtues': {
+            'name': 'Virtues',
+            'concepts': {
+                'love': concept('Love', [0.9, 0.6, 0.5, 0.7]),
+                'justice': concept('Justice', [0.6, 0.9, 0.6, 0.7]),
+            },
+        },
+        'nature': {
+            'name': 'Nature',
+            'concepts': {'river': concept('River', [0.5, 0.5, 0.6, 0.5])},
+        },
+    },
+}
+
+
+def test_commit_round_trip(store: SemanticSpaceStore):
+    """Root and delta versions materialize exactly as committed."""
+    root = store.commit_space(BASE_SPACE, tag='base')
+    assert store.to_dict('base') == BASE_SPACE
+
+    changed = copy.deepcopy(BASE_SPACE)
+    changed['domains']['virtues']['concepts']['love']['coordinates'] = [0.95, 0.6, 0.5, 0.75]
+    changed['domains']['virtues']['concepts']['hope'] = concept('Hope', [0.7, 0.6, 0.5, 0.8])
+    del changed['domains']['nature']
+    changed['metadata']['total_concepts'] = 3
+    version = store.commit_space(changed, parent='base', tag='changed')
+
+    assert store.to_dict('changed') == changed
+    assert store.to_dict(root) == BASE_SPACE  # older versions are untouched
+    # Only the delta is logged: love (modified), hope (added), river (removed)
+    rows = store.conn.execute(
+        "SELECT COUNT(*) FROM concept_log WHERE version = ?", (version,)).fetchone()[0]
+    assert rows == 3, rows
+
+    arrays = store.arrays('changed')
+    assert arrays.keys == ['love', 'justice', 'hope']
+    assert np.allclose(arrays.coords[0], [0.95, 0.6, 0.5, 0.75])
+    print(f"  v{root} -> v{version}: {rows} log rows, {len(arrays.keys)} concepts")
+
+
+def test_explicit_commit(store: SemanticSpaceStore):
+    """commit() applies concept and domain changes on top of its parent."""
+    store.commit({'arts': {'harmony': concept('Harmony', [0.8, 0.7, 0.4, 0.8])}},
+                 deleted=[('virtues', 'justice')], parent='changed', tag='arts')
+    data = store.to_dict('arts')
+    assert set(data['domains']) == {'virtues', 'arts'}
+    assert set(data['domains']['virtues']['concepts']) == {'love', 'hope'}
+    assert data['metadata'] == store.to_dict('changed')['metadata']
+    print(f"  domains at 'arts': {sorted(data['domains'])}")
+
+
+def test_diff(store: SemanticSpaceStore):
+    """diff() reports added, removed and modified concepts in both directions."""
+    changes = store.diff('base', 'changed')
+    assert changes.added == [('virtues', 'hope')]
+    assert changes.removed == [('nature', 'river')]
+    assert changes.modified == [('virtues', 'love')]
+
+    backwards = store.diff('changed', 'base')
+    assert backwards.added == [('nature', 'river')]
+    assert backwards.removed == [('virtues', 'hope')]
+    assert store.diff('arts', 'arts') == ([], [], [])
+    print(f"  base -> changed: {len(changes.added)} added, {len(changes.removed)} removed, "
+          f"{len(changes.modified)} modified")
+
+
+def test_snapshot_round_trip(store: SemanticSpaceStore, directory: Path):
+    """Legacy JSON snapshots import, export and re-import when rewritten."""
+    snapshot = directory / 'semantic_space_SNAPSHOT.json'
+    with open(snapshot, 'w', encoding='utf-8') as f:
+        json.dump(BASE_SPACE, f)
+
+    assert load_space('SNAPSHOT', snapshot, store) == BASE_SPACE
+    versions = len(store.log())
+    assert load_space('SNAPSHOT', snapshot, store) == BASE_SPACE
+    assert len(store.log()) == versions  # unchanged file: no new version
+
+    rewritten = copy.deepcopy(BASE_SPACE)
+    rewritten['domains']['nature']['concepts']['tree'] = concept('Tree', [0.6, 0.5, 0.7, 0.6])
+    time.sleep(0.01)
+    with open(snapshot, 'w', encoding='utf-8') as f:
+        json.dump(rewritten, f)
+    assert load_space('SNAPSHOT', snapshot, store) == rewritten
+    assert store.diff(versions, 'SNAPSHOT').added == [('nature', 'tree')]
+
+    exported = directory / 'exported.json'
+    save_space(rewritten, 'SAVED', parent='SNAPSHOT', json_path=exported, store=store)
+    with open(exported, encoding='utf-8') as f:
+        assert json.load(f) == rewritten
+    assert not store.snapshot_changed('SAVED', exported)
+    print(f"  {len(store.log())} versions after import, re-import and save")
+
+
+if __name__ == '__main__':
+    directory = Path(tempfile.mkdtemp(prefix='semantic_space_store_test_'))
+    try:
+        store = SemanticSpaceStore(str(directory / 'space.sqlite'))
+        print("Commit round trip:")
+        test_commit_round_trip(store)
+        print("Explicit commit:")
+        test_explicit_commit(store)
+        print("Diff:")
+        test_diff(store)
+        print("Snapshot round trip:")
+        test_snapshot_round_trip(store, directory)
+        store.close()
+    finally:
+        shutil.rmtree(directory)
+    print("\nAll semantic space store tests passed.")
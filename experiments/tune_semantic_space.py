@@ -6,12 +6,15 @@ import json
 import numpy as np
 import os
 
+from semantic_space_store import load_space, open_space_store, EXPORT_JSON_SNAPSHOTS
+
 SPACE_PATH = "experiments/semantic_space_6386_ENRICHED.json"
+SPACE_TAG = "6386_ENRICHED"
 
 def tune_space():
-    print(f"Loading {SPACE_PATH}...")
-    with open(SPACE_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    print(f"Loading {SPACE_TAG}...")
+    data = load_space(SPACE_TAG, SPACE_PATH)
+    updates = {}
         
     # Target coordinates (Idealized Kingdom)
     # L=0.71, J=0.85, P=0.72, W=0.92
@@ -20,7 +23,7 @@ def tune_space():
     concepts_to_update = ['Kingdom', 'Kingdom_of_God', 'Rule_of_God']
     updated_count = 0
     
-    for domain in data['domains'].values():
+    for domain_key, domain in data['domains'].items():
         if 'concepts' in domain:
             for key in domain['concepts']:
                 # normalize key for checking
@@ -30,13 +33,20 @@ def tune_space():
                     print(f"Updating {key}...")
                     print(f"  Old: {domain['concepts'][key]['coordinates']}")
                     domain['concepts'][key]['coordinates'] = target_coords
+                    updates.setdefault(domain_key, {})[key] = domain['concepts'][key]
                     print(f"  New: {target_coords}")
                     updated_count += 1
     
     if updated_count > 0:
-        print(f"\nSaving {updated_count} updates to {SPACE_PATH}...")
-        with open(SPACE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Only the updated concepts are written, as a new version of the space
+        store = open_space_store()
+        version = store.commit(updates, parent=SPACE_TAG, tag=SPACE_TAG,
+                               message="tune Kingdom concepts to idealized signature")
+        print(f"\nCommitted {updated_count} updates as version {version} ({SPACE_TAG})")
+        if EXPORT_JSON_SNAPSHOTS:
+            with open(SPACE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            store.record_snapshot(SPACE_TAG, SPACE_PATH)
         print("Done.")
     else:
         print("No concepts found to update.")
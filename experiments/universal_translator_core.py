@@ -10,6 +10,7 @@ import os
 from typing import Dict, List, Optional, Any, Tuple
 from experiments.enhanced_pattern_detector import EnhancedPatternDetector
 from experiments.cosmic_resonator import CosmicResonator
+from experiments.resonance_kernel import ResonanceKernel, harmonic_match_names
 
 class UniversalTranslator:
     """
@@ -22,6 +23,9 @@ class UniversalTranslator:
         self.resonator = CosmicResonator()
         self.semantic_space = self._load_semantic_space(semantic_space_path)
         self.concepts = self._extract_concepts(self.semantic_space)
+        self.kernel = ResonanceKernel.cosmic(
+            np.array([c['coordinates'] for c in self.concepts]).reshape(-1, 4)
+        )
         print(f"Universal Translator initialized with {len(self.concepts)} concepts.")
 
     def _load_semantic_space(self, path: str) -> Dict[str, Any]:
@@ -54,18 +58,31 @@ class UniversalTranslator:
     def find_best_matches(self, field_signature: Dict[str, Any], top_n: int = 15) -> List[Dict[str, Any]]:
         """Find concepts that resonate most strongly with the signature."""
         target_coords = field_signature['coordinates']
-        matches = []
         
-        for concept in self.concepts:
-            resonance = self.resonator.calculate_resonance(target_coords, concept['coordinates'])
+        # One vectorized pass over all concepts, then top-k selection
+        top = self.kernel.search(target_coords, top_n)
+        
+        matches = []
+        for rank, index in enumerate(top['index']):
+            strength = float(top['strength'][rank])
             matches.append({
-                'concept': concept,
-                'resonance': resonance
+                'concept': self.concepts[index],
+                'resonance': {
+                    'strength': strength,
+                    'components': {
+                        'distance': float(top['distance_strength'][rank]),
+                        'harmonic': float(top['harmonic'][rank]),
+                        'alignment': float(top['alignment'][rank]),
+                        'emergent': float(top['emergent'][rank])
+                    },
+                    'matches': harmonic_match_names(top['codes'][rank], with_pairs=True),
+                    'metrics': {
+                        'euclidean_dist': float(top['distance'][rank])
+                    },
+                    'type': self.resonator._classify_resonance(strength)
+                }
             })
-            
-        # Sort by total resonance strength descending
-        matches.sort(key=lambda x: x['resonance']['strength'], reverse=True)
-        return matches[:top_n]
+        return matches
 
     def translate(self, text: str, context_hint: Optional[str] = None) -> Dict[str, Any]:
         """
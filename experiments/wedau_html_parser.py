@@ -1,64 +1,228 @@
 """
 Wedau HTML Parser
 Extract verses from Wedau Bible HTML files.
+
+Chapter files are streamed through a SAX-style VerseCollector, which reads
+the text of each verse span (span.verse, id="V#") up to the next verse span
+without building a document tree. Backends:
+- 'lxml': libxml2's C HTML parser (used automatically when lxml is installed)
+- 'html.parser': the standard library tokenizer (no dependencies)
+- 'bs4': the original BeautifulSoup tree walk (reference implementation)
+
+All backends return the same verses. parse_book / parse_all parse chapters
+in a process pool and write the standard corpus chapter JSON.
 """
 
-from bs4 import BeautifulSoup
 import re
+import json
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
 
+try:
+    from lxml import etree
+except ImportError:  # fall back to the standard library tokenizer
+    etree = None
+
+# Chapter files: MRK01.htm (chapter 00 is the book introduction)
+CHAPTER_FILE_PATTERN = re.compile(r'^([A-Z0-9]{3})(\d{2,3})\.htm$')
+
+# Footnote and cross-reference markers left in verse text
+NOTE_MARK_PATTERN = re.compile(r'[*†‡§]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Elements the HTML tokenizer never closes
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+])
+
+# USFM book codes used in eBible.org file names
+BOOK_NAMES = {
+    'GEN': 'Genesis', 'EXO': 'Exodus', 'LEV': 'Leviticus', 'NUM': 'Numbers',
+    'DEU': 'Deuteronomy', 'JOS': 'Joshua', 'JDG': 'Judges', 'RUT': 'Ruth',
+    '1SA': '1 Samuel', '2SA': '2 Samuel', '1KI': '1 Kings', '2KI': '2 Kings',
+    '1CH': '1 Chronicles', '2CH': '2 Chronicles', 'EZR': 'Ezra', 'NEH': 'Nehemiah',
+    'EST': 'Esther', 'JOB': 'Job', 'PSA': 'Psalms', 'PRO': 'Proverbs',
+    'ECC': 'Ecclesiastes', 'SNG': 'Song of Solomon', 'ISA': 'Isaiah', 'JER': 'Jeremiah',
+    'LAM': 'Lamentations', 'EZK': 'Ezekiel', 'DAN': 'Daniel', 'HOS': 'Hosea',
+    'JOL': 'Joel', 'AMO': 'Amos', 'OBA': 'Obadiah', 'JON': 'Jonah', 'MIC': 'Micah',
+    'NAM': 'Nahum', 'HAB': 'Habakkuk', 'ZEP': 'Zephaniah', 'HAG': 'Haggai',
+    'ZEC': 'Zechariah', 'MAL': 'Malachi', 'MAT': 'Matthew', 'MRK': 'Mark',
+    'LUK': 'Luke', 'JHN': 'John', 'ACT': 'Acts', 'ROM': 'Romans',
+    '1CO': '1 Corinthians', '2CO': '2 Corinthians', 'GAL': 'Galatians',
+    'EPH': 'Ephesians', 'PHP': 'Philippians', 'COL': 'Colossians',
+    '1TH': '1 Thessalonians', '2TH': '2 Thessalonians', '1TI': '1 Timothy',
+    '2TI': '2 Timothy', 'TIT': 'Titus', 'PHM': 'Philemon', 'HEB': 'Hebrews',
+    'JAS': 'James', '1PE': '1 Peter', '2PE': '2 Peter', '1JN': '1 John',
+    '2JN': '2 John', '3JN': '3 John', 'JUD': 'Jude', 'REV': 'Revelation',
+}
+
+
+def _clean_verse(pieces: list) -> str:
+    text = WHITESPACE_PATTERN.sub(' ', ' '.join(pieces)).strip()
+    return NOTE_MARK_PATTERN.sub('', text)
+
+
+class VerseCollector:
+    """
+    Streaming verse extraction (lxml parser-target interface).
+
+    A verse's text is every text node after its span, inside the span's
+    parent element, up to the next class="verse" element. Text nodes are
+    stripped, verse numbers (digit-only nodes) skipped, and the pieces
+    joined with single spaces.
+    """
+
+    def __init__(self):
+        self.verses = {}
+        self._open = []  # tag names of open elements
+        self._text = []
+        self._verse = None  # (verse number, parent depth, pieces)
+
+    def start(self, tag, attrib):
+        self._flush_text()
+        if attrib.get('class', '').split() == ['verse']:
+            self._finish_verse()
+            verse_id = attrib.get('id', '')
+            if tag == 'span' and verse_id.startswith('V') and verse_id[1:].isdigit():
+                self._verse = (int(verse_id[1:]), len(self._open), [])
+        if tag not in VOID_ELEMENTS:
+            self._open.append(tag)
+
+    def end(self, tag):
+        self._flush_text()
+        if tag not in self._open:
+            return  # void element or stray end tag
+        while self._open.pop() != tag:
+            pass  # implicitly closed children
+        if self._verse is not None and len(self._open) < self._verse[1]:
+            self._finish_verse()  # closed the verse span's parent
+
+    def data(self, text):
+        # Parsers may split one text node into several calls
+        self._text.append(text)
+
+    def close(self):
+        self._flush_text()
+        self._finish_verse()
+        return self.verses
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        text = ''.join(self._text).strip()
+        self._text = []
+        if self._verse is not None and text and not text.isdigit():
+            self._verse[2].append(text)
+
+    def _finish_verse(self):
+        if self._verse is None:
+            return
+        number, _, pieces = self._verse
+        self._verse = None
+        text = _clean_verse(pieces)
+        if text:
+            self.verses[number] = text
+
+
+class _StdlibVerseParser(HTMLParser):
+    """Feeds standard library tokenizer events to a VerseCollector."""
+
+    def __init__(self, collector: VerseCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, {k: v or '' for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
 
 class WedauHTMLParser:
     """Parse Wedau Bible HTML files."""
-    
-    def __init__(self, html_dir: str):
+
+    BACKENDS = ('lxml', 'html.parser', 'bs4')
+
+    def __init__(self, html_dir: str, backend: str = 'auto'):
         self.html_dir = Path(html_dir)
-    
+        if backend == 'auto':
+            backend = 'lxml' if etree is not None else 'html.parser'
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r} (choose from {self.BACKENDS})")
+        self.backend = backend
+
     def parse_chapter(self, book: str, chapter: int) -> dict:
         """
         Parse a chapter and extract verses.
-        
+
         Args:
             book: Book code (e.g., 'MRK' for Mark)
             chapter: Chapter number
-            
+
         Returns:
             Dictionary of verse_number: verse_text
         """
         # Construct filename
         filename = f"{book}{chapter:02d}.htm"
         filepath = self.html_dir / filename
-        
+
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
-        
+
         # Read HTML
         with open(filepath, 'r', encoding='utf-8') as f:
             html = f.read()
-        
+
+        if self.backend == 'bs4':
+            return self._parse_bs4(html)
+
+        collector = VerseCollector()
+        if self.backend == 'lxml':
+            parser = etree.HTMLParser(target=collector, encoding='utf-8')
+            return etree.fromstring(html.encode('utf-8'), parser)
+
+        parser = _StdlibVerseParser(collector)
+        parser.feed(html)
+        parser.close()
+        return collector.close()
+
+    def _parse_bs4(self, html: str) -> dict:
+        """Reference implementation: BeautifulSoup tree walk."""
+        from bs4 import BeautifulSoup
+
         # Parse with BeautifulSoup
         soup = BeautifulSoup(html, 'html.parser')
-        
+
         verses = {}
-        
+
         # Find all verse spans - they have class="verse" and id="V#"
         verse_spans = soup.find_all('span', class_='verse')
-        
+
         for verse_span in verse_spans:
             # Get verse number from id (e.g., "V1" -> 1)
             verse_id = verse_span.get('id', '')
             if not verse_id.startswith('V'):
                 continue
-            
+
             try:
                 verse_num = int(verse_id[1:])
             except ValueError:
                 continue
-            
+
             # Get verse text - it's the text content after the verse number
             # The verse number is inside the span, followed by the verse text
-            verse_text = ""
-            
+            pieces = []
+
             # Get parent div
             parent = verse_span.parent
             if parent:
@@ -68,54 +232,127 @@ class WedauHTMLParser:
                     if elem == verse_span:
                         collecting = True
                         continue
-                    
+
                     if collecting:
                         # Stop at next verse span
                         if hasattr(elem, 'get') and elem.get('class') == ['verse']:
                             break
-                        
+
                         # Collect text
                         if isinstance(elem, str):
                             text = elem.strip()
                             if text and not text.isdigit():  # Skip verse numbers
-                                verse_text += " " + text
-            
-            # Clean up
-            verse_text = re.sub(r'\s+', ' ', verse_text).strip()
-            
-            # Remove footnote markers and other special chars
-            verse_text = re.sub(r'[*†‡§]', '', verse_text)
-            
+                                pieces.append(text)
+
+            # Clean up and remove footnote markers
+            verse_text = _clean_verse(pieces)
+
             if verse_text:
                 verses[verse_num] = verse_text
-        
+
         return verses
-    
+
     def get_verse(self, book: str, chapter: int, verse: int) -> str:
         """Get a specific verse."""
         verses = self.parse_chapter(book, chapter)
         return verses.get(verse, "")
 
+    def books(self) -> list:
+        """Book codes with chapter files, in canonical order."""
+        codes = {m.group(1) for m in map(CHAPTER_FILE_PATTERN.match, self._filenames()) if m}
+        order = list(BOOK_NAMES)
+        return sorted(codes, key=lambda code: (order.index(code) if code in order else len(order), code))
+
+    def chapters(self, book: str) -> list:
+        """Chapter numbers of a book (the 00 introduction excluded)."""
+        chapters = []
+        for name in self._filenames():
+            match = CHAPTER_FILE_PATTERN.match(name)
+            if match and match.group(1) == book and int(match.group(2)) > 0:
+                chapters.append(int(match.group(2)))
+        return sorted(chapters)
+
+    def _filenames(self) -> list:
+        return [p.name for p in self.html_dir.glob('*.htm')]
+
+    def chapter_data(self, book: str, chapter: int, verses: dict) -> dict:
+        """Standard corpus chapter JSON (same layout as corpus/<book>/chapter_NN.json)."""
+        return {
+            'book': BOOK_NAMES.get(book, book),
+            'chapter': chapter,
+            'translation': 'Topura (Wedau)',
+            'language': 'Wedau',
+            'verse_count': len(verses),
+            'verses': {str(v): text for v, text in sorted(verses.items())}
+        }
+
+    def parse_book(self, book: str, output_dir: str = None, workers: int = None) -> dict:
+        """
+        Parse every chapter of a book in a worker pool.
+
+        Returns:
+            {chapter: chapter data}; also written to
+            output_dir/<book name>/chapter_NN.json when output_dir is given
+        """
+        return self.parse_all(output_dir, workers, books=[book]).get(book, {})
+
+    def parse_all(self, output_dir: str = 'corpus/wedau', workers: int = None, books: list = None) -> dict:
+        """
+        Parse every chapter of every book (one chapter per pool task).
+
+        Returns:
+            {book code: {chapter: chapter data}}
+        """
+        books = self.books() if books is None else books
+        jobs = [(str(self.html_dir), self.backend, book, chapter)
+                for book in books for chapter in self.chapters(book)]
+
+        results = {}
+        if workers == 1 or len(jobs) <= 1:
+            parsed = map(_parse_chapter_job, jobs)
+            for (_, _, book, chapter), verses in zip(jobs, parsed):
+                results.setdefault(book, {})[chapter] = self.chapter_data(book, chapter, verses)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = pool.map(_parse_chapter_job, jobs, chunksize=8)
+                for (_, _, book, chapter), verses in zip(jobs, parsed):
+                    results.setdefault(book, {})[chapter] = self.chapter_data(book, chapter, verses)
+
+        if output_dir is not None:
+            for book, chapters in results.items():
+                book_dir = Path(output_dir) / BOOK_NAMES.get(book, book).lower().replace(' ', '_')
+                book_dir.mkdir(parents=True, exist_ok=True)
+                for chapter, data in chapters.items():
+                    with open(book_dir / f'chapter_{chapter:02d}.json', 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
+        return results
+
+
+def _parse_chapter_job(job) -> dict:
+    """Process-pool entry point: (html_dir, backend, book, chapter) -> verses."""
+    html_dir, backend, book, chapter = job
+    return WedauHTMLParser(html_dir, backend).parse_chapter(book, chapter)
+
 
 def main():
     """Test the parser."""
     parser = WedauHTMLParser('experiments/wed-topura_html')
-    
+
     print("="*80)
     print("WEDAU HTML PARSER TEST")
     print("="*80)
-    
+
     # Parse Mark Chapter 1
     verses = parser.parse_chapter('MRK', 1)
-    
-    print(f"\nExtracted {len(verses)} verses from Mark Chapter 1\n")
-    
+
+    print(f"\nExtracted {len(verses)} verses from Mark Chapter 1 ({parser.backend} backend)\n")
+
     # Show first 10 verses
     for verse_num in sorted(verses.keys())[:10]:
         print(f"Mark 1:{verse_num}")
         print(f"  {verses[verse_num]}")
         print()
-    
+
     print("="*80)
 
 